@@ -8,8 +8,7 @@ from app.core.authorization import can_access_jd
 from app.db.models.user import UserModel
 from app.db.models.candidate import CandidateModel, CandidateCVModel, CandidateSelectionModel
 from app.db.models.persona import PersonaModel
-from app.db.models.job_description import JobDescriptionModel
-from app.db.models.job_role import JobRoleModel
+from app.repositories.job_description_repo import SQLAlchemyJobDescriptionRepository
 from app.schemas.candidate import (
 	CandidateCreate, 
 	CandidateUpdate,
@@ -61,6 +60,7 @@ from app.cqrs.queries.score_queries import (
 from app.cqrs.commands.score_with_ai import ScoreCandidateWithAI
 import time
 from app.cqrs.queries.persona_queries import GetPersona
+from app.utils.pagination import next_page_token
 from app.cqrs.queries.jd_queries import GetJobDescription
 from app.cqrs.queries.job_role_queries import GetJobRole
 
@@ -83,16 +83,13 @@ def _prefetch_score_context(db: Session, scores: List) -> Dict:
 		.filter(PersonaModel.id.in_(persona_ids)).all()
 	} if persona_ids else {}
 	
-	# Job descriptions (for JD title and role lookup)
+	# Job descriptions (for JD title and role lookup), title columns only;
+	# their job_role comes along in the same batch
 	jd_ids = {p.job_description_id for p in personas.values() if getattr(p, "job_description_id", None)}
-	job_descriptions = {
-		j.id: j for j in db.query(JobDescriptionModel)
-		.filter(JobDescriptionModel.id.in_(jd_ids)).all()
-	} if jd_ids else {}
+	job_descriptions = SQLAlchemyJobDescriptionRepository().get_many_titles(db, jd_ids) if jd_ids else {}
 	
 	# Roles (fallback if persona.role_name missing)
-	role_ids = {jd.role_id for jd in job_descriptions.values() if getattr(jd, "role_id", None)}
-	job_roles = {r.id: r for r in db.query(JobRoleModel).filter(JobRoleModel.id.in_(role_ids)).all()} if role_ids else {}
+	job_roles = {jd.role_id: jd.job_role for jd in job_descriptions.values() if jd.job_role is not None}
 	
 	# Selections keyed by (candidate_id, persona_id)
 	selections = {}
@@ -113,7 +110,54 @@ def _prefetch_score_context(db: Session, scores: List) -> Dict:
 	}
 
 
-def _convert_candidate_model_to_read_schema(candidate_model, db: Session) -> CandidateRead:
+def _user_display_name(first_name: Optional[str], last_name: Optional[str], email: Optional[str]) -> Optional[str]:
+	"""Full name from first/last name, falling back to whichever is set, then email."""
+	if first_name and last_name:
+		return f"{first_name} {last_name}".strip()
+	return first_name or last_name or email
+
+
+def _convert_candidate_row_to_read_schema(row, db: Session, personas_by_candidate: Optional[dict] = None) -> CandidateRead:
+	"""Convert a `list_projection` row to CandidateRead schema format.
+	
+	List routes pass `personas_by_candidate` from one get_personas_for_candidates
+	call; without it the personas are queried for this row alone.
+	"""
+	from app.services.candidate_service import CandidateService
+	from app.schemas.candidate import PersonaListItem
+	
+	created_by_name = None
+	if row["created_by_email"] is not None:
+		created_by_name = _user_display_name(row["created_by_first_name"], row["created_by_last_name"], row["created_by_email"])
+	updated_by_name = None
+	if row["updated_by_email"] is not None:
+		updated_by_name = _user_display_name(row["updated_by_first_name"], row["updated_by_last_name"], row["updated_by_email"])
+	
+	# Get personas evaluated against this candidate (prefer the per-page map)
+	if personas_by_candidate is not None:
+		personas_data = personas_by_candidate.get(row["id"], [])
+	else:
+		personas_data = CandidateService().get_personas_for_candidate(db, row["id"])
+	personas = [PersonaListItem(persona_id=p["persona_id"], persona_name=p["persona_name"]) for p in personas_data]
+	
+	return CandidateRead(
+		id=row["id"],
+		full_name=row["full_name"],
+		email=row["email"],
+		phone=row["phone"],
+		latest_cv_id=row["latest_cv_id"],
+		created_at=row["created_at"],
+		created_by=row["created_by"],
+		created_by_name=created_by_name,
+		updated_at=row["updated_at"],
+		updated_by=row["updated_by"],
+		updated_by_name=updated_by_name,
+		personas=personas,
+		cvs=None  # CVs are loaded separately when needed
+	)
+
+
+def _convert_candidate_model_to_read_schema(candidate_model, db: Session, personas_by_candidate: Optional[dict] = None) -> CandidateRead:
 	"""Convert CandidateModel to CandidateRead schema format with all required fields."""
 	from app.services.candidate_service import CandidateService
 	from app.schemas.candidate import PersonaListItem
@@ -144,9 +188,11 @@ def _convert_candidate_model_to_read_schema(candidate_model, db: Session) -> Can
 		else:
 			updated_by_name = candidate_model.updater.email
 	
-	# Get personas evaluated against this candidate
-	candidate_service = CandidateService()
-	personas_data = candidate_service.get_personas_for_candidate(db, candidate_model.id)
+	# Get personas evaluated against this candidate (prefer the per-page map)
+	if personas_by_candidate is not None:
+		personas_data = personas_by_candidate.get(candidate_model.id, [])
+	else:
+		personas_data = CandidateService().get_personas_for_candidate(db, candidate_model.id)
 	personas = [PersonaListItem(persona_id=p["persona_id"], persona_name=p["persona_name"]) for p in personas_data]
 	
 	return CandidateRead(
@@ -426,31 +472,41 @@ def _convert_candidate_score_to_read_schema(score_model, db: Session = None, ctx
 async def list_candidates(
 	page: int = Query(1, ge=1, description="Page number"),
 	size: int = Query(10, ge=1, le=100, description="Page size"),
+	page_token: Optional[str] = Query(None, description="next_page_token from the previous page; seeks instead of skipping rows"),
 	db: Session = Depends(db_session),
 	user=Depends(get_current_user)
 ):
 	"""
 	List all candidates with pagination.
+	
+	For deep pages, pass the previous response's next_page_token as page_token.
 	"""
 	skip = (page - 1) * size
 	
-	# Get candidates
-	candidates = handle_query(db, ListAllCandidates(skip, size))
+	# Get candidates as list-view rows (no ORM hydration)
+	try:
+		rows = handle_query(db, ListAllCandidates(skip, size, projection=True, page_token=page_token))
+	except ValueError as exc:
+		raise HTTPException(status_code=400, detail=str(exc))
 	
 	# Get total count
 	from app.services.candidate_service import CandidateService
 	total = CandidateService().count(db)
 	
 	# Convert to response format with all required fields
-	candidate_reads = [_convert_candidate_model_to_read_schema(candidate, db) for candidate in candidates]
+	personas_by_candidate = CandidateService().get_personas_for_candidates(db, [row["id"] for row in rows])
+	candidate_reads = [_convert_candidate_row_to_read_schema(row, db, personas_by_candidate) for row in rows]
 	
+	next_token = next_page_token(rows, size)
 	return CandidateListResponse(
 		candidates=candidate_reads,
 		total=total,
 		page=page,
 		size=size,
-		has_next=(skip + size) < total,
-		has_prev=page > 1
+		# A seeked page has no page number; its neighbours follow from the token
+		has_next=next_token is not None if page_token else (skip + size) < total,
+		has_prev=True if page_token else page > 1,
+		next_page_token=next_token
 	)
 
 
@@ -493,7 +549,9 @@ async def search_candidates(
 	total = handle_query(db, CountSearchCandidates(search_criteria))
 	
 	# Convert to response format with all required fields
-	candidate_reads = [_convert_candidate_model_to_read_schema(candidate, db) for candidate in candidates]
+	from app.services.candidate_service import CandidateService
+	personas_by_candidate = CandidateService().get_personas_for_candidates(db, [c.id for c in candidates])
+	candidate_reads = [_convert_candidate_model_to_read_schema(candidate, db, personas_by_candidate) for candidate in candidates]
 	
 	return CandidateListResponse(
 		candidates=candidate_reads,
@@ -505,11 +563,16 @@ async def search_candidates(
 	)
 
 
+# Selections returned per /selected response
+_SELECTED_CANDIDATES_LIMIT = 1000
+
+
 @router.get("/selected", response_model=SelectedCandidatesListResponse, summary="Get Selected Candidates")
 async def get_selected_candidates(
 	persona_id: Optional[str] = Query(None, description="Filter by persona ID"),
 	job_description_id: Optional[str] = Query(None, alias="jd_id", description="Filter by job description ID"),
 	status: Optional[str] = Query(None, description="Filter by status (selected, interview_scheduled, interviewed, rejected, hired)"),
+	page_token: Optional[str] = Query(None, description="next_page_token from the previous response; continues after its last selection"),
 	db: Session = Depends(db_session),
 	user: UserModel = Depends(get_current_user)
 ):
@@ -524,6 +587,9 @@ async def get_selected_candidates(
 	- persona_id: Filter by specific persona
 	- job_description_id: Filter by job description
 	- status: Filter by selection status
+	
+	Returns up to 1000 selections; when more exist, pass next_page_token back
+	as page_token for the rest.
 	"""
 	# If persona_id is provided, verify access
 	if persona_id:
@@ -537,86 +603,64 @@ async def get_selected_candidates(
 				detail="Access denied. You do not have permission to view selections for this persona."
 			)
 	
-	# Get selected candidates
-	selections, total = handle_query(db, ListSelectedCandidates(
-		persona_id=persona_id,
-		job_description_id=job_description_id,
-		status=status,
-		skip=0,
-		limit=1000  # Large limit to get all, can add pagination later if needed
-	))
-	
-	# Filter selections based on user access if not already filtered by persona_id
-	filtered_selections = []
-	for selection in selections:
-		# Check if user has access to this persona's job description
-		if persona_id:
-			# Already verified access above
-			filtered_selections.append(selection)
-		else:
-			persona = handle_query(db, GetPersona(selection.persona_id))
-			if persona and can_access_jd(db, user, persona.job_description_id):
-				filtered_selections.append(selection)
+	# Get selected candidates as list-view rows (no ORM hydration)
+	try:
+		rows, total = handle_query(db, ListSelectedCandidates(
+			persona_id=persona_id,
+			job_description_id=job_description_id,
+			status=status,
+			skip=0,
+			limit=_SELECTED_CANDIDATES_LIMIT,
+			projection=True,
+			page_token=page_token
+		))
+	except ValueError as exc:
+		raise HTTPException(status_code=400, detail=str(exc))
 	
-	# Convert to response format
+	# Filter selections based on user access if not already filtered by persona_id.
+	# Rows carry the persona's JD, so the check needs no persona lookup and is
+	# answered once per JD.
+	jd_access: Dict[str, bool] = {}
 	selection_items = []
-	for selection in filtered_selections:
-		try:
-			# Get candidate info
-			if not hasattr(selection, 'candidate') or selection.candidate is None:
-				# Try to get candidate_id from selection
-				candidate_id = getattr(selection, 'candidate_id', None)
-				if candidate_id:
-					candidate = handle_query(db, GetCandidate(candidate_id))
-					if not candidate:
-						continue
-				else:
-					continue
-			else:
-				candidate = selection.candidate
-			
-			candidate_info = CandidateInfo(
-				id=candidate.id,
-				full_name=candidate.full_name,
-				email=candidate.email,
-				phone=candidate.phone
-			)
-			
-			# Get persona name
-			persona_name = selection.persona.name if selection.persona else None
-			
-			# Get selector (created_by) name from relationship
-			selected_by_name = None
-			if selection.selector:
-				if selection.selector.first_name and selection.selector.last_name:
-					selected_by_name = f"{selection.selector.first_name} {selection.selector.last_name}".strip()
-				elif selection.selector.first_name:
-					selected_by_name = selection.selector.first_name
-				elif selection.selector.last_name:
-					selected_by_name = selection.selector.last_name
-				else:
-					selected_by_name = selection.selector.email
-			
-			selection_items.append(CandidateSelectionItem(
-				id=selection.id,
-				candidate=candidate_info,
-				persona_id=selection.persona_id,
-				persona_name=persona_name,
-				job_description_id=selection.job_description_id,
-				status=selection.status,
-				priority=selection.priority,
-				selection_notes=selection.selection_notes,
-				selected_by=selection.selected_by,
-				selected_by_name=selected_by_name,
-				created_at=selection.created_at
-			))
-		except Exception as e:
-			# Continue processing other selections instead of failing completely
-			continue
+	for row in rows:
+		if not persona_id:
+			persona_jd_id = row["persona_job_description_id"]
+			if persona_jd_id is None:
+				# Persona no longer exists
+				continue
+			if persona_jd_id not in jd_access:
+				jd_access[persona_jd_id] = can_access_jd(db, user, persona_jd_id)
+			if not jd_access[persona_jd_id]:
+				continue
+		
+		selected_by_name = None
+		if row["selected_by_email"] is not None:
+			selected_by_name = _user_display_name(row["selected_by_first_name"], row["selected_by_last_name"], row["selected_by_email"])
+		
+		selection_items.append(CandidateSelectionItem(
+			id=row["id"],
+			candidate=CandidateInfo(
+				id=row["candidate_id"],
+				full_name=row["candidate_full_name"],
+				email=row["candidate_email"],
+				phone=row["candidate_phone"]
+			),
+			persona_id=row["persona_id"],
+			persona_name=row["persona_name"],
+			job_description_id=row["job_description_id"],
+			status=row["status"],
+			priority=row["priority"],
+			selection_notes=row["selection_notes"],
+			selected_by=row["selected_by"],
+			selected_by_name=selected_by_name,
+			created_at=row["created_at"]
+		))
 	
 	return SelectedCandidatesListResponse(
 		selections=selection_items,
-		total=len(selection_items)
+		total=len(selection_items),
+		# Taken from the unfiltered rows, so access filtering cannot end paging early
+		next_page_token=next_page_token(rows, _SELECTED_CANDIDATES_LIMIT)
 	)
 
 
@@ -723,8 +767,8 @@ async def get_candidate(
 	if not candidate:
 		raise HTTPException(status_code=404, detail="Candidate not found")
 	
-	# Load CVs for this candidate
-	cvs = handle_query(db, GetCandidateCVs(candidate_id))
+	# CVs are eager-loaded with the candidate (newest version first)
+	cvs = candidate.cvs
 	
 	# Get base URL for replacing localhost in s3_url
 	base_url = _get_base_url_from_request(request)
@@ -1713,6 +1757,7 @@ async def get_selection_audit_logs(
 	selection_id: str,
 	page: int = Query(1, ge=1, description="Page number"),
 	size: int = Query(10, ge=1, le=100, description="Page size"),
+	page_token: Optional[str] = Query(None, description="next_page_token from the previous page; seeks instead of skipping rows"),
 	db: Session = Depends(db_session),
 	user: UserModel = Depends(get_current_user)
 ):
@@ -1748,7 +1793,10 @@ async def get_selection_audit_logs(
 	skip = (page - 1) * size
 	
 	# Get audit logs
-	audit_logs, total = CandidateService().get_selection_audit_logs(db, selection_id, skip, size)
+	try:
+		audit_logs, total = CandidateService().get_selection_audit_logs(db, selection_id, skip, size, page_token=page_token)
+	except ValueError as exc:
+		raise HTTPException(status_code=400, detail=str(exc))
 	
 	# Convert to response format
 	log_reads = []
@@ -1778,13 +1826,16 @@ async def get_selection_audit_logs(
 			created_at=log.created_at
 		))
 	
+	next_token = next_page_token(audit_logs, size)
 	return CandidateSelectionAuditLogListResponse(
 		logs=log_reads,
 		total=total,
 		page=page,
 		size=size,
-		has_next=(skip + size) < total,
-		has_prev=page > 1
+		# A seeked page has no page number; its neighbours follow from the token
+		has_next=next_token is not None if page_token else (skip + size) < total,
+		has_prev=True if page_token else page > 1,
+		next_page_token=next_token
 	)
 
 
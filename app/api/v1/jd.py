@@ -1,3 +1,4 @@
+from typing import Optional
 from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form, Query
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
@@ -22,6 +23,7 @@ from app.cqrs.queries.jd_queries import (
 	ListJobDescriptionsByRoleId,
 )
 from app.utils.error_handlers import handle_service_errors, rollback_on_error
+from app.utils.pagination import next_page_token
 
 router = APIRouter()
 
@@ -127,6 +129,7 @@ def _convert_jd_model_to_list_item(jd_model) -> JDListItem:
 async def list_all_jds(
 	page: int = Query(1, ge=1, description="Page number"),
 	size: int = Query(10, ge=1, le=100, description="Page size"),
+	page_token: Optional[str] = Query(None, description="next_page_token from the previous page; seeks instead of skipping rows"),
 	db: Session = Depends(get_db),
 	user=Depends(get_current_user)
 ):
@@ -138,28 +141,28 @@ async def list_all_jds(
 	- Hiring Manager: Can only see JDs they created or are assigned to
 	
 	Uses optimized SQL filtering directly in database instead of fetching all accessible IDs first.
+	For deep pages, pass the previous response's next_page_token as page_token.
 	"""
 	try:
 		skip = (page - 1) * size
 		
-		# Use service with access filtering (pass user directly for optimized SQL filtering)
-		jd_service = JDService()
-		models = jd_service.list_all_optimized(db, skip, size, user)
-		
-		# Get total count with access filtering
-		total = jd_service.count(db, user)
+		# Page and access-filtered total from one query (pass user directly for optimized SQL filtering)
+		models, total = JDService().list_with_total(db, skip, size, user, page_token=page_token)
 		
 		# Convert models to list items
 		jd_reads = [_convert_jd_model_to_list_item(m) for m in models]
 		
 		# Build response
+		next_token = next_page_token(models, size)
 		response = JDListResponse(
 			jds=jd_reads,
 			total=total,
 			page=page,
 			size=size,
-			has_next=(skip + size) < total,
-			has_prev=page > 1
+			# A seeked page has no page number; its neighbours follow from the token
+			has_next=next_token is not None if page_token else (skip + size) < total,
+			has_prev=True if page_token else page > 1,
+			next_page_token=next_token
 		)
 		
 		return response
@@ -174,6 +177,7 @@ async def list_jds_by_role_id(
 	role_id: str,
 	page: int = Query(1, ge=1, description="Page number"),
 	size: int = Query(10, ge=1, le=100, description="Page size"),
+	page_token: Optional[str] = Query(None, description="next_page_token from the previous page; seeks instead of skipping rows"),
 	db: Session = Depends(get_db),
 	user=Depends(get_current_user)
 ):
@@ -187,12 +191,13 @@ async def list_jds_by_role_id(
 		role_id: The job role ID to filter by
 		page: Page number (default: 1)
 		size: Page size (default: 10, max: 100)
+		page_token: next_page_token from the previous page (keyset pagination)
 	"""
 	try:
 		skip = (page - 1) * size
 		
 		# Query job descriptions by role_id
-		models = handle_query(db, ListJobDescriptionsByRoleId(role_id, skip, size, optimized=True))
+		models = handle_query(db, ListJobDescriptionsByRoleId(role_id, skip, size, page_token=page_token))
 		
 		# Count total job descriptions for this role_id
 		# We need to count separately since we're filtering by role_id
@@ -206,13 +211,16 @@ async def list_jds_by_role_id(
 		jd_reads = [_convert_jd_model_to_list_item(m) for m in models]
 		
 		# Build response
+		next_token = next_page_token(models, size)
 		response = JDListResponse(
 			jds=jd_reads,
 			total=total,
 			page=page,
 			size=size,
-			has_next=(skip + size) < total,
-			has_prev=page > 1
+			# A seeked page has no page number; its neighbours follow from the token
+			has_next=next_token is not None if page_token else (skip + size) < total,
+			has_prev=True if page_token else page > 1,
+			next_page_token=next_token
 		)
 		
 		return response
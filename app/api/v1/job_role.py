@@ -25,7 +25,6 @@ from app.cqrs.queries.job_role_queries import (
     SearchJobRoles,
     CountJobRoles,
     CountActiveJobRoles,
-    CountSearchJobRoles,
     GetJobRoleCategories
 )
 from app.domain.job_role.rules import JobRoleBusinessRules
@@ -183,9 +182,8 @@ async def search_job_roles(
         is_active=search_request.is_active
     )
     
-    # Get job roles and total count
-    job_roles = handle_query(db, SearchJobRoles(search_criteria, skip, search_request.size))
-    total = handle_query(db, CountSearchJobRoles(search_criteria))
+    # Get job roles and total count in one query
+    job_roles, total = handle_query(db, SearchJobRoles(search_criteria, skip, search_request.size, with_total=True))
     
     # Convert to response format
     job_role_reads = [JobRoleRead.model_validate(job_role) for job_role in job_roles]
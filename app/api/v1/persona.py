@@ -1,6 +1,7 @@
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
 from datetime import datetime
+from typing import Optional
 from app.api.deps import db_session, get_current_user
 from app.api.deps_authorization import require_jd_access
 from app.core.authorization import can_access_jd
@@ -12,6 +13,7 @@ from app.db.models.persona import PersonaModel
 from app.cqrs.commands.persona_commands import CreatePersona, UpdatePersona, DeletePersona
 from app.cqrs.queries.persona_queries import ListPersonasByJobDescription, ListAllPersonas, CountPersonas, GetPersona, GetPersonaChangeLogs, ListPersonasByJobRole
 from fastapi import Query
+from app.utils.pagination import next_page_token
 
 from app.cqrs.commands.generate_persona_from_jd import GeneratePersonaFromJD
 from app.schemas.persona_warning import (
@@ -63,11 +65,12 @@ def _convert_persona_model_to_read(model: PersonaModel, db: Session, candidate_c
 		else:
 			updated_by_name = model.updater.email
 	
-	# Count candidates evaluated against this persona (prefer precomputed map)
-	candidate_count = None
+	# Count candidates evaluated against this persona. List routes pass the
+	# map from one count_candidates_for_personas call; only single-persona
+	# routes (candidate_counts=None) query here
 	if candidate_counts is not None:
-		candidate_count = candidate_counts.get(model.id)
-	if candidate_count is None:
+		candidate_count = candidate_counts.get(model.id, 0)
+	else:
 		persona_service = PersonaService()
 		candidate_count = persona_service.count_candidates_for_persona(db, model.id)
 	
@@ -141,6 +144,7 @@ async def generate_persona_from_jd(
 async def get_all_personas(
 	page: int = Query(1, ge=1, description="Page number"),
 	size: int = Query(10, ge=1, le=100, description="Page size"),
+	page_token: Optional[str] = Query(None, description="next_page_token from the previous page; seeks instead of skipping rows"),
 	db: Session = Depends(db_session),
 	user: UserModel = Depends(get_current_user)
 ):
@@ -152,25 +156,32 @@ async def get_all_personas(
 	- Hiring Manager: Can only see personas for JDs they created or are assigned to
 	
 	Uses optimized SQL filtering directly in database instead of fetching all accessible IDs first.
+	For deep pages, pass the previous response's next_page_token as page_token.
 	"""
 	skip = (page - 1) * size
 	
 	# Use service with access filtering (pass user directly for optimized SQL filtering)
 	persona_service = PersonaService()
-	models = persona_service.list_all(db, skip, size, user)
+	try:
+		models = persona_service.list_all(db, skip, size, user, page_token=page_token)
+	except ValueError as exc:
+		raise HTTPException(status_code=400, detail=str(exc))
 	total = persona_service.count(db, user)
 	candidate_counts = persona_service.count_candidates_for_personas(db, [m.id for m in models])
 	
 	# Convert to response format with all required fields
 	persona_reads = [_convert_persona_model_to_read(m, db, candidate_counts) for m in models]
 	
+	next_token = next_page_token(models, size)
 	return PersonaListResponse(
 		personas=persona_reads,
 		total=total,
 		page=page,
 		size=size,
-		has_next=(skip + size) < total,
-		has_prev=page > 1
+		# A seeked page has no page number; its neighbours follow from the token
+		has_next=next_token is not None if page_token else (skip + size) < total,
+		has_prev=True if page_token else page > 1,
+		next_page_token=next_token
 	)
 
 
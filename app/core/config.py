@@ -11,9 +11,39 @@ class Settings(BaseSettings):
 	app_name: str = "Recruiter AI Backend"
 	environment: str = "development"
 	api_prefix: str = "/api/v1"
+	# API router modules (by app.api.v1 module name) to leave unmounted
+	DISABLED_ROUTERS: list = []
 
 	# Database
 	database_url: str = "sqlite:///./app.db"
+	# Connection pool (ignored for SQLite). db_max_connections is the budget for
+	# the whole server: every worker's engine gets an equal share of it, which
+	# keeps the total under PostgreSQL's default max_connections (100).
+	# Nonzero db_pool_size/db_max_overflow pin the per-worker sizes instead; the
+	# server then opens up to workers x (db_pool_size + db_max_overflow).
+	db_max_connections: int = 80
+	db_pool_size: int = 0
+	db_max_overflow: int = 0
+	db_pool_timeout: int = 10
+	db_pool_recycle: int = 1800
+	db_pool_pre_ping: bool = True
+	db_echo_pool: bool = False
+	# TTL for cached list totals (app/core/count_cache.py); 0 disables caching
+	count_cache_ttl_seconds: int = 30
+	# TTL for the in-process selection-status lookup cache; 0 disables it
+	status_cache_ttl_seconds: int = 60
+	# TTL for the in-process persona-level list cache; 0 disables it
+	persona_level_cache_ttl_seconds: int = 300
+
+	# Server (see app/server.py); 0 workers means 2 x CPUs + 1
+	server_host: str = "0.0.0.0"
+	server_port: int = 8000
+	server_workers: int = 0
+	server_limit_concurrency: int = 1000
+	server_backlog: int = 2048
+	server_timeout_keep_alive: int = 5
+	# Threads for sync endpoints/dependencies per worker; 0 keeps anyio's default (40)
+	threadpool_max_threads: int = 0
 
 	# Security
 	jwt_secret_key: str = "change-me"
@@ -66,6 +96,8 @@ class Settings(BaseSettings):
 	# Local Storage Configuration
 	LOCAL_STORAGE_PATH: str = "./uploads/cvs"
 	LOCAL_STORAGE_URL_PREFIX: str = "http://localhost:8000/uploads/cvs"
+	# Serve /uploads from this process; disable when a reverse proxy serves it
+	SERVE_UPLOADS_INPROC: bool = True
 	
 	# S3 Configuration for CV storage
 	S3_BUCKET_NAME: str = ""
@@ -122,6 +154,37 @@ class Settings(BaseSettings):
 	LANGSMITH_ENDPOINT: str = ""
 	LANGSMITH_API_KEY: str =""
 	LANGSMITH_PROJECT: str = ""
+
+	def server_worker_count(self) -> int:
+		"""Uvicorn worker processes; 0 in server_workers means 2 x CPUs + 1."""
+		return self.server_workers or (2 * (os.cpu_count() or 1)) + 1
+
+	def db_pool_options(self) -> dict:
+		"""Per-worker pool_size/max_overflow within the db_max_connections budget."""
+		if self.db_pool_size:
+			return {"pool_size": self.db_pool_size, "max_overflow": self.db_max_overflow}
+		# One engine per worker process (app/db/session.py)
+		share = max(2, self.db_max_connections // self.server_worker_count())
+		pool_size = max(1, share // 2)
+		return {"pool_size": pool_size, "max_overflow": share - pool_size}
+
+	def cors_middleware_options(self) -> dict:
+		"""Normalized CORSMiddleware kwargs: stripped, de-duplicated tuples.
+
+		A wildcard collapses its list to ("*",) so Starlette takes its
+		allow-all branch instead of scanning entries on each request.
+		"""
+		def _normalize(values) -> tuple:
+			items = tuple(dict.fromkeys(v.strip() for v in values if v and v.strip()))
+			return ("*",) if "*" in items else items
+
+		return {
+			"allow_origins": _normalize(self.CORS_ORIGINS),
+			"allow_credentials": self.CORS_ALLOW_CREDENTIALS,
+			"allow_methods": _normalize(self.CORS_ALLOW_METHODS),
+			"allow_headers": _normalize(self.CORS_ALLOW_HEADERS),
+		}
+
 	class Config:
 		env_file = ".env"
 		env_file_encoding = "utf-8"
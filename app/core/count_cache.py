@@ -0,0 +1,87 @@
+"""
+Short-TTL cache for list-endpoint totals.
+
+COUNT(*) over a filtered table is usually the most expensive part of a
+paginated list endpoint, yet the value barely changes between page views.
+Repositories route their count queries through `count_cache` and call
+`invalidate(table)` after writes; writes that defer to the caller's unit
+of work use `invalidate_on_commit(db, table)` instead. The cache is per
+process, so other workers can see a stale total for at most
+`count_cache_ttl_seconds`.
+"""
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, Mapping, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+
+
+class CountCache:
+	"""Per-table cache of count results with a shared TTL."""
+
+	def __init__(self, ttl_seconds: float):
+		self.ttl_seconds = ttl_seconds
+		self._entries: Dict[str, Dict[Hashable, Tuple[float, int]]] = {}
+		self._versions: Dict[str, int] = {}
+		self._lock = threading.Lock()
+
+	def get_or_compute(self, table: str, key: Hashable, compute: Callable[[], int]) -> int:
+		"""Return the cached count for (table, key), computing it on a miss."""
+		if self.ttl_seconds <= 0:
+			return compute()
+
+		now = time.monotonic()
+		with self._lock:
+			entry = self._entries.get(table, {}).get(key)
+			version = self._versions.get(table, 0)
+		if entry is not None and entry[0] > now:
+			return entry[1]
+
+		value = compute()
+		with self._lock:
+			# A write that landed while counting makes this value suspect
+			if self._versions.get(table, 0) == version:
+				self._entries.setdefault(table, {})[key] = (now + self.ttl_seconds, value)
+		return value
+
+	def invalidate(self, table: str) -> None:
+		"""Drop every cached count for a table after it was written to."""
+		with self._lock:
+			self._versions[table] = self._versions.get(table, 0) + 1
+			self._entries.pop(table, None)
+
+
+def criteria_key(criteria: Mapping[str, Any]) -> Tuple:
+	"""Order-independent, hashable key for a search-criteria dict."""
+	return tuple(sorted((k, repr(v)) for k, v in criteria.items()))
+
+
+count_cache = CountCache(settings.count_cache_ttl_seconds)
+
+
+# Session.info key holding the tables to invalidate when the session commits
+_PENDING_KEY = "count_cache_pending"
+
+
+def invalidate_on_commit(db: Session, table: str) -> None:
+	"""
+	Invalidate `table` once `db`'s transaction commits.
+	
+	Invalidating right after a flush would let a concurrent count re-cache
+	the pre-commit total under the new version; a rollback drops the request.
+	"""
+	db.info.setdefault(_PENDING_KEY, set()).add(table)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_pending(session: Session) -> None:
+	for table in session.info.pop(_PENDING_KEY, ()):
+		count_cache.invalidate(table)
+
+
+@event.listens_for(Session, "after_rollback")
+def _drop_pending(session: Session) -> None:
+	session.info.pop(_PENDING_KEY, None)
@@ -0,0 +1,45 @@
+"""
+In-process snapshots of small, rarely written lookup tables.
+
+A `SnapshotCache` loads every row of its model once per TTL window and
+keeps them as plain column dicts. Readers build fresh transient models
+from those dicts, so no ORM instance is ever shared across sessions.
+Repositories call `invalidate()` after committing a write; other workers
+can serve the old snapshot for at most the TTL.
+"""
+import threading
+import time
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+from sqlalchemy.orm import Session
+
+
+class SnapshotCache:
+	"""Process-wide (expires_at, rows) snapshot of one model's table."""
+
+	def __init__(self, model: Any, order_by: Sequence[Any], ttl_seconds: float):
+		self.model = model
+		self.order_by = tuple(order_by)
+		self.ttl_seconds = ttl_seconds
+		self._snapshot: Optional[Tuple[float, Tuple[Dict, ...]]] = None
+		self._lock = threading.RLock()
+
+	def rows(self, db: Session) -> Tuple[Dict, ...]:
+		"""All rows as column dicts, loaded with one SELECT per TTL window."""
+		now = time.monotonic()
+		with self._lock:
+			if self.ttl_seconds > 0 and self._snapshot is not None and self._snapshot[0] > now:
+				return self._snapshot[1]
+			columns = [c.key for c in self.model.__table__.columns]
+			rows = tuple(
+				{key: getattr(obj, key) for key in columns}
+				for obj in db.query(self.model).order_by(*self.order_by).all()
+			)
+			if self.ttl_seconds > 0:
+				self._snapshot = (now + self.ttl_seconds, rows)
+			return rows
+
+	def invalidate(self) -> None:
+		"""Drop the snapshot so the next read reloads the table."""
+		with self._lock:
+			self._snapshot = None
@@ -565,19 +565,13 @@ def handle_query(db: Session, query: Query) -> Any:
 	if isinstance(query, ListJobDescriptions):
 		return JDService().list_by_creator(db, query.user_id)
 	if isinstance(query, ListAllJobDescriptions):
-		if query.optimized:
-			return JDService().list_all_optimized(db, query.skip, query.limit)
-		else:
-			return JDService().list_all(db, query.skip, query.limit)
+		return JDService().list_all(db, query.skip, query.limit, page_token=query.page_token)
 	if isinstance(query, CountJobDescriptions):
 		return JDService().count(db)
 	if isinstance(query, GetJobDescription):
 		return JDService().get_by_id(db, query.jd_id)
 	if isinstance(query, ListJobDescriptionsByRoleId):
-		if query.optimized:
-			return JDService().list_by_role_id(db, query.role_id, query.skip, query.limit, optimized=True)
-		else:
-			return JDService().list_by_role_id(db, query.role_id, query.skip, query.limit, optimized=False)
+		return JDService().list_by_role_id(db, query.role_id, query.skip, query.limit, page_token=query.page_token)
 	if isinstance(query, PrepareJDRefinementBrief):
 		return JDService().prepare_refinement_brief(db, query.jd_id, query.required_sections, query.template_text)
 	if isinstance(query, Recommendations):
@@ -605,6 +599,8 @@ def handle_query(db: Session, query: Query) -> Any:
 	if isinstance(query, GetJobRolesByCategory):
 		return JobRoleService().get_by_category(db, query.category, query.skip, query.limit)
 	if isinstance(query, SearchJobRoles):
+		if query.with_total:
+			return JobRoleService().search_with_total(db, query.search_criteria, query.skip, query.limit)
 		return JobRoleService().search(db, query.search_criteria, query.skip, query.limit)
 	if isinstance(query, CountJobRoles):
 		return JobRoleService().count(db)
@@ -653,7 +649,9 @@ def handle_query(db: Session, query: Query) -> Any:
 	if isinstance(query, GetCandidate):
 		return CandidateService().get_by_id(db, query.candidate_id)
 	if isinstance(query, ListAllCandidates):
-		return CandidateService().get_all(db, query.skip, query.limit)
+		if query.projection:
+			return CandidateService().get_all_projection(db, query.skip, query.limit, page_token=query.page_token)
+		return CandidateService().get_all(db, query.skip, query.limit, page_token=query.page_token)
 	if isinstance(query, SearchCandidates):
 		return CandidateService().search(db, query.search_criteria, query.skip, query.limit)
 	if isinstance(query, CountSearchCandidates):
@@ -663,13 +661,24 @@ def handle_query(db: Session, query: Query) -> Any:
 	if isinstance(query, GetCandidateCVs):
 		return CandidateService().get_candidate_cvs(db, query.candidate_id)
 	if isinstance(query, ListSelectedCandidates):
+		if query.projection:
+			return CandidateService().list_selected_candidate_projection(
+				db,
+				query.persona_id,
+				query.job_description_id,
+				query.status,
+				query.skip,
+				query.limit,
+				page_token=query.page_token
+			)
 		return CandidateService().list_selected_candidates(
 			db,
 			query.persona_id,
 			query.job_description_id,
 			query.status,
 			query.skip,
-			query.limit
+			query.limit,
+			page_token=query.page_token
 		)
 	if isinstance(query, GetCandidateSelection):
 		return CandidateService().get_selection(db, query.selection_id)
@@ -14,9 +14,11 @@ class GetCandidate(Query):
 class ListAllCandidates(Query):
     """Query to list all candidates."""
     
-    def __init__(self, skip: int = 0, limit: int = 100):
+    def __init__(self, skip: int = 0, limit: int = 100, projection: bool = False, page_token: Optional[str] = None):
         self.skip = skip
         self.limit = limit
+        self.projection = projection  # Return list-view rows instead of ORM models
+        self.page_token = page_token  # Keyset token from next_page_token(); replaces skip
 
 
 class SearchCandidates(Query):
@@ -58,13 +60,17 @@ class ListSelectedCandidates(Query):
         job_description_id: Optional[str] = None,
         status: Optional[str] = None,
         skip: int = 0,
-        limit: int = 100
+        limit: int = 100,
+        projection: bool = False,
+        page_token: Optional[str] = None
     ):
         self.persona_id = persona_id
         self.job_description_id = job_description_id
         self.status = status
         self.skip = skip
         self.limit = limit
+        self.projection = projection  # Return list-view rows instead of ORM models
+        self.page_token = page_token  # Keyset token from next_page_token(); replaces skip
 
 
 class GetCandidateSelection(Query):
@@ -13,10 +13,10 @@ class ListJobDescriptions(Query):
 class ListAllJobDescriptions(Query):
 	"""Query to list all job descriptions (no user filter) with pagination."""
 	
-	def __init__(self, skip: int = 0, limit: int = 100, optimized: bool = True):
+	def __init__(self, skip: int = 0, limit: int = 100, page_token: str | None = None):
 		self.skip = skip
 		self.limit = limit
-		self.optimized = optimized  # Use optimized query that excludes text fields
+		self.page_token = page_token  # Keyset token; replaces skip when set
 
 
 class GetJobDescription(Query):
@@ -62,8 +62,9 @@ class CountJobDescriptions(Query):
 class ListJobDescriptionsByRoleId(Query):
 	"""Query to list job descriptions filtered by role_id."""
 	
-	def __init__(self, role_id: str, skip: int = 0, limit: int = 100, optimized: bool = True):
+	def __init__(self, role_id: str, skip: int = 0, limit: int = 100, optimized: bool = True, page_token: str | None = None):
 		self.role_id = role_id
 		self.skip = skip
 		self.limit = limit
+		self.page_token = page_token  # Keyset token; replaces skip when set
 		self.optimized = optimized  # Use optimized query that excludes text fields
\ No newline at end of file
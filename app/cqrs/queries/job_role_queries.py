@@ -40,10 +40,11 @@ class GetJobRolesByCategory(Query):
 @dataclass
 class SearchJobRoles(Query):
     """Query to search job roles based on criteria."""
-    def __init__(self, search_criteria: Dict[str, Any], skip: int = 0, limit: int = 100):
+    def __init__(self, search_criteria: Dict[str, Any], skip: int = 0, limit: int = 100, with_total: bool = False):
         self.search_criteria = search_criteria
         self.skip = skip
         self.limit = limit
+        self.with_total = with_total  # Return (job_roles, total) from one windowed query
 
 @dataclass
 class CountJobRoles(Query):
@@ -1,6 +1,13 @@
 from sqlalchemy.orm import declarative_base
 
-Base = declarative_base()
+
+class _ModelBase:
+	# Fetch server-generated columns (created_at/updated_at defaults) in the
+	# INSERT/UPDATE itself via RETURNING instead of a follow-up SELECT.
+	__mapper_args__ = {"eager_defaults": True}
+
+
+Base = declarative_base(cls=_ModelBase)
 
 # Import *modules*, not classes
 import app.db.models.user  # noqa
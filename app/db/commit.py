@@ -0,0 +1,29 @@
+from sqlalchemy import inspect
+from sqlalchemy.orm import Session
+
+
+def commit_keep_loaded(db: Session, *instances) -> None:
+	"""Commit and keep the instances' column values loaded, in place of commit() + refresh().
+
+	Models use eager_defaults, so the INSERT/UPDATE has already returned the
+	server-generated columns; the refresh SELECT would only re-read them.
+	Everything else is expired as a normal commit would: other instances in
+	the session, and the given instances' relationships (a changed foreign
+	key must not leave a stale related object behind).
+	"""
+	expire_on_commit = db.expire_on_commit
+	db.expire_on_commit = False
+	try:
+		db.commit()
+	finally:
+		db.expire_on_commit = expire_on_commit
+	if not expire_on_commit:
+		return
+	kept = {id(instance) for instance in instances}
+	for obj in list(db.identity_map.values()):
+		if id(obj) not in kept:
+			db.expire(obj)
+	for instance in instances:
+		relationships = inspect(instance).mapper.relationships.keys()
+		if relationships:
+			db.expire(instance, relationships)
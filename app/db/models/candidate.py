@@ -20,7 +20,7 @@ class CandidateModel(Base):
 	updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
 	updated_by = Column(String, ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
 
-	cvs = relationship("CandidateCVModel", back_populates="candidate", cascade="all, delete-orphan", foreign_keys="[CandidateCVModel.candidate_id]")
+	cvs = relationship("CandidateCVModel", back_populates="candidate", cascade="all, delete-orphan", foreign_keys="[CandidateCVModel.candidate_id]", order_by="CandidateCVModel.version.desc()")
 	latest_cv = relationship("CandidateCVModel", foreign_keys="[CandidateModel.latest_cv_id]", post_update=True)
 	creator = relationship("UserModel", foreign_keys=[created_by])
 	updater = relationship("UserModel", foreign_keys=[updated_by])
@@ -49,6 +49,13 @@ class CandidateCVModel(Base):
 	candidate = relationship("CandidateModel", back_populates="cvs", foreign_keys="[CandidateCVModel.candidate_id]")
 	uploader = relationship("UserModel", foreign_keys=[uploaded_by])
 
+	# Table constraints
+	__table_args__ = (
+		UniqueConstraint("candidate_id", "version", name="uq_candidate_cv_version"),
+		# Newest-first CV listing per candidate is an index range scan, no sort
+		Index("idx_candidate_cvs_candidate_version", "candidate_id", version.desc()),
+	)
+
 
 class CandidateSelectionModel(Base):
 	__tablename__ = "candidate_selections"
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Integer, DateTime, ForeignKey, Text
+from sqlalchemy import Column, String, Integer, Boolean, DateTime, ForeignKey, Text, Index, text
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.db.base import Base
@@ -13,7 +13,7 @@ class CandidateSelectionStatusModel(Base):
 	name = Column(String, nullable=False)  # Display name e.g., 'Selected', 'Interview Scheduled'
 	description = Column(Text, nullable=True)  # Optional description
 	display_order = Column(Integer, nullable=False, default=0)  # Order for dropdown display
-	is_active = Column(String, nullable=False, default="true")  # Store as string for SQLite compatibility
+	is_active = Column(Boolean, nullable=False, default=True)
 	
 	# Audit fields
 	created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
@@ -25,3 +25,13 @@ class CandidateSelectionStatusModel(Base):
 	creator = relationship("UserModel", foreign_keys=[created_by])
 	updater = relationship("UserModel", foreign_keys=[updated_by])
 
+	# Active statuses in dropdown order come straight from this small partial
+	# index; the predicates match how each dialect renders `is_active == True`
+	__table_args__ = (
+		Index(
+			"ix_candidate_selection_statuses_active_order",
+			"display_order",
+			postgresql_where=text("is_active = true"),
+			sqlite_where=text("is_active = 1"),
+		),
+	)
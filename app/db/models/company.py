@@ -1,5 +1,5 @@
 # app/db/models/company.py
-from sqlalchemy import Column, String, Text, DateTime, func, ForeignKey
+from sqlalchemy import Column, String, Text, DateTime, func, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from app.db.base import Base
 
@@ -44,3 +44,13 @@ class CompanyModel(Base):
         back_populates="company",
         cascade="all, delete-orphan"
     )
+    
+    # CompanyRepository compares lower(col) for case-insensitive lookups;
+    # expression indexes let those equality checks seek instead of scan.
+    # Trigram (pg_trgm) indexes for the substring searches are Postgres-only
+    # and live in migration 4ea3636398f4.
+    __table_args__ = (
+        Index("ix_companies_lower_name", func.lower(name)),
+        Index("ix_companies_lower_email_address", func.lower(email_address)),
+        Index("ix_companies_lower_website_url", func.lower(website_url)),
+    )
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, ForeignKey, DateTime, func, UniqueConstraint
+from sqlalchemy import Column, String, ForeignKey, DateTime, func, UniqueConstraint, Index
 from sqlalchemy.orm import relationship
 from app.db.base import Base
 
@@ -19,6 +19,8 @@ class JDHiringManagerMappingModel(Base):
     # Unique constraint to prevent duplicate mappings
     __table_args__ = (
         UniqueConstraint('job_description_id', 'hiring_manager_id', name='uq_jd_hiring_manager'),
+        # A hiring manager's assigned JD ids straight from the index (access filters)
+        Index('idx_jd_hm_manager_jd', 'hiring_manager_id', 'job_description_id'),
     )
     
     # Relationships
@@ -17,7 +17,11 @@ class JobDescriptionModel(Base):
     __table_args__ = (
         Index("idx_jd_role_id", "role_id"),
         Index("idx_jd_created_by", "created_by"),
-        Index("idx_jd_created_at", "created_at"),
+        # (created_at, id) serves the keyset-paginated list queries, scanned backwards for DESC
+        Index("idx_jd_created_at_id", "created_at", "id"),
+        # list_by_role_id: role range, already in page order (no sort node)
+        Index("idx_jd_role_created_at_id", "role_id", "created_at", "id"),
+        Index("idx_jd_company_id", "company_id"),
     )
 
     id = Column(String, primary_key=True)
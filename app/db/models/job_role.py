@@ -1,5 +1,5 @@
 # app/db/models/job_role.py
-from sqlalchemy import Column, String, Text, DateTime, func, ForeignKey
+from sqlalchemy import Column, String, Text, Boolean, DateTime, func, ForeignKey, Index, text
 from sqlalchemy.orm import relationship
 from app.db.base import Base
 
@@ -10,7 +10,7 @@ class JobRoleModel(Base):
     name = Column(String, nullable=False, unique=True, index=True)
     description = Column(Text, nullable=True)
     category = Column(String, nullable=True)  # e.g., "Engineering", "Marketing", "Sales"
-    is_active = Column(String, nullable=False, default="true")  # Store as string for SQLite compatibility
+    is_active = Column(Boolean, nullable=False, default=True)
     
     # Audit fields
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
@@ -28,3 +28,17 @@ class JobRoleModel(Base):
         back_populates="job_role",
         cascade="all, delete-orphan"
     )
+    
+    # Case-insensitive lookups (get_by_name, check_name_exists, get_by_category),
+    # plus a partial index for get_active/count_active whose predicates match
+    # how each dialect renders `is_active == True`
+    __table_args__ = (
+        Index("ix_job_roles_lower_name", func.lower(name)),
+        Index("ix_job_roles_lower_category", func.lower(category)),
+        Index(
+            "ix_job_roles_active",
+            "id",
+            postgresql_where=text("is_active = true"),
+            sqlite_where=text("is_active = 1"),
+        ),
+    )
@@ -1,7 +1,7 @@
 """
 LLM Usage tracking model for storing AI usage metrics.
 """
-from sqlalchemy import Column, String, Integer, Float, DateTime, ForeignKey, func
+from sqlalchemy import Column, String, Integer, Float, DateTime, ForeignKey, Index, func
 from sqlalchemy.orm import relationship
 from app.db.base import Base
 
@@ -45,4 +45,10 @@ class LLMUsageModel(Base):
     
     # Relationships
     user = relationship("UserModel", backref="llm_usage_records")
+    
+    # Date-range summaries filter by user or action type plus created_at
+    __table_args__ = (
+        Index("idx_llm_usage_user_created", "user_id", "created_at"),
+        Index("idx_llm_usage_action_created", "action_type", "created_at"),
+    )
 
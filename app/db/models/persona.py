@@ -1,6 +1,6 @@
 from sqlalchemy import Column, String, ForeignKey, Integer, UniqueConstraint, CheckConstraint, Enum, DateTime, Text, Float, Index
 from sqlalchemy.dialects.sqlite import JSON
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, deferred
 from sqlalchemy.sql import func
 
 from app.db.base import Base
@@ -18,10 +18,11 @@ class PersonaModel(Base):
 	role_id = Column(String, nullable=True)
 	created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
 	created_by = Column(String, ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
+	# Deprecated: prefer hierarchical categories. Deferred as one group: no read
+	# path renders them, and touching either loads both in a single query
+	weights = deferred(Column(JSON, nullable=True), group="legacy_weights")
 	# Deprecated: prefer hierarchical categories
-	weights = Column(JSON, nullable=True)
-	# Deprecated: prefer hierarchical categories
-	intervals = Column(JSON, nullable=True, default=dict)
+	intervals = deferred(Column(JSON, nullable=True, default=dict), group="legacy_weights")
 	# Persona-level notes
 	persona_notes = Column(Text, nullable=True)
 	
@@ -41,6 +42,16 @@ class PersonaModel(Base):
 	creator = relationship("UserModel", foreign_keys=[created_by])
 	updater = relationship("UserModel", foreign_keys=[updated_by])
 
+	# Indexes
+	__table_args__ = (
+		# (created_at, id) serves the keyset-paginated list queries, scanned backwards for DESC
+		Index("idx_personas_created_at_id", "created_at", "id"),
+		# Duplicate-name check: lower(name) within a JD, matched by expression
+		Index("ix_personas_jd_lower_name", "job_description_id", func.lower(name)),
+		# list_by_jd: one JD's personas already in name order (no sort node)
+		Index("ix_personas_jd_name", "job_description_id", "name"),
+	)
+
 class PersonaCategoryModel(Base):
 	__tablename__ = "persona_categories"
 	__table_args__ = (
@@ -145,6 +156,12 @@ class PersonaChangeLogModel(Base):
 	persona = relationship("PersonaModel", back_populates="change_logs")
 	user = relationship("UserModel", foreign_keys=[changed_by])
 
+	# Indexes
+	__table_args__ = (
+		# get_change_logs: a persona's entries newest first, scanned backwards
+		Index("idx_persona_change_logs_persona_changed_at", "persona_id", "changed_at"),
+	)
+
 
 class PersonaWeightWarningModel(Base):
     __tablename__ = "persona_weight_warnings"
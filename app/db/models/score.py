@@ -39,6 +39,8 @@ class CandidateScoreModel(Base):
 	# Indexes
 	__table_args__ = (
 		Index('idx_candidate_persona', 'candidate_id', 'persona_id'),
+		# COUNT(DISTINCT candidate_id) per persona reads this index alone
+		Index('idx_persona_candidate', 'persona_id', 'candidate_id'),
 		Index('idx_cv_persona', 'cv_id', 'persona_id'),
 		Index('idx_scored_at', 'scored_at'),
 	)
@@ -4,10 +4,36 @@ from sqlalchemy.orm import sessionmaker
 from app.core.config import settings
 
 
-_engine = create_engine(settings.database_url, echo=False, future=True)
+def _engine_options() -> dict:
+	"""Pool settings for server databases; SQLite keeps SQLAlchemy's defaults."""
+	if settings.database_url.startswith("sqlite"):
+		return {}
+	return {
+		**settings.db_pool_options(),
+		"pool_timeout": settings.db_pool_timeout,
+		"pool_recycle": settings.db_pool_recycle,
+		"pool_pre_ping": settings.db_pool_pre_ping,
+		"echo_pool": "debug" if settings.db_echo_pool else False,
+	}
+
+
+_engine = create_engine(settings.database_url, echo=False, future=True, **_engine_options())
 SessionLocal = sessionmaker(bind=_engine, autocommit=False, autoflush=False, future=True)
 
 
 def get_session():
 	"""Return a new SQLAlchemy session (sync placeholder)."""
 	return SessionLocal()
+
+
+def warm_up() -> None:
+	"""Configure all mappers and open one pooled connection ahead of traffic."""
+	from sqlalchemy import text
+	from sqlalchemy.orm import configure_mappers
+
+	import app.db.base  # noqa: F401  (registers every model module)
+
+	configure_mappers()
+	with _engine.connect() as conn:
+		conn.execute(text("SELECT 1"))
+
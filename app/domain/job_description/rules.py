@@ -1,13 +1,15 @@
 from __future__ import annotations
 
-from typing import Iterable, List, Tuple
+import re
+from functools import lru_cache
+from typing import Iterable, List, Pattern, Tuple
 
 
 def validate_title_length(title: str, min_len: int = 2, max_len: int = 120) -> bool:
 	"""Validate that the job title length is within acceptable bounds.
 
 	Args:
-		title: The job title string to validate.
+		title: The job title string to validate; callers pass it already stripped.
 		min_len: Minimum allowed length for a valid title.
 		max_len: Maximum allowed length for a valid title.
 
@@ -19,15 +21,14 @@ def validate_title_length(title: str, min_len: int = 2, max_len: int = 120) -> b
 	"""
 	if title is None:
 		return False
-	length = len(title.strip())
-	return min_len <= length <= max_len
+	return min_len <= len(title) <= max_len
 
 
 def validate_text_presence(text: str, min_len: int = 50) -> bool:
 	"""Validate that a JD text is present and meets a minimal length threshold.
 
 	Args:
-		text: Raw job description text.
+		text: Job description text; callers pass it already stripped.
 		min_len: Minimum character count to be considered substantive.
 
 	Returns:
@@ -38,7 +39,7 @@ def validate_text_presence(text: str, min_len: int = 50) -> bool:
 	"""
 	if text is None:
 		return False
-	return len(text.strip()) >= min_len
+	return len(text) >= min_len
 
 
 def detect_missing_sections(text: str, required_sections: Iterable[str]) -> List[str]:
@@ -55,14 +56,28 @@ def detect_missing_sections(text: str, required_sections: Iterable[str]) -> List
 	Rationale:
 		Used to drive low-cost, deterministic guidance before invoking LLMs.
 	"""
+	sections = tuple(required_sections)
 	lower_text = text.lower()
+	found = {m.group(1) for m in _compile_sections(sections).finditer(lower_text)}
 	missing: List[str] = []
-	for section in required_sections:
-		if section.lower() not in lower_text:
+	for section in sections:
+		key = section.lower()
+		# A header shadowed by a longer one starting at the same offset is
+		# still present as a substring of that longer match.
+		if key and not any(key in match for match in found):
 			missing.append(section)
 	return missing
 
 
+@lru_cache(maxsize=32)
+def _compile_sections(sections: Tuple[str, ...]) -> Pattern[str]:
+	"""Compile section headers into one pattern matched at every text offset."""
+	alternatives = sorted({s.lower() for s in sections if s}, key=len, reverse=True)
+	if not alternatives:
+		return re.compile(r"(?!)()")
+	return re.compile("(?=(" + "|".join(map(re.escape, alternatives)) + "))")
+
+
 def compute_diff_against_template(jd_text: str, template_text: str) -> List[Tuple[str, str]]:
 	"""Compute a high-level diff between JD text and a template.
 
@@ -78,13 +93,16 @@ def compute_diff_against_template(jd_text: str, template_text: str) -> List[Tupl
 	Rationale:
 		This rule allows a lightweight gap analysis to inform refinement prompts.
 	"""
-	# Very coarse token presence comparison (placeholder domain rule)
-	jd_tokens = set(token for token in jd_text.lower().split() if token)
-	tpl_tokens = set(token for token in template_text.lower().split() if token)
+	# Very coarse token presence comparison (placeholder domain rule).
+	# str.split() never yields empty tokens, so the sets are built directly.
+	jd_tokens = set(jd_text.lower().split())
+	if jd_text == template_text:
+		return [("present", tok) for tok in sorted(jd_tokens)]
+	tpl_tokens = set(template_text.lower().split())
 
-	missing = sorted(list(tpl_tokens - jd_tokens))
-	extra = sorted(list(jd_tokens - tpl_tokens))
-	present = sorted(list(jd_tokens & tpl_tokens))
+	missing = sorted(tpl_tokens - jd_tokens)
+	extra = sorted(jd_tokens - tpl_tokens)
+	present = sorted(jd_tokens & tpl_tokens)
 
 	result: List[Tuple[str, str]] = []
 	result.extend(("missing", tok) for tok in missing)
@@ -107,10 +125,18 @@ def validate_tags(tags: Iterable[str], max_tags: int = 20, max_len: int = 40) ->
 	Rationale:
 		Tags are used for quick filtering and retrieval. Limits prevent noise.
 	"""
-	t = list(tags or [])
-	if len(t) > max_tags:
-		return False
-	for tag in t:
-		if not tag or not tag.strip() or len(tag.strip()) > max_len:
+	count = 0
+	for tag in tags or ():
+		count += 1
+		if count > max_tags or not _is_valid_tag(tag, max_len):
 			return False
 	return True
+
+
+@lru_cache(maxsize=1024)
+def _is_valid_tag(tag: str, max_len: int) -> bool:
+	"""Memoized per-tag check; batch imports repeat the same tags heavily."""
+	if not tag:
+		return False
+	stripped = tag.strip()
+	return 0 < len(stripped) <= max_len
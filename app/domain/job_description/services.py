@@ -23,6 +23,9 @@ def create_job_description(
 	This service enforces simple invariants via rules and constructs the aggregate
 	without any persistence or framework concerns.
 	"""
+	title = (title or "").strip()
+	original_text = (original_text or "").strip()
+	tags = list(tags or [])
 	if not jd_rules.validate_title_length(title):
 		raise ValueError("Invalid title length")
 	if not jd_rules.validate_text_presence(original_text):
@@ -40,13 +43,13 @@ def create_job_description(
 
 	return JobDescription(
 		id=id,
-		title=title.strip(),
+		title=title,
 		role=role,
-		original_text=original_text.strip(),
+		original_text=original_text,
 		refined_text=None,
 		company=company,
 		notes=notes,
-		tags=list(tags or []),
+		tags=tags,
 		document_metadata=document_metadata,
 	)
 
@@ -80,6 +83,7 @@ def apply_refinement(jd: JobDescription, refined_text: str) -> JobDescription:
 	This function is pure and returns a new instance (does not mutate input).
 	Validation is kept minimal to ensure refined text is substantive.
 	"""
+	refined_text = (refined_text or "").strip()
 	if not jd_rules.validate_text_presence(refined_text, min_len=50):
 		raise ValueError("Refined text too short or empty")
-	return replace(jd, refined_text=refined_text.strip())
+	return replace(jd, refined_text=refined_text)
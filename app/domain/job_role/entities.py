@@ -1,5 +1,6 @@
 # app/domain/job_role/entities.py
-from dataclasses import dataclass
+import sys
+from dataclasses import dataclass, field, replace
 from typing import Optional
 from datetime import datetime
 
@@ -15,6 +16,7 @@ class JobRole:
     created_by: Optional[str] = None
     updated_at: Optional[datetime] = None
     updated_by: Optional[str] = None
+    _category_key: Optional[str] = field(default=None, init=False, repr=False, compare=False)
     
     def __post_init__(self):
         """Validate job role data."""
@@ -29,73 +31,27 @@ class JobRole:
         
         if self.category and len(self.category.strip()) > 50:
             raise ValueError("Job role category cannot exceed 50 characters")
+        
+        # Normalized category used by category filters; interned since the
+        # vocabulary is tiny and shared across many roles
+        self._category_key = sys.intern(self.category.strip().casefold()) if self.category else None
     
-    def update_name(self, name: str) -> 'JobRole':
+    def update_name(self, name: str, now: Optional[datetime] = None) -> 'JobRole':
         """Update job role name."""
-        return JobRole(
-            id=self.id,
-            name=name,
-            description=self.description,
-            category=self.category,
-            is_active=self.is_active,
-            created_at=self.created_at,
-            created_by=self.created_by,
-            updated_at=datetime.now(),
-            updated_by=self.updated_by
-        )
+        return replace(self, name=name, updated_at=now or datetime.now())
     
-    def update_description(self, description: str) -> 'JobRole':
+    def update_description(self, description: str, now: Optional[datetime] = None) -> 'JobRole':
         """Update job role description."""
-        return JobRole(
-            id=self.id,
-            name=self.name,
-            description=description,
-            category=self.category,
-            is_active=self.is_active,
-            created_at=self.created_at,
-            created_by=self.created_by,
-            updated_at=datetime.now(),
-            updated_by=self.updated_by
-        )
+        return replace(self, description=description, updated_at=now or datetime.now())
     
-    def update_category(self, category: str) -> 'JobRole':
+    def update_category(self, category: str, now: Optional[datetime] = None) -> 'JobRole':
         """Update job role category."""
-        return JobRole(
-            id=self.id,
-            name=self.name,
-            description=self.description,
-            category=category,
-            is_active=self.is_active,
-            created_at=self.created_at,
-            created_by=self.created_by,
-            updated_at=datetime.now(),
-            updated_by=self.updated_by
-        )
+        return replace(self, category=category, updated_at=now or datetime.now())
     
-    def activate(self) -> 'JobRole':
+    def activate(self, now: Optional[datetime] = None) -> 'JobRole':
         """Activate the job role."""
-        return JobRole(
-            id=self.id,
-            name=self.name,
-            description=self.description,
-            category=self.category,
-            is_active=True,
-            created_at=self.created_at,
-            created_by=self.created_by,
-            updated_at=datetime.now(),
-            updated_by=self.updated_by
-        )
+        return replace(self, is_active=True, updated_at=now or datetime.now())
     
-    def deactivate(self) -> 'JobRole':
+    def deactivate(self, now: Optional[datetime] = None) -> 'JobRole':
         """Deactivate the job role."""
-        return JobRole(
-            id=self.id,
-            name=self.name,
-            description=self.description,
-            category=self.category,
-            is_active=False,
-            created_at=self.created_at,
-            created_by=self.created_by,
-            updated_at=datetime.now(),
-            updated_by=self.updated_by
-        )
+        return replace(self, is_active=False, updated_at=now or datetime.now())
@@ -1,5 +1,5 @@
 # app/domain/job_role/rules.py
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from .entities import JobRole
 
 class JobRoleBusinessRules:
@@ -8,8 +8,9 @@ class JobRoleBusinessRules:
     @staticmethod
     def validate_job_role_name_uniqueness(job_roles: List[JobRole], name: str, exclude_id: Optional[str] = None) -> bool:
         """Check if job role name is unique within the system."""
+        key = name.strip().casefold()
         for job_role in job_roles:
-            if job_role.id != exclude_id and job_role.name.lower().strip() == name.lower().strip():
+            if job_role.id != exclude_id and job_role.name.strip().casefold() == key:
                 return False
         return True
     
@@ -62,11 +63,12 @@ class JobRoleBusinessRules:
         return criteria
     
     @staticmethod
-    def get_active_job_roles(job_roles: List[JobRole]) -> List[JobRole]:
+    def get_active_job_roles(job_roles: List[JobRole]) -> Tuple[JobRole, ...]:
         """Filter active job roles."""
-        return [job_role for job_role in job_roles if job_role.is_active]
+        return tuple(job_role for job_role in job_roles if job_role.is_active)
     
     @staticmethod
-    def get_job_roles_by_category(job_roles: List[JobRole], category: str) -> List[JobRole]:
+    def get_job_roles_by_category(job_roles: List[JobRole], category: str) -> Tuple[JobRole, ...]:
         """Filter job roles by category."""
-        return [job_role for job_role in job_roles if job_role.category and job_role.category.lower() == category.lower()]
+        key = category.strip().casefold()
+        return tuple(job_role for job_role in job_roles if job_role._category_key == key)
@@ -15,6 +15,7 @@ def create_job_role(
 ) -> JobRole:
     """Create a new job role with validation."""
     
+    now = datetime.now()
     # Create job role entity
     job_role = JobRole(
         id=str(uuid4()),
@@ -22,9 +23,9 @@ def create_job_role(
         description=description,
         category=category,
         is_active=is_active,
-        created_at=datetime.now(),
+        created_at=now,
         created_by=created_by,
-        updated_at=datetime.now(),
+        updated_at=now,
         updated_by=created_by
     )
     
@@ -41,9 +42,14 @@ def update_job_role(
     description: Optional[str] = None,
     category: Optional[str] = None,
     is_active: Optional[bool] = None,
-    updated_by: Optional[str] = None
+    updated_by: Optional[str] = None,
+    now: Optional[datetime] = None
 ) -> JobRole:
-    """Update an existing job role with validation."""
+    """Update an existing job role with validation.
+    
+    Batch callers can pass a shared ``now`` so every role gets the same
+    timestamp without a clock read per role.
+    """
     
     # Update job role entity
     updated_job_role = JobRole(
@@ -54,7 +60,7 @@ def update_job_role(
         is_active=is_active if is_active is not None else existing_job_role.is_active,
         created_at=existing_job_role.created_at,
         created_by=existing_job_role.created_by,
-        updated_at=datetime.now(),
+        updated_at=now or datetime.now(),
         updated_by=updated_by
     )
     
@@ -1,24 +1,36 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, replace
-from typing import Dict, Optional, List
+import math
+from dataclasses import dataclass, field, replace
+from typing import Dict, Optional, List, Tuple
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False, slots=True)
 class WeightInterval:
 	"""Value object representing an allowed inclusive interval for a weight.
 
-	Invariants are checked at construction time.
+	Invariants are checked at construction time. Equality and hashing use a
+	packed ``(min, max)`` tuple so intervals are cheap set/dict keys.
 	"""
 
 	min: float
 	max: float
+	_key: Tuple[float, float] = field(init=False, repr=False)
 
 	def __post_init__(self) -> None:
 		if not (0.0 <= self.min <= 1.0 and 0.0 <= self.max <= 1.0):
 			raise ValueError("WeightInterval bounds must be within [0.0, 1.0]")
 		if self.min > self.max:
 			raise ValueError("WeightInterval.min must be <= WeightInterval.max")
+		object.__setattr__(self, "_key", (self.min, self.max))
+
+	def __eq__(self, other: object) -> bool:
+		if other.__class__ is not WeightInterval:
+			return NotImplemented
+		return self._key == other._key
+
+	def __hash__(self) -> int:
+		return hash(self._key)
 
 
 @dataclass
@@ -52,15 +64,22 @@ class Persona:
 	weights: Dict[str, float] | None
 	intervals: Dict[str, WeightInterval] | None
 	categories: List[PersonaCategory]
+	# Lazily computed sum of `weights`; carried forward by `with_updated_weight`.
+	_total_cache: Optional[float] = field(default=None, init=False, repr=False, compare=False)
 
 	def total_weight(self) -> float:
 		if not self.weights:
 			return float(sum(cat.weight_percentage for cat in self.categories) / 100.0)
-		return float(sum(self.weights.values()))
+		if self._total_cache is None:
+			self._total_cache = float(math.fsum(self.weights.values()))
+		return self._total_cache
 
 	def with_updated_weight(self, category: str, new_weight: float) -> Persona:
 		if not self.weights:
 			return self
-		new_weights = dict(self.weights)
-		new_weights[category] = float(new_weight)
-		return replace(self, weights=new_weights)
+		new_weight = float(new_weight)
+		if self.weights.get(category) == new_weight:
+			return self
+		# replace() starts the copy with no cached total; total_weight() re-sums
+		# it exactly with fsum rather than drifting through float deltas
+		return replace(self, weights={**self.weights, category: new_weight})
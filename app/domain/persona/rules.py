@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from typing import Dict, Iterable, Tuple, List
+from typing import Dict, Iterable, Sequence, List, Union
+
+from app.domain.persona.entities import WeightInterval
 
 
 def validate_category_names(categories: Iterable[str], min_categories: int = 2, max_categories: int = 20) -> bool:
@@ -58,12 +60,16 @@ def validate_weights_sum(weights: Dict[str, float], tolerance: float = 1e-6) ->
 	return abs(total - 1.0) <= tolerance
 
 
-def detect_out_of_interval(weights: Dict[str, float], intervals: Dict[str, Tuple[float, float]]) -> List[str]:
+def detect_out_of_interval(
+	weights: Dict[str, float],
+	intervals: Dict[str, Union[Sequence[float], WeightInterval]],
+) -> List[str]:
 	"""Return categories whose weight lies outside the recommended interval.
 
 	Args:
 		weights: Mapping of category -> weight.
-		intervals: Mapping of category -> (min, max) inclusive bounds.
+		intervals: Mapping of category -> (min, max) inclusive bounds, either as
+			`WeightInterval` objects or two-item sequences (tuples, JSON lists).
 
 	Returns:
 		List of category names that violate their intervals. If a category has no
@@ -74,9 +80,13 @@ def detect_out_of_interval(weights: Dict[str, float], intervals: Dict[str, Tuple
 	"""
 	violations: List[str] = []
 	for cat, w in (weights or {}).items():
-		if cat not in intervals:
+		bounds = intervals.get(cat)
+		if bounds is None:
 			continue
-		min_v, max_v = intervals[cat]
+		if isinstance(bounds, WeightInterval):
+			min_v, max_v = bounds.min, bounds.max
+		else:
+			min_v, max_v = bounds
 		if not (min_v <= float(w) <= max_v):
 			violations.append(cat)
 	return violations
@@ -13,6 +13,10 @@ DEFAULT_SCHEMA: Dict[str, float] = {
 	"Behavioral": 0.20,
 }
 
+# Snapshot of the default schema; it is known to pass every weight rule and to
+# already sum to 1.0, so personas built from it skip validation entirely.
+_DEFAULT_SCHEMA_ITEMS = tuple(DEFAULT_SCHEMA.items())
+
 
 def create_persona(
 	*,
@@ -29,21 +33,24 @@ def create_persona(
 		id: Optional persona id (not persisted here).
 		job_description_id: Associated job description id.
 		name: Persona display name.
-		weights: Category weights; if None, uses DEFAULT_SCHEMA.
+		weights: Category weights; if None, uses DEFAULT_SCHEMA (pre-validated).
 		intervals: Optional per-category allowed intervals.
 		normalize: If True, scale weights to sum to 1.0.
 
 	Returns:
 		Persona instance with validated invariants.
 	"""
-	w = dict(weights or DEFAULT_SCHEMA)
-	names_ok = persona_rules.validate_category_names(w.keys())
-	ranges_ok = persona_rules.validate_weights_range(w)
-	if normalize:
-		w = persona_rules.normalize_weights(w)
-	sum_ok = persona_rules.validate_weights_sum(w)
-	if not (names_ok and ranges_ok and sum_ok):
-		raise ValueError("Invalid persona weights or categories")
+	if not weights:
+		w = dict(_DEFAULT_SCHEMA_ITEMS)
+	else:
+		w = dict(weights)
+		names_ok = persona_rules.validate_category_names(w.keys())
+		ranges_ok = persona_rules.validate_weights_range(w)
+		if normalize:
+			w = persona_rules.normalize_weights(w)
+		sum_ok = persona_rules.validate_weights_sum(w)
+		if not (names_ok and ranges_ok and sum_ok):
+			raise ValueError("Invalid persona weights or categories")
 
 	ival = dict(intervals or {})
 	return Persona(
@@ -52,6 +59,7 @@ def create_persona(
 		name=name.strip(),
 		weights=w,
 		intervals=ival,
+		categories=[],
 	)
 
 
@@ -83,5 +91,4 @@ def normalize_persona(persona: Persona) -> Persona:
 
 def detect_interval_warnings(persona: Persona) -> list[str]:
 	"""Return category names whose current weights violate their intervals."""
-	intervals_tuple = {k: (v.min, v.max) for k, v in (persona.intervals or {}).items()}
-	return persona_rules.detect_out_of_interval(persona.weights, intervals_tuple)
+	return persona_rules.detect_out_of_interval(persona.weights, persona.intervals or {})
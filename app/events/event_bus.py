@@ -1,4 +1,5 @@
-from typing import Callable, Dict, List, Type, Any
+import dataclasses
+from typing import Callable, Dict, List, Tuple, Type, Any
 
 
 class EventBus:
@@ -6,25 +7,65 @@ class EventBus:
 
 	def __init__(self):
 		self._subscribers: Dict[str, List[Callable]] = {}
+		# Immutable per-event handler snapshots, rebuilt on subscribe so publish
+		# never allocates and can iterate safely while handlers are being added.
+		self._snapshot: Dict[str, Tuple[Callable, ...]] = {}
+		# Handlers that receive the event object itself instead of a dict payload.
+		self._object_subscribers: Dict[str, List[Callable]] = {}
+		self._object_snapshot: Dict[str, Tuple[Callable, ...]] = {}
 
 	def subscribe(self, event_name: str, handler: Callable) -> None:
-		self._subscribers.setdefault(event_name, []).append(handler)
+		handlers = self._subscribers.setdefault(event_name, [])
+		handlers.append(handler)
+		self._snapshot[event_name] = tuple(handlers)
 
 	def subscribe_event(self, event_type: Type[Any], handler: Callable) -> None:
 		self.subscribe(event_type.__name__, handler)
 
+	def subscribe_object(self, event_type: Type[Any], handler: Callable) -> None:
+		"""Subscribe a handler that is called with the event object directly."""
+		event_name = event_type.__name__
+		handlers = self._object_subscribers.setdefault(event_name, [])
+		handlers.append(handler)
+		self._object_snapshot[event_name] = tuple(handlers)
+
 	def publish(self, event_name: str, payload: dict) -> None:
-		for handler in self._subscribers.get(event_name, []):
+		handlers = self._snapshot.get(event_name)
+		if not handlers:
+			return
+		for handler in handlers:
 			handler(payload)
 
+	def publish_object(self, event_obj: Any) -> None:
+		handlers = self._object_snapshot.get(event_obj.__class__.__name__)
+		if not handlers:
+			return
+		for handler in handlers:
+			handler(event_obj)
+
 	def publish_event(self, event_obj: Any) -> None:
-		"""Publish an event object with error handling."""
+		"""Publish an event object with error handling.
+
+		Object subscribers get the event as-is; a dict payload is only built when
+		legacy dict subscribers exist for this event.
+		"""
 		try:
-			self.publish(event_obj.__class__.__name__, event_obj.__dict__)
+			event_name = event_obj.__class__.__name__
+			self.publish_object(event_obj)
+			if event_name in self._snapshot:
+				self.publish(event_name, _event_payload(event_obj))
 		except Exception as e:
 			# Log the error but don't raise it to avoid breaking the main operation
 			print(f"EventBus: Failed to publish event {event_obj.__class__.__name__}: {e}")
 			# Optionally, you could implement event retry logic or dead letter queue here
 
 
+def _event_payload(event_obj: Any) -> dict:
+	"""Return a dict view of an event, supporting slotted dataclasses."""
+	payload = getattr(event_obj, "__dict__", None)
+	if payload is not None:
+		return payload
+	return {f.name: getattr(event_obj, f.name) for f in dataclasses.fields(event_obj)}
+
+
 event_bus = EventBus()
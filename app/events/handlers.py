@@ -20,21 +20,20 @@ def handle_persona_created(payload: Dict) -> None:
 	_ = payload
 
 
-def handle_cv_uploaded(payload: Dict) -> None:
+def handle_cv_uploaded(event: CVUploadedEvent) -> None:
 	# Run a batch CV processing job (stub)
-	candidate_ids = payload.get("candidate_ids", [])
-	if candidate_ids:
-		run_cv_batch_job(job_id="cv_batch:" + ",".join(candidate_ids))
+	if event.candidate_ids:
+		run_cv_batch_job(job_id="cv_batch:" + ",".join(event.candidate_ids))
 
 
-def handle_score_requested(payload: Dict) -> None:
+def handle_score_requested(event: ScoreRequestedEvent) -> None:
 	# Run a scoring job (stub)
-	run_scorer_job(job_id=f"score:{payload.get('persona_id', '')}")
+	run_scorer_job(job_id=f"score:{event.persona_id or ''}")
 
 
 def register_event_handlers() -> None:
 	event_bus.subscribe_event(JDFinalizedEvent, handle_jd_finalized)
 	event_bus.subscribe_event(JDCreatedEvent, handle_jd_created)
 	event_bus.subscribe_event(PersonaCreatedEvent, handle_persona_created)
-	event_bus.subscribe_event(CVUploadedEvent, handle_cv_uploaded)
-	event_bus.subscribe_event(ScoreRequestedEvent, handle_score_requested)
+	event_bus.subscribe_object(CVUploadedEvent, handle_cv_uploaded)
+	event_bus.subscribe_object(ScoreRequestedEvent, handle_score_requested)
@@ -1,97 +1,204 @@
+import asyncio
+import importlib
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI, Request
-from fastapi.responses import JSONResponse
-from fastapi.staticfiles import StaticFiles
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from sqlalchemy.exc import SQLAlchemyError
-from pathlib import Path
-
-from app.api.v1 import jd as jd_router
-from app.api.v1 import persona as persona_router
-from app.api.v1 import persona_level as persona_level_router
-from app.api.v1 import candidate as candidate_router
-from app.api.v1 import match as match_router
-from app.api.v1 import auth as auth_router
-from app.api.v1 import mfa as mfa_router
-from app.api.v1 import company as company_router
-from app.api.v1 import job_role as job_role_router
-from app.api.v1 import role as role_router
-from app.api.v1 import ai_usage as ai_usage_router
-from app.api.v1 import candidate_selection_status as candidate_selection_status_router
-from app.core.logger import logger
-from app.core.config import settings
 
+from app.core.logger import logger
+from app.core.config import Settings, settings
 
-app = FastAPI(title="Recruiter AI Backend", version="0.1.0")
 
-# Configure CORS - Allow all origins for now (to be restricted later)
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=settings.CORS_ORIGINS,
-    allow_credentials=settings.CORS_ALLOW_CREDENTIALS,
-    allow_methods=settings.CORS_ALLOW_METHODS,
-    allow_headers=settings.CORS_ALLOW_HEADERS,
+# (module under app.api.v1, prefix, tags) for every API router, in mount order
+API_ROUTERS = (
+	("auth", "/api/v1/auth", ("auth",)),
+	("mfa", "/api/v1/mfa", ("mfa",)),
+	("jd", "/api/v1/jd", ("jd",)),
+	("persona", "/api/v1/persona", ("persona",)),
+	("persona_level", "/api/v1/persona-level", ("persona-level",)),
+	("candidate", "/api/v1/candidate", ("candidate",)),
+	("match", "/api/v1/match", ("match",)),
+	("company", "/api/v1/company", ("company",)),
+	("job_role", "/api/v1/job-role", ("job-role",)),
+	("role", "/api/v1/role", ("role",)),
+	("ai_usage", "/api/v1/ai-usage", ("ai-usage",)),
+	("candidate_selection_status", "/api/v1/candidate-selection-status", ("candidate-selection-status",)),
 )
 
 
-@app.exception_handler(ValueError)
-async def value_error_handler(request: Request, exc: ValueError):
-	logger.error(f"ValueError on {request.url.path}: {exc}")
-	return JSONResponse(status_code=400, content={"detail": str(exc)})
+def _load_routers(app_settings: Settings) -> tuple:
+	"""Import enabled API router modules (pulls in models, schemas and services).
 
+	Disabled routers are never imported, so their services stay out of memory.
+	"""
+	disabled = frozenset(app_settings.DISABLED_ROUTERS)
+	return tuple(
+		(importlib.import_module(f"app.api.v1.{name}").router, prefix, tags)
+		for name, prefix, tags in API_ROUTERS
+		if name not in disabled
+	)
 
-@app.exception_handler(SQLAlchemyError)
-async def sqlalchemy_error_handler(request: Request, exc: SQLAlchemyError):
-	logger.error(f"SQLAlchemyError on {request.url.path}: {exc}")
-	return JSONResponse(status_code=500, content={"detail": "Database error"})
 
+async def _deferred_init(app: FastAPI) -> None:
+	"""Import and mount the API routers after the server starts listening."""
+	try:
+		# Heavy imports run off the event loop so health probes keep answering
+		routers = await asyncio.to_thread(_load_routers, app.state.settings)
+		include_router = app.include_router
+		for router, prefix, tags in routers:
+			# include_router only extends its own tag list, so the shared
+			# tuples can be passed without copying
+			include_router(router, prefix=prefix, tags=tags)
+		# Routes changed; force the OpenAPI schema to be rebuilt on next access
+		app.openapi_schema = None
+	except Exception as e:
+		# Leave the worker unready so /health and /health/ready keep failing
+		# and the traceback stays in this worker's log
+		logger.exception(f"Mounting API routers failed: {e}")
+		app.state.init_error = str(e)
+		return
+	try:
+		# Mapper configuration and the first pool connection otherwise
+		# land on whichever request touches the database first
+		from app.db.session import warm_up
 
-# Mount API routers
-app.include_router(auth_router.router, prefix="/api/v1/auth", tags=["auth"])
-app.include_router(mfa_router.router, prefix="/api/v1/mfa", tags=["mfa"])
-app.include_router(jd_router.router, prefix="/api/v1/jd", tags=["jd"])
-app.include_router(persona_router.router, prefix="/api/v1/persona", tags=["persona"])
-app.include_router(persona_level_router.router, prefix="/api/v1/persona-level", tags=["persona-level"])
-app.include_router(candidate_router.router, prefix="/api/v1/candidate", tags=["candidate"])
-app.include_router(match_router.router, prefix="/api/v1/match", tags=["match"])
-app.include_router(company_router.router, prefix="/api/v1/company", tags=["company"])
-app.include_router(job_role_router.router, prefix="/api/v1/job-role", tags=["job-role"])
-app.include_router(role_router.router, prefix="/api/v1/role", tags=["role"])
-app.include_router(ai_usage_router.router, prefix="/api/v1/ai-usage", tags=["ai-usage"])
-app.include_router(candidate_selection_status_router.router, prefix="/api/v1/candidate-selection-status", tags=["candidate-selection-status"])
+		await asyncio.to_thread(warm_up)
+	except Exception as e:
+		logger.error(f"Database warm-up failed: {e}")
+	try:
+		app.state.storage_info = await asyncio.to_thread(_storage_info)
+	except Exception as e:
+		# Not fatal; /storage/info retries the probe on demand
+		logger.error(f"Storage info probe failed: {e}")
+	app.state.ready = True
+	logger.info("API routers mounted; application ready")
+
+
+def _storage_info() -> dict:
+	"""Describe the configured storage backend and validate its settings."""
+	from app.services.storage import StorageFactory
+
+	storage_service = StorageFactory.get_storage_service()
+	info = storage_service.get_storage_info()
+
+	# Add configuration validation
+	validation = StorageFactory.validate_storage_config()
+	info['config_valid'] = validation['valid']
+	info['config_errors'] = validation.get('errors', [])
+	return info
+
+
+def _mount_uploads(app: FastAPI, app_settings: Settings) -> None:
+	"""Serve local-storage uploads in-process unless a reverse proxy does it."""
+	if app_settings.STORAGE_TYPE.lower() != "local" or not app_settings.SERVE_UPLOADS_INPROC:
+		return
+	from pathlib import Path
+	from fastapi.staticfiles import StaticFiles
 
-# Mount static files for local storage (only when using local storage)
-if settings.STORAGE_TYPE.lower() == "local":
 	# Ensure uploads directory exists
-	uploads_path = Path(settings.LOCAL_STORAGE_PATH).parent
+	uploads_path = Path(app_settings.LOCAL_STORAGE_PATH).parent
 	uploads_path.mkdir(parents=True, exist_ok=True)
-	
+
 	# Mount static files
 	app.mount("/uploads", StaticFiles(directory=str(uploads_path)), name="uploads")
 
 
-@app.get("/health")
-async def health_check() -> dict:
-	"""Liveness/readiness probe endpoint."""
-	return {"status": "ok"}
+def _make_lifespan(app_settings: Settings):
+	@asynccontextmanager
+	async def lifespan(app: FastAPI):
+		if app_settings.threadpool_max_threads:
+			# Sync endpoints/dependencies run here; see app/server.py for sizing
+			from anyio import to_thread
 
+			to_thread.current_default_thread_limiter().total_tokens = app_settings.threadpool_max_threads
+		_mount_uploads(app, app_settings)
+		# Uvicorn binds the socket only after lifespan startup completes, so
+		# the heavy init is scheduled in the background instead of awaited.
+		init_task = asyncio.create_task(_deferred_init(app))
+		try:
+			yield
+		finally:
+			if not init_task.done():
+				init_task.cancel()
 
-@app.get("/storage/info")
-async def storage_info() -> dict:
-	"""Get information about the current storage configuration."""
-	from app.services.storage import StorageFactory
-	
-	try:
-		storage_service = StorageFactory.get_storage_service()
-		info = storage_service.get_storage_info()
-		
-		# Add configuration validation
-		validation = StorageFactory.validate_storage_config()
-		info['config_valid'] = validation['valid']
-		info['config_errors'] = validation.get('errors', [])
-		
-		return info
-	except Exception as e:
-		return {
-			"error": str(e),
-			"storage_type": settings.STORAGE_TYPE
-		}
+	return lifespan
+
+
+def create_app(app_settings: Settings = settings) -> FastAPI:
+	"""Build a minimal FastAPI app; API routers are mounted after startup.
+
+	All configuration comes from ``app_settings``: DISABLED_ROUTERS gates
+	which routers are imported, STORAGE_TYPE/SERVE_UPLOADS_INPROC gate the
+	uploads mount and the CORS lists gate the CORS middleware.
+	"""
+	app = FastAPI(
+		title="Recruiter AI Backend",
+		version="0.1.0",
+		lifespan=_make_lifespan(app_settings),
+		# orjson encodes responses in native code instead of stdlib json
+		default_response_class=ORJSONResponse,
+	)
+	app.state.settings = app_settings
+	app.state.ready = False
+	app.state.init_error = None
+	app.state.storage_info = None
+
+	# Configure CORS - Allow all origins for now (to be restricted later)
+	cors_options = app_settings.cors_middleware_options()
+	if cors_options["allow_origins"]:
+		# No allowed origins means no CORS headers to emit; skip the middleware
+		app.add_middleware(CORSMiddleware, **cors_options)
+
+	@app.exception_handler(ValueError)
+	async def value_error_handler(request: Request, exc: ValueError):
+		logger.error(f"ValueError on {request.url.path}: {exc}")
+		return ORJSONResponse(status_code=400, content={"detail": str(exc)})
+
+	@app.exception_handler(SQLAlchemyError)
+	async def sqlalchemy_error_handler(request: Request, exc: SQLAlchemyError):
+		logger.error(f"SQLAlchemyError on {request.url.path}: {exc}")
+		return ORJSONResponse(status_code=500, content={"detail": "Database error"})
+
+	def _readiness():
+		if app.state.init_error is not None:
+			return ORJSONResponse(status_code=503, content={"status": "failed", "detail": app.state.init_error})
+		if not app.state.ready:
+			return ORJSONResponse(status_code=503, content={"status": "starting"})
+		return {"status": "ok"}
+
+	@app.get("/health")
+	async def health_check():
+		"""Health probe; 503 until the API routers are mounted (as /health/ready)."""
+		return _readiness()
+
+	@app.get("/health/live")
+	async def health_live() -> dict:
+		"""Liveness probe; answers as soon as the socket is bound."""
+		return {"status": "ok"}
+
+	@app.get("/health/ready")
+	async def health_ready():
+		"""Readiness probe; 503 until the API routers are mounted."""
+		return _readiness()
+
+	@app.get("/storage/info")
+	async def storage_info() -> dict:
+		"""Get information about the current storage configuration."""
+		# Storage settings are fixed for the process lifetime, so the probe
+		# result is computed once (at startup or first success) and reused.
+		if app.state.storage_info is None:
+			try:
+				app.state.storage_info = await asyncio.to_thread(_storage_info)
+			except Exception as e:
+				return {
+					"error": str(e),
+					"storage_type": app_settings.STORAGE_TYPE
+				}
+		return app.state.storage_info
+
+	return app
+
+
+app = create_app()
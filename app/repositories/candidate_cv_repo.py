@@ -6,32 +6,42 @@ from __future__ import annotations
 
 from typing import Optional, List
 from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from sqlalchemy import and_, bindparam, delete, func, select
 
 from app.db.models.candidate import CandidateCVModel
 
 
+# Duplicate-upload check run on every CV upload, built once at import
+_CV_BY_HASH = select(CandidateCVModel).where(CandidateCVModel.file_hash == bindparam("file_hash")).limit(1)
+
+
 class CandidateCVRepository:
 	"""Repository interface for CandidateCV aggregates."""
 
 	def get(self, db: Session, cv_id: str) -> Optional[CandidateCVModel]:
 		raise NotImplementedError
 
-	def create(self, db: Session, cv: CandidateCVModel) -> CandidateCVModel:
+	def create(self, db: Session, cv: CandidateCVModel, commit: bool = True) -> CandidateCVModel:
+		raise NotImplementedError
+
+	def create_many(self, db: Session, cvs: List[CandidateCVModel]) -> List[CandidateCVModel]:
 		raise NotImplementedError
 
-	def update(self, db: Session, cv: CandidateCVModel) -> CandidateCVModel:
+	def update(self, db: Session, cv: CandidateCVModel, commit: bool = True) -> CandidateCVModel:
 		raise NotImplementedError
 
 	def find_by_hash(self, db: Session, file_hash: str) -> Optional[CandidateCVModel]:
 		raise NotImplementedError
 
-	def get_candidate_cvs(self, db: Session, candidate_id: str) -> List[CandidateCVModel]:
+	def get_candidate_cvs(self, db: Session, candidate_id: str, skip: int = 0, limit: Optional[int] = None) -> List[CandidateCVModel]:
 		raise NotImplementedError
 
 	def get_next_version(self, db: Session, candidate_id: str) -> int:
 		raise NotImplementedError
 
+	def create_next_version(self, db: Session, cv: CandidateCVModel, commit: bool = True) -> CandidateCVModel:
+		raise NotImplementedError
+
 	def delete(self, db: Session, cv_id: str) -> bool:
 		raise NotImplementedError
 
@@ -42,42 +52,80 @@ class SQLAlchemyCandidateCVRepository(CandidateCVRepository):
 	def get(self, db: Session, cv_id: str) -> Optional[CandidateCVModel]:
 		return db.get(CandidateCVModel, cv_id)
 
-	def create(self, db: Session, cv: CandidateCVModel) -> CandidateCVModel:
+	def create(self, db: Session, cv: CandidateCVModel, commit: bool = True) -> CandidateCVModel:
+		"""Persist a CV; pass commit=False to defer to the caller's unit of work."""
 		db.add(cv)
+		if not commit:
+			db.flush()
+			return cv
 		db.commit()
 		db.refresh(cv)
 		return cv
 
-	def update(self, db: Session, cv: CandidateCVModel) -> CandidateCVModel:
+	def create_many(self, db: Session, cvs: List[CandidateCVModel]) -> List[CandidateCVModel]:
+		"""Persist several CVs in one flush and a single commit."""
+		try:
+			db.add_all(cvs)
+			db.flush()
+			db.commit()
+			return cvs
+		except Exception as e:
+			db.rollback()
+			raise e
+
+	def update(self, db: Session, cv: CandidateCVModel, commit: bool = True) -> CandidateCVModel:
+		"""Persist CV changes; pass commit=False to defer to the caller's unit of work."""
 		db.add(cv)
+		if not commit:
+			db.flush()
+			return cv
 		db.commit()
 		db.refresh(cv)
 		return cv
 
 	def find_by_hash(self, db: Session, file_hash: str) -> Optional[CandidateCVModel]:
-		return db.query(CandidateCVModel).filter(CandidateCVModel.file_hash == file_hash).first()
+		return db.execute(_CV_BY_HASH, {"file_hash": file_hash}).scalars().first()
 
-	def get_candidate_cvs(self, db: Session, candidate_id: str) -> List[CandidateCVModel]:
-		return db.query(CandidateCVModel).filter(
+	def get_candidate_cvs(self, db: Session, candidate_id: str, skip: int = 0, limit: Optional[int] = None) -> List[CandidateCVModel]:
+		"""Return a candidate's CVs, newest version first, optionally paginated."""
+		query = db.query(CandidateCVModel).filter(
 			CandidateCVModel.candidate_id == candidate_id
-		).order_by(CandidateCVModel.version.desc()).all()
+		).order_by(CandidateCVModel.version.desc())
+		if skip:
+			query = query.offset(skip)
+		if limit is not None:
+			query = query.limit(limit)
+		return query.all()
 
 	def get_next_version(self, db: Session, candidate_id: str) -> int:
-		latest_cv = db.query(CandidateCVModel).filter(
-			CandidateCVModel.candidate_id == candidate_id
-		).order_by(CandidateCVModel.version.desc()).first()
+		# Aggregate in SQL instead of hydrating the latest CV row
+		max_version = db.query(
+			func.coalesce(func.max(CandidateCVModel.version), 0)
+		).filter(CandidateCVModel.candidate_id == candidate_id).scalar()
 		
-		return (latest_cv.version + 1) if latest_cv else 1
+		return max_version + 1
+
+	def create_next_version(self, db: Session, cv: CandidateCVModel, commit: bool = True) -> CandidateCVModel:
+		"""Persist a CV as the candidate's next version in a single INSERT.
+
+		The version is computed by a scalar subquery embedded in the INSERT
+		(``COALESCE(MAX(version), 0) + 1``) instead of a separate SELECT, so
+		there is no read-then-write window; uq_candidate_cv_version rejects
+		the rare concurrent duplicate.
+		"""
+		cv.version = (
+			select(func.coalesce(func.max(CandidateCVModel.version), 0) + 1)
+			.where(CandidateCVModel.candidate_id == cv.candidate_id)
+			.scalar_subquery()
+		)
+		return self.create(db, cv, commit=commit)
 
 	def delete(self, db: Session, cv_id: str) -> bool:
-		"""Delete a candidate CV by ID."""
+		"""Delete a candidate CV by ID with a single DELETE statement."""
 		try:
-			cv = self.get(db, cv_id)
-			if cv:
-				db.delete(cv)
-				db.commit()
-				return True
-			return False
+			result = db.execute(delete(CandidateCVModel).where(CandidateCVModel.id == cv_id))
+			db.commit()
+			return result.rowcount > 0
 		except Exception as e:
 			db.rollback()
 			raise e
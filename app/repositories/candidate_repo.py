@@ -1,12 +1,28 @@
 from __future__ import annotations
 
 from typing import Optional, Sequence, List, Tuple, Dict, Any
-from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import and_, func, distinct, or_
+from sqlalchemy.orm import Session, aliased, joinedload, selectinload
+from sqlalchemy import func, distinct, or_, select, update, delete, tuple_, bindparam, RowMapping
 
 from app.db.models.candidate import CandidateModel, CandidateCVModel, CandidateSelectionModel, CandidateSelectionAuditLogModel
 from app.db.models.score import CandidateScoreModel
 from app.db.models.persona import PersonaModel
+from app.db.models.user import UserModel
+from app.core.count_cache import count_cache, invalidate_on_commit
+from app.db.commit import commit_keep_loaded
+from app.utils.pagination import Cursor
+# CV repositories live in candidate_cv_repo; re-exported for older imports
+from app.repositories.candidate_cv_repo import CandidateCVRepository, SQLAlchemyCandidateCVRepository  # noqa: F401
+
+
+# Identity lookups used on every CV upload, built once at import
+_CANDIDATE_BY_EMAIL = select(CandidateModel).where(CandidateModel.email == bindparam("email")).limit(1)
+_CANDIDATE_BY_PHONE = select(CandidateModel).where(CandidateModel.phone == bindparam("phone")).limit(1)
+_CANDIDATE_BY_EMAIL_OR_PHONE = (
+	select(CandidateModel)
+	.where(or_(CandidateModel.email == bindparam("email"), CandidateModel.phone == bindparam("phone")))
+	.limit(1)
+)
 
 
 class CandidateRepository:
@@ -15,15 +31,21 @@ class CandidateRepository:
 	def get(self, db: Session, candidate_id: str) -> Optional[CandidateModel]:
 		raise NotImplementedError
 
-	def create(self, db: Session, candidate: CandidateModel) -> CandidateModel:
+	def create(self, db: Session, candidate: CandidateModel, commit: bool = True) -> CandidateModel:
 		raise NotImplementedError
 
-	def update(self, db: Session, candidate: CandidateModel) -> CandidateModel:
+	def create_many(self, db: Session, candidates: List[CandidateModel]) -> List[CandidateModel]:
+		raise NotImplementedError
+
+	def update(self, db: Session, candidate: CandidateModel, commit: bool = True) -> CandidateModel:
 		raise NotImplementedError
 
 	def list_all(self, db: Session) -> Sequence[CandidateModel]:
 		raise NotImplementedError
 
+	def list_projection(self, db: Session, skip: int = 0, limit: int = 100, after: Optional[Cursor] = None) -> Sequence[RowMapping]:
+		raise NotImplementedError
+
 	def find_by_email(self, db: Session, email: str) -> Optional[CandidateModel]:
 		raise NotImplementedError
 
@@ -37,62 +59,67 @@ class CandidateRepository:
 		raise NotImplementedError
 
 
-class CandidateCVRepository:
-	"""Repository interface for CandidateCV aggregates."""
-
-	def get(self, db: Session, cv_id: str) -> Optional[CandidateCVModel]:
-		raise NotImplementedError
-
-	def create(self, db: Session, cv: CandidateCVModel) -> CandidateCVModel:
-		raise NotImplementedError
-
-	def update(self, db: Session, cv: CandidateCVModel) -> CandidateCVModel:
-		raise NotImplementedError
-
-	def find_by_hash(self, db: Session, file_hash: str) -> Optional[CandidateCVModel]:
-		raise NotImplementedError
-
-	def get_candidate_cvs(self, db: Session, candidate_id: str) -> List[CandidateCVModel]:
-		raise NotImplementedError
-
-	def get_next_version(self, db: Session, candidate_id: str) -> int:
-		raise NotImplementedError
-
-	def delete(self, db: Session, cv_id: str) -> bool:
-		raise NotImplementedError
-
-
 class SQLAlchemyCandidateRepository(CandidateRepository):
 	"""SQLAlchemy-backed implementation of CandidateRepository."""
 
 	def get(self, db: Session, candidate_id: str) -> Optional[CandidateModel]:
-		return (
-			db.query(CandidateModel)
-			.options(
+		# Session.get answers from the identity map when the candidate is already
+		# loaded in this session; the eager loads only run on a miss
+		return db.get(
+			CandidateModel,
+			candidate_id,
+			options=[
+				# Load CVs for the detail view in one batched query (newest first)
+				selectinload(CandidateModel.cvs),
 				# Load creator for created_by_name
 				joinedload(CandidateModel.creator),
 				# Load updater for updated_by_name
 				joinedload(CandidateModel.updater)
-			)
-			.filter(CandidateModel.id == candidate_id)
-			.first()
+			]
 		)
 
-	def create(self, db: Session, candidate: CandidateModel) -> CandidateModel:
+	def create(self, db: Session, candidate: CandidateModel, commit: bool = True) -> CandidateModel:
+		"""Persist a candidate; pass commit=False to defer to the caller's unit of work."""
 		db.add(candidate)
-		db.commit()
-		db.refresh(candidate)
+		if not commit:
+			db.flush()
+			invalidate_on_commit(db, CandidateModel.__tablename__)
+			return candidate
+		commit_keep_loaded(db, candidate)
+		count_cache.invalidate(CandidateModel.__tablename__)
 		return candidate
 
-	def update(self, db: Session, candidate: CandidateModel) -> CandidateModel:
+	def create_many(self, db: Session, candidates: List[CandidateModel]) -> List[CandidateModel]:
+		"""Persist several candidates in one flush and a single commit."""
+		try:
+			db.add_all(candidates)
+			db.flush()
+			db.commit()
+			count_cache.invalidate(CandidateModel.__tablename__)
+			return candidates
+		except Exception as e:
+			db.rollback()
+			raise e
+
+	def update(self, db: Session, candidate: CandidateModel, commit: bool = True) -> CandidateModel:
+		"""Persist candidate changes; pass commit=False to defer to the caller's unit of work."""
 		db.add(candidate)
-		db.commit()
-		db.refresh(candidate)
+		if not commit:
+			db.flush()
+			# Edited names/emails/phones can move a candidate in or out of search totals
+			invalidate_on_commit(db, CandidateModel.__tablename__)
+			return candidate
+		commit_keep_loaded(db, candidate)
+		count_cache.invalidate(CandidateModel.__tablename__)
 		return candidate
 
-	def list_all(self, db: Session, skip: int = 0, limit: int = 100) -> Sequence[CandidateModel]:
-		"""List all candidates with eagerly loaded relationships for list view."""
-		return (
+	def list_all(self, db: Session, skip: int = 0, limit: int = 100, after: Optional[Cursor] = None) -> Sequence[CandidateModel]:
+		"""List all candidates with eagerly loaded relationships for list view.
+
+		Pass `after` (the previous page's last (created_at, id)) to seek past
+		it instead of scanning `skip` rows; `skip` is ignored then.
+		"""
+		query = (
 			db.query(CandidateModel)
 			.options(
 				# Load creator for created_by_name
@@ -100,15 +127,62 @@ class SQLAlchemyCandidateRepository(CandidateRepository):
 				# Load updater for updated_by_name
 				joinedload(CandidateModel.updater)
 			)
-			.order_by(CandidateModel.created_at.desc())
-			.offset(skip)
+		)
+		if after is not None:
+			query = query.filter(tuple_(CandidateModel.created_at, CandidateModel.id) < tuple_(*after))
+		else:
+			query = query.offset(skip)
+		return (
+			query
+			.order_by(CandidateModel.created_at.desc(), CandidateModel.id.desc())
 			.limit(limit)
 			.all()
 		)
 	
+	def list_projection(self, db: Session, skip: int = 0, limit: int = 100, after: Optional[Cursor] = None) -> Sequence[RowMapping]:
+		"""List candidates as plain rows holding only the list-view columns.
+
+		Same ordering and paging as `list_all`, but creator/updater names are
+		joined in as columns, so no ORM instances are built or tracked.
+		"""
+		creator = aliased(UserModel)
+		updater = aliased(UserModel)
+		stmt = (
+			select(
+				CandidateModel.id,
+				CandidateModel.full_name,
+				CandidateModel.email,
+				CandidateModel.phone,
+				CandidateModel.latest_cv_id,
+				CandidateModel.created_at,
+				CandidateModel.created_by,
+				CandidateModel.updated_at,
+				CandidateModel.updated_by,
+				creator.first_name.label("created_by_first_name"),
+				creator.last_name.label("created_by_last_name"),
+				creator.email.label("created_by_email"),
+				updater.first_name.label("updated_by_first_name"),
+				updater.last_name.label("updated_by_last_name"),
+				updater.email.label("updated_by_email")
+			)
+			.outerjoin(creator, CandidateModel.created_by == creator.id)
+			.outerjoin(updater, CandidateModel.updated_by == updater.id)
+		)
+		if after is not None:
+			stmt = stmt.where(tuple_(CandidateModel.created_at, CandidateModel.id) < tuple_(*after))
+		else:
+			stmt = stmt.offset(skip)
+		return db.execute(
+			stmt
+			.order_by(CandidateModel.created_at.desc(), CandidateModel.id.desc())
+			.limit(limit)
+		).mappings().all()
+
 	def count(self, db: Session) -> int:
-		"""Count total candidates."""
-		return db.query(CandidateModel).count()
+		"""Count total candidates (cached briefly, see app/core/count_cache.py)."""
+		return count_cache.get_or_compute(
+			CandidateModel.__tablename__, "all", lambda: db.query(CandidateModel).count()
+		)
 	
 	def search(self, db: Session, search_criteria: Dict[str, Any], skip: int = 0, limit: int = 100) -> Sequence[CandidateModel]:
 		"""Search candidates based on criteria.
@@ -156,9 +230,8 @@ class SQLAlchemyCandidateRepository(CandidateRepository):
 		"""Count candidates matching search criteria.
 		
 		Searches across name, email, and phone fields using OR logic.
+		Totals are cached briefly per search term (see app/core/count_cache.py).
 		"""
-		query = db.query(CandidateModel)
-		
 		# Get the search query term
 		search_term = search_criteria.get('query', '').strip()
 		
@@ -166,112 +239,97 @@ class SQLAlchemyCandidateRepository(CandidateRepository):
 			# If no search term, return 0
 			return 0
 		
-		# Build conditions to search across name, email, and phone
-		# SQLAlchemy handles NULL values correctly with OR logic
-		conditions = [
-			# Search in full_name (case-insensitive)
-			func.lower(CandidateModel.full_name).contains(func.lower(search_term)),
-			# Search in email (case-insensitive)
-			func.lower(CandidateModel.email).contains(func.lower(search_term)),
-			# Search in phone
-			CandidateModel.phone.contains(search_term)
-		]
+		def _count() -> int:
+			# Build conditions to search across name, email, and phone
+			# SQLAlchemy handles NULL values correctly with OR logic
+			conditions = [
+				# Search in full_name (case-insensitive)
+				func.lower(CandidateModel.full_name).contains(func.lower(search_term)),
+				# Search in email (case-insensitive)
+				func.lower(CandidateModel.email).contains(func.lower(search_term)),
+				# Search in phone
+				CandidateModel.phone.contains(search_term)
+			]
+			
+			# Apply conditions with OR logic (matches any of the fields)
+			return db.query(CandidateModel).filter(or_(*conditions)).count()
 		
-		# Apply conditions with OR logic (matches any of the fields)
-		query = query.filter(or_(*conditions))
-		
-		return query.count()
+		return count_cache.get_or_compute(CandidateModel.__tablename__, ("search", search_term), _count)
 	
-	def get_personas_for_candidate(self, db: Session, candidate_id: str) -> List[dict]:
-		"""Get distinct personas evaluated against a candidate."""
-		results = (
-			db.query(
+	def get_personas_for_candidate(self, db: Session, candidate_id: str) -> Sequence[RowMapping]:
+		"""Get distinct personas evaluated against a candidate.
+
+		Rows are returned as dict-like mappings with `persona_id`/`persona_name`.
+		"""
+		# De-duplicate persona ids on the scores side first; idx_candidate_persona
+		# (candidate_id, persona_id) answers this from the index alone, so the
+		# personas table is only probed once per distinct persona
+		scored_persona_ids = (
+			select(CandidateScoreModel.persona_id)
+			.where(CandidateScoreModel.candidate_id == candidate_id)
+			.distinct()
+		)
+		return db.execute(
+			select(
 				PersonaModel.id.label('persona_id'),
 				PersonaModel.name.label('persona_name')
 			)
-			.join(CandidateScoreModel, PersonaModel.id == CandidateScoreModel.persona_id)
-			.filter(CandidateScoreModel.candidate_id == candidate_id)
+			.where(PersonaModel.id.in_(scored_persona_ids))
+		).mappings().all()
+
+	def get_personas_for_candidates(self, db: Session, candidate_ids: Sequence[str]) -> Dict[str, List[RowMapping]]:
+		"""Distinct personas evaluated against each of several candidates, in one query.
+
+		Every requested id gets an entry; candidates without scores map to [].
+		"""
+		if not candidate_ids:
+			return {}
+		rows = db.execute(
+			select(
+				CandidateScoreModel.candidate_id,
+				PersonaModel.id.label('persona_id'),
+				PersonaModel.name.label('persona_name')
+			)
+			.join(PersonaModel, PersonaModel.id == CandidateScoreModel.persona_id)
+			.where(CandidateScoreModel.candidate_id.in_(candidate_ids))
 			.distinct()
-			.all()
-		)
-		return [{"persona_id": r.persona_id, "persona_name": r.persona_name} for r in results]
+		).mappings().all()
+		personas: Dict[str, List[RowMapping]] = {candidate_id: [] for candidate_id in candidate_ids}
+		for row in rows:
+			personas[row["candidate_id"]].append(row)
+		return personas
 
 	def find_by_email(self, db: Session, email: str) -> Optional[CandidateModel]:
-		return db.query(CandidateModel).filter(CandidateModel.email == email).first()
+		return db.execute(_CANDIDATE_BY_EMAIL, {"email": email}).scalars().first()
 
 	def find_by_phone(self, db: Session, phone: str) -> Optional[CandidateModel]:
-		return db.query(CandidateModel).filter(CandidateModel.phone == phone).first()
+		return db.execute(_CANDIDATE_BY_PHONE, {"phone": phone}).scalars().first()
 
 	def find_by_email_or_phone(self, db: Session, email: Optional[str], phone: Optional[str]) -> Optional[CandidateModel]:
-		query = db.query(CandidateModel)
-		conditions = []
-		
+		# Either identifier identifies the candidate
+		if email and phone:
+			return db.execute(_CANDIDATE_BY_EMAIL_OR_PHONE, {"email": email, "phone": phone}).scalars().first()
 		if email:
-			conditions.append(CandidateModel.email == email)
+			return self.find_by_email(db, email)
 		if phone:
-			conditions.append(CandidateModel.phone == phone)
-		
-		if not conditions:
-			return None
-		
-		return query.filter(and_(*conditions)).first()
+			return self.find_by_phone(db, phone)
+		return None
 
 	def delete(self, db: Session, candidate_id: str) -> bool:
-		"""Delete a candidate by ID."""
-		try:
-			candidate = self.get(db, candidate_id)
-			if candidate:
-				db.delete(candidate)
-				db.commit()
-				return True
-			return False
-		except Exception as e:
-			db.rollback()
-			raise e
-
-
-class SQLAlchemyCandidateCVRepository(CandidateCVRepository):
-	"""SQLAlchemy-backed implementation of CandidateCVRepository."""
-
-	def get(self, db: Session, cv_id: str) -> Optional[CandidateCVModel]:
-		return db.get(CandidateCVModel, cv_id)
-
-	def create(self, db: Session, cv: CandidateCVModel) -> CandidateCVModel:
-		db.add(cv)
-		db.commit()
-		db.refresh(cv)
-		return cv
-
-	def update(self, db: Session, cv: CandidateCVModel) -> CandidateCVModel:
-		db.add(cv)
-		db.commit()
-		db.refresh(cv)
-		return cv
-
-	def find_by_hash(self, db: Session, file_hash: str) -> Optional[CandidateCVModel]:
-		return db.query(CandidateCVModel).filter(CandidateCVModel.file_hash == file_hash).first()
-
-	def get_candidate_cvs(self, db: Session, candidate_id: str) -> List[CandidateCVModel]:
-		return db.query(CandidateCVModel).filter(
-			CandidateCVModel.candidate_id == candidate_id
-		).order_by(CandidateCVModel.version.desc()).all()
-
-	def get_next_version(self, db: Session, candidate_id: str) -> int:
-		latest_cv = db.query(CandidateCVModel).filter(
-			CandidateCVModel.candidate_id == candidate_id
-		).order_by(CandidateCVModel.version.desc()).first()
-		
-		return (latest_cv.version + 1) if latest_cv else 1
-
-	def delete(self, db: Session, cv_id: str) -> bool:
-		"""Delete a candidate CV by ID."""
+		"""Delete a candidate by ID without loading it (or its CVs) first."""
 		try:
-			cv = self.get(db, cv_id)
-			if cv:
-				db.delete(cv)
-				db.commit()
-				return True
-			return False
+			# Mirror the ORM cascade with plain statements: break the
+			# latest_cv_id cycle, drop the CVs, then the candidate row itself.
+			db.execute(
+				update(CandidateModel)
+				.where(CandidateModel.id == candidate_id)
+				.values(latest_cv_id=None)
+			)
+			db.execute(delete(CandidateCVModel).where(CandidateCVModel.candidate_id == candidate_id))
+			result = db.execute(delete(CandidateModel).where(CandidateModel.id == candidate_id))
+			db.commit()
+			count_cache.invalidate(CandidateModel.__tablename__)
+			return result.rowcount > 0
 		except Exception as e:
 			db.rollback()
 			raise e
@@ -280,7 +338,7 @@ class SQLAlchemyCandidateCVRepository(CandidateCVRepository):
 class CandidateSelectionRepository:
 	"""Repository interface for Candidate Selection aggregates."""
 
-	def create(self, db: Session, selection: CandidateSelectionModel) -> CandidateSelectionModel:
+	def create(self, db: Session, selection: CandidateSelectionModel, commit: bool = True) -> CandidateSelectionModel:
 		raise NotImplementedError
 
 	def get(self, db: Session, selection_id: str) -> Optional[CandidateSelectionModel]:
@@ -296,11 +354,24 @@ class CandidateSelectionRepository:
 		job_description_id: Optional[str] = None,
 		status: Optional[str] = None,
 		skip: int = 0,
-		limit: int = 100
+		limit: int = 100,
+		after: Optional[Cursor] = None
 	) -> Tuple[Sequence[CandidateSelectionModel], int]:
 		raise NotImplementedError
 
-	def update(self, db: Session, selection: CandidateSelectionModel) -> CandidateSelectionModel:
+	def list_selection_projection(
+		self,
+		db: Session,
+		persona_id: Optional[str] = None,
+		job_description_id: Optional[str] = None,
+		status: Optional[str] = None,
+		skip: int = 0,
+		limit: int = 100,
+		after: Optional[Cursor] = None
+	) -> Tuple[Sequence[RowMapping], int]:
+		raise NotImplementedError
+
+	def update(self, db: Session, selection: CandidateSelectionModel, commit: bool = True) -> CandidateSelectionModel:
 		raise NotImplementedError
 
 	def delete(self, db: Session, selection_id: str) -> bool:
@@ -313,25 +384,30 @@ class CandidateSelectionRepository:
 class SQLAlchemyCandidateSelectionRepository(CandidateSelectionRepository):
 	"""SQLAlchemy-backed implementation of CandidateSelectionRepository."""
 
-	def create(self, db: Session, selection: CandidateSelectionModel) -> CandidateSelectionModel:
-		"""Create a new candidate selection."""
+	def create(self, db: Session, selection: CandidateSelectionModel, commit: bool = True) -> CandidateSelectionModel:
+		"""Create a new candidate selection; pass commit=False to defer to the caller's unit of work."""
 		db.add(selection)
-		db.commit()
-		db.refresh(selection)
+		if not commit:
+			db.flush()
+			return selection
+		commit_keep_loaded(db, selection)
 		return selection
 
 	def get(self, db: Session, selection_id: str) -> Optional[CandidateSelectionModel]:
-		"""Get a candidate selection by ID with relationships loaded."""
-		return (
-			db.query(CandidateSelectionModel)
-			.options(
+		"""Get a candidate selection by ID with relationships loaded.
+
+		Uses Session.get, so a selection already in the session is returned
+		without a query.
+		"""
+		return db.get(
+			CandidateSelectionModel,
+			selection_id,
+			options=[
 				joinedload(CandidateSelectionModel.candidate),
 				joinedload(CandidateSelectionModel.persona),
 				joinedload(CandidateSelectionModel.job_description),
 				joinedload(CandidateSelectionModel.selector)
-			)
-			.filter(CandidateSelectionModel.id == selection_id)
-			.first()
+			]
 		)
 
 	def get_by_candidate_persona(self, db: Session, candidate_id: str, persona_id: str) -> Optional[CandidateSelectionModel]:
@@ -358,69 +434,196 @@ class SQLAlchemyCandidateSelectionRepository(CandidateSelectionRepository):
 		job_description_id: Optional[str] = None,
 		status: Optional[str] = None,
 		skip: int = 0,
-		limit: int = 100
+		limit: int = 100,
+		after: Optional[Cursor] = None
 	) -> Tuple[Sequence[CandidateSelectionModel], int]:
 		"""List candidate selections with optional filtering and pagination.
 		
+		Pass `after` (the previous page's last (created_at, id)) for keyset
+		pagination; `skip` is ignored then.
+		
 		Returns:
 			Tuple of (list of selections, total count)
 		"""
-		query = db.query(CandidateSelectionModel).options(
-			joinedload(CandidateSelectionModel.candidate),
-			joinedload(CandidateSelectionModel.persona),
-			joinedload(CandidateSelectionModel.job_description),
-			joinedload(CandidateSelectionModel.selector)
-		)
-		
-		# Apply filters
+		filters = []
 		if persona_id:
-			query = query.filter(CandidateSelectionModel.persona_id == persona_id)
+			filters.append(CandidateSelectionModel.persona_id == persona_id)
 		if job_description_id:
-			query = query.filter(CandidateSelectionModel.job_description_id == job_description_id)
+			filters.append(CandidateSelectionModel.job_description_id == job_description_id)
 		if status:
-			query = query.filter(CandidateSelectionModel.status == status)
-		
-		# Get total count before pagination
-		total = query.count()
-		
-		# Apply pagination and ordering
-		selections = (
-			query
-			.order_by(CandidateSelectionModel.created_at.desc())
+			filters.append(CandidateSelectionModel.status == status)
+
+		loader_options = (
+			selectinload(CandidateSelectionModel.candidate),
+			selectinload(CandidateSelectionModel.persona),
+			selectinload(CandidateSelectionModel.job_description),
+			selectinload(CandidateSelectionModel.selector)
+		)
+		order = (CandidateSelectionModel.created_at.desc(), CandidateSelectionModel.id.desc())
+
+		if after is not None:
+			# Seek past the cursor; the window count would only see the rows
+			# after it, so the filtered total comes from its own COUNT
+			selections = db.execute(
+				select(CandidateSelectionModel)
+				.options(*loader_options)
+				.where(
+					*filters,
+					tuple_(CandidateSelectionModel.created_at, CandidateSelectionModel.id) < tuple_(*after)
+				)
+				.order_by(*order)
+				.limit(limit)
+			).scalars().all()
+			total = db.execute(
+				select(func.count()).select_from(CandidateSelectionModel).where(*filters)
+			).scalar_one()
+			return list(selections), total
+
+		# The total rides along as a window count so one round-trip returns
+		# both the page and the filtered total. Relationships use selectinload
+		# so the base query stays one row per selection.
+		stmt = (
+			select(CandidateSelectionModel, func.count().over().label("total"))
+			.options(*loader_options)
+			.where(*filters)
+			.order_by(*order)
 			.offset(skip)
 			.limit(limit)
-			.all()
 		)
-		
-		return selections, total
+		rows = db.execute(stmt).all()
+		if rows:
+			return [row[0] for row in rows], rows[0].total
+
+		# An empty page carries no window value; only a page past the end
+		# needs the separate count to report the real total.
+		if skip <= 0:
+			return [], 0
+		total = db.execute(
+			select(func.count()).select_from(CandidateSelectionModel).where(*filters)
+		).scalar_one()
+		return [], total
+
+	def list_selection_projection(
+		self,
+		db: Session,
+		persona_id: Optional[str] = None,
+		job_description_id: Optional[str] = None,
+		status: Optional[str] = None,
+		skip: int = 0,
+		limit: int = 100,
+		after: Optional[Cursor] = None
+	) -> Tuple[Sequence[RowMapping], int]:
+		"""List selections as plain rows holding only the list-view columns.
+
+		Filtering and paging match `list_selections`. Candidate, persona and
+		selector fields are joined in as columns (persona_job_description_id
+		is there for access checks), so no ORM instances are built.
+
+		Returns:
+			Tuple of (list of row mappings, total count)
+		"""
+		filters = []
+		if persona_id:
+			filters.append(CandidateSelectionModel.persona_id == persona_id)
+		if job_description_id:
+			filters.append(CandidateSelectionModel.job_description_id == job_description_id)
+		if status:
+			filters.append(CandidateSelectionModel.status == status)
+
+		columns = (
+			CandidateSelectionModel.id,
+			CandidateSelectionModel.candidate_id,
+			CandidateModel.full_name.label("candidate_full_name"),
+			CandidateModel.email.label("candidate_email"),
+			CandidateModel.phone.label("candidate_phone"),
+			CandidateSelectionModel.persona_id,
+			PersonaModel.name.label("persona_name"),
+			PersonaModel.job_description_id.label("persona_job_description_id"),
+			CandidateSelectionModel.job_description_id,
+			CandidateSelectionModel.status,
+			CandidateSelectionModel.priority,
+			CandidateSelectionModel.selection_notes,
+			CandidateSelectionModel.selected_by,
+			UserModel.first_name.label("selected_by_first_name"),
+			UserModel.last_name.label("selected_by_last_name"),
+			UserModel.email.label("selected_by_email"),
+			CandidateSelectionModel.created_at
+		)
+		order = (CandidateSelectionModel.created_at.desc(), CandidateSelectionModel.id.desc())
+
+		def _select(*extra):
+			return (
+				select(*columns, *extra)
+				.join(CandidateModel, CandidateSelectionModel.candidate_id == CandidateModel.id)
+				.outerjoin(PersonaModel, CandidateSelectionModel.persona_id == PersonaModel.id)
+				.outerjoin(UserModel, CandidateSelectionModel.selected_by == UserModel.id)
+				.where(*filters)
+				.order_by(*order)
+			)
 
-	def update(self, db: Session, selection: CandidateSelectionModel) -> CandidateSelectionModel:
-		"""Update a candidate selection."""
+		def _count() -> int:
+			return db.execute(
+				select(func.count()).select_from(CandidateSelectionModel).where(*filters)
+			).scalar_one()
+
+		if after is not None:
+			rows = db.execute(
+				_select()
+				.where(tuple_(CandidateSelectionModel.created_at, CandidateSelectionModel.id) < tuple_(*after))
+				.limit(limit)
+			).mappings().all()
+			return rows, _count()
+
+		# Window count for the total, as in list_selections
+		rows = db.execute(
+			_select(func.count().over().label("total")).offset(skip).limit(limit)
+		).mappings().all()
+		if rows:
+			return rows, rows[0]["total"]
+		return rows, (_count() if skip > 0 else 0)
+
+	def update(self, db: Session, selection: CandidateSelectionModel, commit: bool = True) -> CandidateSelectionModel:
+		"""Update a candidate selection; pass commit=False to defer to the caller's unit of work."""
 		db.add(selection)
-		db.commit()
-		db.refresh(selection)
+		if not commit:
+			db.flush()
+			return selection
+		commit_keep_loaded(db, selection)
 		return selection
 
 	def delete(self, db: Session, selection_id: str) -> bool:
-		"""Delete a candidate selection by ID."""
+		"""Delete a candidate selection by ID without loading it first."""
 		try:
-			selection = self.get(db, selection_id)
-			if selection:
-				db.delete(selection)
-				db.commit()
-				return True
-			return False
+			# The audit_logs FK cascades on Postgres, but SQLite does not enforce
+			# it; remove the history explicitly as the ORM cascade used to.
+			db.execute(
+				delete(CandidateSelectionAuditLogModel)
+				.where(CandidateSelectionAuditLogModel.selection_id == selection_id)
+			)
+			result = db.execute(delete(CandidateSelectionModel).where(CandidateSelectionModel.id == selection_id))
+			db.commit()
+			count_cache.invalidate(CandidateSelectionAuditLogModel.__tablename__)
+			return result.rowcount > 0
 		except Exception as e:
 			db.rollback()
 			raise e
 
 	def bulk_create(self, db: Session, selections: List[CandidateSelectionModel]) -> List[CandidateSelectionModel]:
-		"""Bulk create candidate selections."""
+		"""Bulk create candidate selections.
+
+		The flush batches the INSERTs (server defaults come back via RETURNING
+		with eager_defaults); after commit one IN query reloads every row
+		instead of a refresh() per selection.
+		"""
 		try:
 			db.add_all(selections)
+			db.flush()
+			ids = [selection.id for selection in selections]
 			db.commit()
-			for selection in selections:
-				db.refresh(selection)
+			if ids:
+				db.execute(
+					select(CandidateSelectionModel).where(CandidateSelectionModel.id.in_(ids))
+				).scalars().all()
 			return selections
 		except Exception as e:
 			db.rollback()
@@ -430,7 +633,10 @@ class SQLAlchemyCandidateSelectionRepository(CandidateSelectionRepository):
 class CandidateSelectionAuditLogRepository:
 	"""Repository interface for Candidate Selection Audit Log aggregates."""
 
-	def create(self, db: Session, audit_log: CandidateSelectionAuditLogModel) -> CandidateSelectionAuditLogModel:
+	def create(self, db: Session, audit_log: CandidateSelectionAuditLogModel, commit: bool = True) -> CandidateSelectionAuditLogModel:
+		raise NotImplementedError
+
+	def bulk_create(self, db: Session, audit_logs: List[CandidateSelectionAuditLogModel], commit: bool = True) -> List[CandidateSelectionAuditLogModel]:
 		raise NotImplementedError
 
 	def get_by_selection_id(
@@ -438,7 +644,8 @@ class CandidateSelectionAuditLogRepository:
 		db: Session, 
 		selection_id: str,
 		skip: int = 0,
-		limit: int = 100
+		limit: int = 100,
+		after: Optional[Cursor] = None
 	) -> Sequence[CandidateSelectionAuditLogModel]:
 		raise NotImplementedError
 
@@ -449,37 +656,80 @@ class CandidateSelectionAuditLogRepository:
 class SQLAlchemyCandidateSelectionAuditLogRepository(CandidateSelectionAuditLogRepository):
 	"""SQLAlchemy-backed implementation of CandidateSelectionAuditLogRepository."""
 
-	def create(self, db: Session, audit_log: CandidateSelectionAuditLogModel) -> CandidateSelectionAuditLogModel:
-		"""Create a new audit log entry."""
+	def create(self, db: Session, audit_log: CandidateSelectionAuditLogModel, commit: bool = True) -> CandidateSelectionAuditLogModel:
+		"""Create a new audit log entry; pass commit=False to defer to the caller's unit of work."""
 		db.add(audit_log)
-		db.commit()
-		db.refresh(audit_log)
+		if not commit:
+			db.flush()
+			invalidate_on_commit(db, CandidateSelectionAuditLogModel.__tablename__)
+			return audit_log
+		commit_keep_loaded(db, audit_log)
+		count_cache.invalidate(CandidateSelectionAuditLogModel.__tablename__)
 		return audit_log
 
+	def bulk_create(self, db: Session, audit_logs: List[CandidateSelectionAuditLogModel], commit: bool = True) -> List[CandidateSelectionAuditLogModel]:
+		"""Insert several audit log entries with one batched INSERT and a single commit.
+
+		Entries are write-only history, so they are not refreshed afterwards.
+		Pass commit=False to defer to the caller's unit of work.
+		"""
+		if not audit_logs:
+			return audit_logs
+		if not commit:
+			db.add_all(audit_logs)
+			db.flush()
+			invalidate_on_commit(db, CandidateSelectionAuditLogModel.__tablename__)
+			return audit_logs
+		try:
+			db.add_all(audit_logs)
+			db.commit()
+			count_cache.invalidate(CandidateSelectionAuditLogModel.__tablename__)
+			return audit_logs
+		except Exception as e:
+			db.rollback()
+			raise e
+
 	def get_by_selection_id(
 		self, 
 		db: Session, 
 		selection_id: str,
 		skip: int = 0,
-		limit: int = 100
+		limit: int = 100,
+		after: Optional[Cursor] = None
 	) -> Sequence[CandidateSelectionAuditLogModel]:
-		"""Get audit logs for a specific selection, ordered by creation time (oldest first)."""
-		return (
+		"""Get audit logs for a specific selection, ordered by creation time (oldest first).
+
+		Pass `after` (the previous page's last (created_at, id)) for keyset
+		pagination; `skip` is ignored then.
+		"""
+		query = (
 			db.query(CandidateSelectionAuditLogModel)
 			.options(
 				joinedload(CandidateSelectionAuditLogModel.changer)
 			)
 			.filter(CandidateSelectionAuditLogModel.selection_id == selection_id)
-			.order_by(CandidateSelectionAuditLogModel.created_at.asc())
-			.offset(skip)
+		)
+		if after is not None:
+			query = query.filter(
+				tuple_(CandidateSelectionAuditLogModel.created_at, CandidateSelectionAuditLogModel.id) > tuple_(*after)
+			)
+		else:
+			query = query.offset(skip)
+		return (
+			query
+			.order_by(CandidateSelectionAuditLogModel.created_at.asc(), CandidateSelectionAuditLogModel.id.asc())
 			.limit(limit)
 			.all()
 		)
 
 	def count_by_selection_id(self, db: Session, selection_id: str) -> int:
-		"""Count audit logs for a specific selection."""
-		return (
-			db.query(CandidateSelectionAuditLogModel)
-			.filter(CandidateSelectionAuditLogModel.selection_id == selection_id)
-			.count()
+		"""Count audit logs for a specific selection (cached briefly)."""
+		return count_cache.get_or_compute(
+			CandidateSelectionAuditLogModel.__tablename__,
+			selection_id,
+			lambda: (
+				db.query(CandidateSelectionAuditLogModel)
+				.filter(CandidateSelectionAuditLogModel.selection_id == selection_id)
+				.count()
+			)
 		)
@@ -1,7 +1,20 @@
 # app/repositories/candidate_selection_status_repo.py
 from typing import List, Optional
+from sqlalchemy import delete
 from sqlalchemy.orm import Session
 from app.db.models.candidate_selection_status import CandidateSelectionStatusModel
+from app.core.config import settings
+from app.core.count_cache import count_cache
+from app.core.snapshot_cache import SnapshotCache
+from app.db.commit import commit_keep_loaded
+
+
+# Snapshot of the (small, rarely written) status table in display order
+_status_cache = SnapshotCache(
+	CandidateSelectionStatusModel,
+	(CandidateSelectionStatusModel.display_order.asc(), CandidateSelectionStatusModel.name.asc()),
+	settings.status_cache_ttl_seconds,
+)
 
 
 class CandidateSelectionStatusRepository:
@@ -10,14 +23,11 @@ class CandidateSelectionStatusRepository:
 	def create(self, db: Session, status_data: dict) -> CandidateSelectionStatusModel:
 		"""Create a new candidate selection status."""
 		try:
-			# Convert is_active boolean to string for SQLite compatibility
-			if 'is_active' in status_data and isinstance(status_data['is_active'], bool):
-				status_data['is_active'] = "true" if status_data['is_active'] else "false"
-			
 			status = CandidateSelectionStatusModel(**status_data)
 			db.add(status)
-			db.commit()
-			db.refresh(status)
+			commit_keep_loaded(db, status)
+			_status_cache.invalidate()
+			count_cache.invalidate(CandidateSelectionStatusModel.__tablename__)
 			return status
 		except Exception as e:
 			db.rollback()
@@ -40,7 +50,7 @@ class CandidateSelectionStatusRepository:
 		query = db.query(CandidateSelectionStatusModel)
 		
 		if active_only:
-			query = query.filter(CandidateSelectionStatusModel.is_active == "true")
+			query = query.filter(CandidateSelectionStatusModel.is_active == True)
 		
 		return query.order_by(
 			CandidateSelectionStatusModel.display_order.asc(),
@@ -50,7 +60,7 @@ class CandidateSelectionStatusRepository:
 	def get_active(self, db: Session) -> List[CandidateSelectionStatusModel]:
 		"""Get all active statuses ordered by display_order."""
 		return db.query(CandidateSelectionStatusModel).filter(
-			CandidateSelectionStatusModel.is_active == "true"
+			CandidateSelectionStatusModel.is_active == True
 		).order_by(
 			CandidateSelectionStatusModel.display_order.asc(),
 			CandidateSelectionStatusModel.name.asc()
@@ -60,33 +70,54 @@ class CandidateSelectionStatusRepository:
 		"""Update an existing status."""
 		try:
 			db.add(status)
-			db.commit()
-			db.refresh(status)
+			commit_keep_loaded(db, status)
+			_status_cache.invalidate()
+			# is_active may have flipped, which changes the active-only total
+			count_cache.invalidate(CandidateSelectionStatusModel.__tablename__)
 			return status
 		except Exception as e:
 			db.rollback()
 			raise e
 	
 	def delete(self, db: Session, status_id: str) -> bool:
-		"""Delete a status."""
+		"""Delete a status with a single DELETE statement."""
 		try:
-			status = self.get_by_id(db, status_id)
-			if not status:
-				return False
-			
-			db.delete(status)
+			result = db.execute(
+				delete(CandidateSelectionStatusModel).where(CandidateSelectionStatusModel.id == status_id)
+			)
 			db.commit()
-			return True
+			_status_cache.invalidate()
+			count_cache.invalidate(CandidateSelectionStatusModel.__tablename__)
+			return result.rowcount > 0
 		except Exception as e:
 			db.rollback()
 			raise e
 	
 	def count(self, db: Session, active_only: bool = False) -> int:
-		"""Count total number of statuses."""
+		"""Count total number of statuses (cached briefly)."""
 		query = db.query(CandidateSelectionStatusModel)
 		
 		if active_only:
-			query = query.filter(CandidateSelectionStatusModel.is_active == "true")
+			query = query.filter(CandidateSelectionStatusModel.is_active == True)
 		
-		return query.count()
-
+		return count_cache.get_or_compute(
+			CandidateSelectionStatusModel.__tablename__, ("active_only", active_only), query.count
+		)
+	
+	def get_cached_by_id(self, db: Session, status_id: str) -> Optional[CandidateSelectionStatusModel]:
+		"""Read-only lookup by ID from the status cache (detached instance)."""
+		for row in _status_cache.rows(db):
+			if row["id"] == status_id:
+				return CandidateSelectionStatusModel(**row)
+		return None
+	
+	def get_cached_by_code(self, db: Session, code: str) -> Optional[CandidateSelectionStatusModel]:
+		"""Read-only lookup by code from the status cache (detached instance)."""
+		for row in _status_cache.rows(db):
+			if row["code"] == code:
+				return CandidateSelectionStatusModel(**row)
+		return None
+	
+	def get_cached_active(self, db: Session) -> List[CandidateSelectionStatusModel]:
+		"""Read-only active statuses in display order from the status cache."""
+		return [CandidateSelectionStatusModel(**row) for row in _status_cache.rows(db) if row["is_active"]]
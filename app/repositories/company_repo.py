@@ -1,8 +1,44 @@
 # app/repositories/company_repo.py
 from typing import List, Optional, Dict, Any
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_, func
+from sqlalchemy import and_, or_, func, delete, bindparam, select
 from app.db.models.company import CompanyModel
+from app.db.models.job_description import JobDescriptionModel
+from app.core.count_cache import count_cache, criteria_key
+from app.db.commit import commit_keep_loaded
+
+
+# Case-insensitive uniqueness lookups, built once at import
+_COMPANY_BY_NAME = select(CompanyModel).where(func.lower(CompanyModel.name) == bindparam("value")).limit(1)
+_COMPANY_BY_EMAIL = select(CompanyModel).where(func.lower(CompanyModel.email_address) == bindparam("value")).limit(1)
+_COMPANY_BY_WEBSITE = select(CompanyModel).where(func.lower(CompanyModel.website_url) == bindparam("value")).limit(1)
+
+# Search criteria keys and the columns they match case-insensitively
+_SEARCH_COLUMNS = (
+    ("name_contains", CompanyModel.name),
+    ("city_contains", CompanyModel.city),
+    ("country_contains", CompanyModel.country),
+)
+
+
+def _search_terms(search_criteria: Dict[str, Any]) -> Dict[str, str]:
+    """Lower-case and trim the supported search criteria once."""
+    return {
+        key: str(search_criteria[key]).lower().strip()
+        for key, _ in _SEARCH_COLUMNS
+        if key in search_criteria
+    }
+
+
+def _search_filters(terms: Dict[str, str]) -> list:
+    """LIKE filters with named bind parameters, so every search with the same
+    set of criteria compiles to the same statement."""
+    return [
+        func.lower(column).contains(bindparam(key, terms[key]))
+        for key, column in _SEARCH_COLUMNS
+        if key in terms
+    ]
+
 
 class CompanyRepository:
     """Repository for Company data access operations."""
@@ -12,8 +48,8 @@ class CompanyRepository:
         try:
             company = CompanyModel(**company_data)
             db.add(company)
-            db.commit()
-            db.refresh(company)
+            commit_keep_loaded(db, company)
+            count_cache.invalidate(CompanyModel.__tablename__)
             return company
         except Exception as e:
             db.rollback()
@@ -25,21 +61,15 @@ class CompanyRepository:
     
     def get_by_name(self, db: Session, name: str) -> Optional[CompanyModel]:
         """Get company by name (case-insensitive)."""
-        return db.query(CompanyModel).filter(
-            func.lower(CompanyModel.name) == name.lower().strip()
-        ).first()
+        return db.execute(_COMPANY_BY_NAME, {"value": name.lower().strip()}).scalars().first()
     
     def get_by_email(self, db: Session, email: str) -> Optional[CompanyModel]:
         """Get company by email address (case-insensitive)."""
-        return db.query(CompanyModel).filter(
-            func.lower(CompanyModel.email_address) == email.lower().strip()
-        ).first()
+        return db.execute(_COMPANY_BY_EMAIL, {"value": email.lower().strip()}).scalars().first()
     
     def get_by_website(self, db: Session, website_url: str) -> Optional[CompanyModel]:
         """Get company by website URL (case-insensitive)."""
-        return db.query(CompanyModel).filter(
-            func.lower(CompanyModel.website_url) == website_url.lower().strip()
-        ).first()
+        return db.execute(_COMPANY_BY_WEBSITE, {"value": website_url.lower().strip()}).scalars().first()
     
     def get_all(self, db: Session, skip: int = 0, limit: int = 100) -> List[CompanyModel]:
         """Get all companies with pagination."""
@@ -47,124 +77,107 @@ class CompanyRepository:
     
     def search(self, db: Session, search_criteria: Dict[str, Any], skip: int = 0, limit: int = 100) -> List[CompanyModel]:
         """Search companies based on criteria."""
-        query = db.query(CompanyModel)
-        
-        # Apply search filters
-        if 'name_contains' in search_criteria:
-            query = query.filter(
-                func.lower(CompanyModel.name).contains(search_criteria['name_contains'])
-            )
-        
-        if 'city_contains' in search_criteria:
-            query = query.filter(
-                func.lower(CompanyModel.city).contains(search_criteria['city_contains'])
-            )
-        
-        if 'country_contains' in search_criteria:
-            query = query.filter(
-                func.lower(CompanyModel.country).contains(search_criteria['country_contains'])
-            )
-        
-        # Apply pagination
-        return query.offset(skip).limit(limit).all()
+        filters = _search_filters(_search_terms(search_criteria))
+        return db.query(CompanyModel).filter(*filters).offset(skip).limit(limit).all()
     
     def count(self, db: Session) -> int:
-        """Count total number of companies."""
-        return db.query(CompanyModel).count()
+        """Count total number of companies (cached briefly)."""
+        return count_cache.get_or_compute(
+            CompanyModel.__tablename__, "all", lambda: db.query(CompanyModel).count()
+        )
     
     def count_search(self, db: Session, search_criteria: Dict[str, Any]) -> int:
-        """Count companies matching search criteria."""
-        query = db.query(CompanyModel)
-        
-        # Apply search filters
-        if 'name_contains' in search_criteria:
-            query = query.filter(
-                func.lower(CompanyModel.name).contains(search_criteria['name_contains'])
-            )
+        """Count companies matching search criteria (cached briefly per criteria)."""
+        terms = _search_terms(search_criteria)
         
-        if 'city_contains' in search_criteria:
-            query = query.filter(
-                func.lower(CompanyModel.city).contains(search_criteria['city_contains'])
-            )
+        def _count() -> int:
+            return db.query(CompanyModel).filter(*_search_filters(terms)).count()
         
-        if 'country_contains' in search_criteria:
-            query = query.filter(
-                func.lower(CompanyModel.country).contains(search_criteria['country_contains'])
-            )
-        
-        return query.count()
+        # Keyed on the normalized terms so differently-cased searches share an entry
+        return count_cache.get_or_compute(
+            CompanyModel.__tablename__, ("search", criteria_key(terms)), _count
+        )
     
     def update(self, db: Session, company: CompanyModel) -> CompanyModel:
-        """Update an existing company."""
+        """Update an existing company; an unchanged company is returned without a round-trip."""
         try:
-            db.commit()
-            db.refresh(company)
+            if company not in db:
+                # Not tracked by this session (e.g. loaded elsewhere); copy its state in
+                company = db.merge(company)
+            elif not db.is_modified(company):
+                # PATCH that re-saved identical values: nothing to write
+                return company
+            commit_keep_loaded(db, company)
+            count_cache.invalidate(CompanyModel.__tablename__)
             return company
         except Exception as e:
             db.rollback()
             raise e
     
     def delete(self, db: Session, company_id: str) -> bool:
-        """Delete a company by ID."""
+        """Delete a company by ID with a single DELETE statement."""
         try:
-            company = self.get_by_id(db, company_id)
-            if company:
-                db.delete(company)
-                db.commit()
-                return True
-            return False
+            # CompanyService refuses to delete companies that still have job
+            # descriptions, so there is no ORM cascade to run here
+            result = db.execute(delete(CompanyModel).where(CompanyModel.id == company_id))
+            db.commit()
+            count_cache.invalidate(CompanyModel.__tablename__)
+            return result.rowcount > 0
         except Exception as e:
             db.rollback()
             raise e
     
     def check_name_exists(self, db: Session, name: str, exclude_id: Optional[str] = None) -> bool:
         """Check if company name exists (excluding specific ID)."""
-        query = db.query(CompanyModel).filter(
+        query = db.query(CompanyModel.id).filter(
             func.lower(CompanyModel.name) == name.lower().strip()
         )
         
         if exclude_id:
             query = query.filter(CompanyModel.id != exclude_id)
         
-        return query.first() is not None
+        # SELECT EXISTS(...) returns one boolean instead of a full company row
+        return db.query(query.exists()).scalar()
     
     def check_email_exists(self, db: Session, email: str, exclude_id: Optional[str] = None) -> bool:
         """Check if company email exists (excluding specific ID)."""
         if not email:
             return False
         
-        query = db.query(CompanyModel).filter(
+        query = db.query(CompanyModel.id).filter(
             func.lower(CompanyModel.email_address) == email.lower().strip()
         )
         
         if exclude_id:
             query = query.filter(CompanyModel.id != exclude_id)
         
-        return query.first() is not None
+        return db.query(query.exists()).scalar()
     
     def check_website_exists(self, db: Session, website_url: str, exclude_id: Optional[str] = None) -> bool:
         """Check if company website exists (excluding specific ID)."""
         if not website_url:
             return False
         
-        query = db.query(CompanyModel).filter(
+        query = db.query(CompanyModel.id).filter(
             func.lower(CompanyModel.website_url) == website_url.lower().strip()
         )
         
         if exclude_id:
             query = query.filter(CompanyModel.id != exclude_id)
         
-        return query.first() is not None
+        return db.query(query.exists()).scalar()
     
     def get_companies_with_job_descriptions(self, db: Session) -> List[CompanyModel]:
         """Get companies that have associated job descriptions."""
-        return db.query(CompanyModel).join(
-            CompanyModel.job_descriptions
-        ).distinct().all()
+        # DISTINCT over the narrow FK column rather than joined company rows
+        company_ids = db.query(JobDescriptionModel.company_id).filter(
+            JobDescriptionModel.company_id.isnot(None)
+        ).distinct()
+        return db.query(CompanyModel).filter(CompanyModel.id.in_(company_ids)).all()
     
     def has_job_descriptions(self, db: Session, company_id: str) -> bool:
         """Check if company has associated job descriptions."""
-        company = self.get_by_id(db, company_id)
-        if company:
-            return len(company.job_descriptions) > 0
-        return False
+        # One index probe on job_descriptions.company_id; no company or JD rows loaded
+        return db.query(
+            db.query(JobDescriptionModel.id).filter(JobDescriptionModel.company_id == company_id).exists()
+        ).scalar()
@@ -1,17 +1,105 @@
 from __future__ import annotations
 
-from typing import Optional, Sequence, Set
-from app.db.models.user import UserModel
-from sqlalchemy.orm import Session, joinedload, selectinload, defer
-from sqlalchemy import select, func
-import time
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+from sqlalchemy.orm import Session, joinedload, selectinload, load_only, raiseload
+from sqlalchemy import select, func, tuple_, inspect
 
 from app.db.models.job_description import JobDescriptionModel
 from app.db.models.persona import PersonaModel
 from app.db.models.jd_hiring_manager import JDHiringManagerMappingModel
 from app.db.models.user import UserModel
-from app.core.logger import logger
 from app.core.authorization import get_jd_access_filter
+from app.core.count_cache import count_cache
+from app.db.commit import commit_keep_loaded
+from app.utils.pagination import Cursor
+
+
+# Loader options for every JD list query:
+# 1. load_only the columns list views render (JDListItem); everything else,
+#    notably the large original/refined/selected text fields and any column
+#    added later, stays out of the SELECT
+# 2. selectinload for the root JD's many-to-one relationships (job_role,
+#    creator, updater): one small IN query per relationship on the target's
+#    primary key instead of widening every page row with three joined tables
+#    (single-row get() keeps its joinedload)
+# 3. selectinload for one-to-many relationships to avoid a cartesian product,
+#    with personas likewise limited to their PersonaListItem columns
+# 4. raiseload for everything else, so an unplanned lazy load (or a read of
+#    an unloaded JD column) fails loudly instead of adding one query per row.
+#    Paths that need more start from get(), or add e.g.
+#    undefer(JobDescriptionModel.refined_text) to their own query.
+_JD_LIST_OPTIONS = (
+	load_only(
+		JobDescriptionModel.id,
+		JobDescriptionModel.title,
+		JobDescriptionModel.role_id,
+		JobDescriptionModel.company_id,
+		JobDescriptionModel.notes,
+		JobDescriptionModel.tags,
+		JobDescriptionModel.selected_version,
+		JobDescriptionModel.selected_edited,
+		JobDescriptionModel.original_document_filename,
+		JobDescriptionModel.original_document_size,
+		JobDescriptionModel.original_document_extension,
+		JobDescriptionModel.document_word_count,
+		JobDescriptionModel.document_character_count,
+		JobDescriptionModel.created_at,
+		JobDescriptionModel.created_by,
+		JobDescriptionModel.updated_at,
+		JobDescriptionModel.updated_by,
+		raiseload=True,
+	),
+	selectinload(JobDescriptionModel.job_role),
+	selectinload(JobDescriptionModel.creator),
+	selectinload(JobDescriptionModel.updater),
+	selectinload(JobDescriptionModel.personas).options(
+		load_only(
+			PersonaModel.id,
+			PersonaModel.job_description_id,
+			PersonaModel.name,
+			PersonaModel.created_at,
+			PersonaModel.created_by,
+			PersonaModel.updated_at,
+			PersonaModel.updated_by,
+		),
+		joinedload(PersonaModel.creator),
+		joinedload(PersonaModel.updater),
+	),
+	# The mapping's manager is many-to-one, but a nested selectinload keeps the
+	# batched mapping query join-free; managers come in one IN query of their own
+	selectinload(JobDescriptionModel.hiring_manager_mappings).selectinload(JDHiringManagerMappingModel.hiring_manager),
+	raiseload("*"),
+)
+
+
+# Loader options for score-context lookups, which only render the JD title
+# and fall back to its role name; nothing else is selected or loaded
+_JD_TITLE_OPTIONS = (
+	load_only(JobDescriptionModel.id, JobDescriptionModel.title, JobDescriptionModel.role_id, raiseload=True),
+	selectinload(JobDescriptionModel.job_role),
+	raiseload("*"),
+)
+
+
+# Detail-only columns that list queries leave unloaded
+_JD_TEXT_FIELDS = frozenset({"original_text", "refined_text", "selected_text"})
+
+# Upper bound on ids per IN (...) in get_many
+_GET_MANY_CHUNK = 500
+
+
+def _page(query, skip: int, limit: int, after: Optional[Cursor]):
+	"""Newest-first page of `query` (not yet executed).
+
+	With `after` (the previous page's last (created_at, id)) the page seeks
+	past it on idx_jd_created_at_id instead of scanning `skip` rows; `skip`
+	is ignored then.
+	"""
+	if after is not None:
+		query = query.filter(tuple_(JobDescriptionModel.created_at, JobDescriptionModel.id) < tuple_(*after))
+	else:
+		query = query.offset(skip)
+	return query.order_by(JobDescriptionModel.created_at.desc(), JobDescriptionModel.id.desc()).limit(limit)
 
 
 class JobDescriptionRepository:
@@ -20,6 +108,15 @@ class JobDescriptionRepository:
 	def get(self, db: Session, jd_id: str) -> Optional[JobDescriptionModel]:
 		raise NotImplementedError
 
+	def get_with_role(self, db: Session, jd_id: str) -> Optional[JobDescriptionModel]:
+		raise NotImplementedError
+
+	def get_many(self, db: Session, jd_ids: Iterable[str]) -> Dict[str, JobDescriptionModel]:
+		raise NotImplementedError
+
+	def get_many_titles(self, db: Session, jd_ids: Iterable[str]) -> Dict[str, JobDescriptionModel]:
+		raise NotImplementedError
+
 	def create(self, db: Session, jd: JobDescriptionModel) -> JobDescriptionModel:
 		raise NotImplementedError
 
@@ -35,7 +132,7 @@ class JobDescriptionRepository:
 	def list_by_creator(self, db: Session, user_id: str) -> Sequence[JobDescriptionModel]:
 		raise NotImplementedError
 
-	def list_by_role_id(self, db: Session, role_id: str, skip: int = 0, limit: int = 100, optimized: bool = True) -> Sequence[JobDescriptionModel]:
+	def list_by_role_id(self, db: Session, role_id: str, skip: int = 0, limit: int = 100) -> Sequence[JobDescriptionModel]:
 		raise NotImplementedError
 
 	def count(self, db: Session) -> int:
@@ -45,81 +142,89 @@ class JobDescriptionRepository:
 class SQLAlchemyJobDescriptionRepository(JobDescriptionRepository):
 	"""SQLAlchemy-backed implementation of JobDescriptionRepository."""
 
+	def _get(self, db: Session, jd_id: str, options: list) -> Optional[JobDescriptionModel]:
+		jd = db.get(JobDescriptionModel, jd_id, options=options)
+		if jd is not None and inspect(jd).unloaded & _JD_TEXT_FIELDS:
+			# Already in the session from a list query (load_only + raiseload);
+			# reload it in full rather than hand out the list-shaped instance
+			jd = db.get(JobDescriptionModel, jd_id, options=options, populate_existing=True)
+		return jd
+
 	def get(self, db: Session, jd_id: str) -> Optional[JobDescriptionModel]:
-		return db.query(JobDescriptionModel).options(joinedload(JobDescriptionModel.job_role)).filter(JobDescriptionModel.id == jd_id).first()
+		"""Single-table primary-key lookup; relationships load lazily if touched."""
+		return self._get(db, jd_id, [])
+
+	def get_with_role(self, db: Session, jd_id: str) -> Optional[JobDescriptionModel]:
+		"""get() with job_role joined in, for callers that render the role."""
+		return self._get(db, jd_id, [joinedload(JobDescriptionModel.job_role)])
+
+	def _get_many(self, db: Session, jd_ids: Iterable[str], options: Sequence) -> Dict[str, JobDescriptionModel]:
+		# One IN query per _GET_MANY_CHUNK ids, keeping well under driver bind
+		# parameter limits; missing ids are simply absent from the result
+		ids = list(dict.fromkeys(jd_ids))
+		found: Dict[str, JobDescriptionModel] = {}
+		for start in range(0, len(ids), _GET_MANY_CHUNK):
+			rows = db.execute(
+				select(JobDescriptionModel)
+				.options(*options)
+				.where(JobDescriptionModel.id.in_(ids[start:start + _GET_MANY_CHUNK]))
+			).scalars().all()
+			found.update((jd.id, jd) for jd in rows)
+		return found
+
+	def get_many(self, db: Session, jd_ids: Iterable[str]) -> Dict[str, JobDescriptionModel]:
+		"""Load several JDs for list-style rendering (_JD_LIST_OPTIONS), keyed by id.
+
+		Relationships arrive in a fixed number of batched queries rather than
+		one get() per JD.
+		"""
+		return self._get_many(db, jd_ids, _JD_LIST_OPTIONS)
+
+	def get_many_titles(self, db: Session, jd_ids: Iterable[str]) -> Dict[str, JobDescriptionModel]:
+		"""Load several JDs with only id, title, role_id and job_role, keyed by id."""
+		return self._get_many(db, jd_ids, _JD_TITLE_OPTIONS)
 
 	def create(self, db: Session, jd: JobDescriptionModel) -> JobDescriptionModel:
 		db.add(jd)
-		db.commit()
-		db.refresh(jd)
+		commit_keep_loaded(db, jd)
+		count_cache.invalidate(JobDescriptionModel.__tablename__)
 		return jd
 
 	def update(self, db: Session, jd: JobDescriptionModel) -> JobDescriptionModel:
 		db.add(jd)
-		db.commit()
-		db.refresh(jd)
+		commit_keep_loaded(db, jd)
 		return jd
 
 	def list_by_company(self, db: Session, company_id: str) -> Sequence[JobDescriptionModel]:
 		return (
 			db.query(JobDescriptionModel)
+			.options(*_JD_LIST_OPTIONS)
 			.filter(JobDescriptionModel.company_id == company_id)
 			.order_by(JobDescriptionModel.created_at.desc())
 			.all()
 		)
 
-	def list_all(self, db: Session, skip: int = 0, limit: int = 100) -> Sequence[JobDescriptionModel]:
-		return db.query(JobDescriptionModel).options(joinedload(JobDescriptionModel.job_role)).order_by(JobDescriptionModel.created_at.desc()).offset(skip).limit(limit).all()
-	
-	def list_all_optimized(self, db: Session, skip: int = 0, limit: int = 100) -> Sequence[JobDescriptionModel]:
-		"""
-		Optimized query for listing JDs that efficiently loads relationships.
-		Key optimizations:
-		1. Uses selectinload for personas to avoid cartesian product (joinedload creates duplicates)
-		2. Defers loading large text fields (original_text, refined_text, selected_text)
-		3. Uses joinedload for many-to-one relationships (job_role, creator)
-		
-		This should be significantly faster than the previous implementation.
-		"""
-		return (
-			db.query(JobDescriptionModel)
-			.options(
-				# Defer loading large text fields - they won't be loaded unless accessed
-				defer(JobDescriptionModel.original_text),
-				defer(JobDescriptionModel.refined_text),
-				defer(JobDescriptionModel.selected_text),
-				# Use joinedload for many-to-one relationships (efficient, no duplicates)
-				joinedload(JobDescriptionModel.job_role),
-				joinedload(JobDescriptionModel.creator),
-				joinedload(JobDescriptionModel.updater),
-				# Use selectinload for one-to-many relationships to avoid cartesian product
-				# Defer heavy persona text fields; load creator/updater and hiring managers
-				selectinload(JobDescriptionModel.personas).options(
-					defer(PersonaModel.persona_notes),
-					defer(PersonaModel.weights),
-					defer(PersonaModel.intervals),
-					joinedload(PersonaModel.creator),
-					joinedload(PersonaModel.updater),
-				),
-				# Load hiring manager mappings and linked users
-				selectinload(JobDescriptionModel.hiring_manager_mappings).joinedload(JDHiringManagerMappingModel.hiring_manager),
-			)
-			.order_by(JobDescriptionModel.created_at.desc())
-			.offset(skip)
-			.limit(limit)
-			.all()
-		)
+	def list_all(self, db: Session, skip: int = 0, limit: int = 100, after: Optional[Cursor] = None) -> Sequence[JobDescriptionModel]:
+		"""List JDs for list views; large text fields are deferred (see _JD_LIST_OPTIONS)."""
+		return _page(db.query(JobDescriptionModel).options(*_JD_LIST_OPTIONS), skip, limit, after).all()
 
 	def list_by_creator(self, db: Session, user_id: str) -> Sequence[JobDescriptionModel]:
 		return (
 			db.query(JobDescriptionModel)
-			.options(joinedload(JobDescriptionModel.job_role))
+			.options(*_JD_LIST_OPTIONS)
 			.filter(JobDescriptionModel.created_by == user_id)
 			.order_by(JobDescriptionModel.created_at.desc())
 			.all()
 		)
 
-	def list_by_role_id(self, db: Session, role_id: str, skip: int = 0, limit: int = 100, optimized: bool = True) -> Sequence[JobDescriptionModel]:
+	def list_by_role_id(
+		self,
+		db: Session,
+		role_id: str,
+		skip: int = 0,
+		limit: int = 100,
+		after: Optional[Cursor] = None
+	) -> Sequence[JobDescriptionModel]:
 		"""
 		List job descriptions filtered by role_id.
 		
@@ -128,60 +233,40 @@ class SQLAlchemyJobDescriptionRepository(JobDescriptionRepository):
 			role_id: Job role ID to filter by
 			skip: Pagination offset
 			limit: Pagination limit
-			optimized: Whether to use optimized query (excludes large text fields)
+			after: Keyset cursor from the previous page; replaces skip
 			
 		Returns:
 			Sequence of JobDescriptionModel instances filtered by role_id
+			(large text fields deferred)
 		"""
-		query = db.query(JobDescriptionModel).filter(JobDescriptionModel.role_id == role_id)
-		
-		if optimized:
-			query = query.options(
-				# Defer loading large text fields
-				defer(JobDescriptionModel.original_text),
-				defer(JobDescriptionModel.refined_text),
-				defer(JobDescriptionModel.selected_text),
-				# Use joinedload for many-to-one relationships
-				joinedload(JobDescriptionModel.job_role),
-				joinedload(JobDescriptionModel.creator),
-				joinedload(JobDescriptionModel.updater),
-				# Use selectinload for one-to-many relationships
-				selectinload(JobDescriptionModel.personas).options(
-					defer(PersonaModel.persona_notes),
-					defer(PersonaModel.weights),
-					defer(PersonaModel.intervals),
-					joinedload(PersonaModel.creator),
-					joinedload(PersonaModel.updater),
-				),
-				selectinload(JobDescriptionModel.hiring_manager_mappings).joinedload(JDHiringManagerMappingModel.hiring_manager),
-			)
-		else:
-			query = query.options(
-				joinedload(JobDescriptionModel.job_role),
-				joinedload(JobDescriptionModel.creator),
-				joinedload(JobDescriptionModel.updater),
-				selectinload(JobDescriptionModel.personas).options(
-					defer(PersonaModel.persona_notes),
-					defer(PersonaModel.weights),
-					defer(PersonaModel.intervals),
-					joinedload(PersonaModel.creator),
-					joinedload(PersonaModel.updater),
-				),
-				selectinload(JobDescriptionModel.hiring_manager_mappings).joinedload(JDHiringManagerMappingModel.hiring_manager),
-			)
-		
-		return query.order_by(JobDescriptionModel.created_at.desc()).offset(skip).limit(limit).all()
+		query = (
+			db.query(JobDescriptionModel)
+			.options(*_JD_LIST_OPTIONS)
+			.filter(JobDescriptionModel.role_id == role_id)
+		)
+		return _page(query, skip, limit, after).all()
 
 	def count(self, db: Session) -> int:
 		"""
 		Optimized count query using func.count() with primary key.
 		This is more efficient than .count() as it uses the primary key index
-		and doesn't require a full table scan.
+		and doesn't require a full table scan. The total is cached briefly
+		(see app/core/count_cache.py).
 		"""
-		result = db.query(func.count(JobDescriptionModel.id)).scalar()
-		return result or 0
+		return count_cache.get_or_compute(
+			JobDescriptionModel.__tablename__,
+			"all",
+			lambda: db.query(func.count(JobDescriptionModel.id)).scalar() or 0
+		)
 	
-	def list_accessible(self, db: Session, user: UserModel, skip: int = 0, limit: int = 100) -> Sequence[JobDescriptionModel]:
+	def list_accessible(
+		self,
+		db: Session,
+		user: UserModel,
+		skip: int = 0,
+		limit: int = 100,
+		after: Optional[Cursor] = None
+	) -> Sequence[JobDescriptionModel]:
 		"""
 		List JDs accessible to a user based on their role.
 		
@@ -193,36 +278,19 @@ class SQLAlchemyJobDescriptionRepository(JobDescriptionRepository):
 			user: User to filter access for
 			skip: Pagination offset
 			limit: Pagination limit
+			after: Keyset cursor from the previous page; replaces skip
 			
 		Returns:
 			Sequence of accessible JobDescriptionModel instances
 		"""
-		query = (
-			db.query(JobDescriptionModel)
-			.options(
-				defer(JobDescriptionModel.original_text),
-				defer(JobDescriptionModel.refined_text),
-				defer(JobDescriptionModel.selected_text),
-				joinedload(JobDescriptionModel.job_role),
-				joinedload(JobDescriptionModel.creator),
-				joinedload(JobDescriptionModel.updater),
-				selectinload(JobDescriptionModel.personas).options(
-					defer(PersonaModel.persona_notes),
-					defer(PersonaModel.weights),
-					defer(PersonaModel.intervals),
-					joinedload(PersonaModel.creator),
-					joinedload(PersonaModel.updater),
-				),
-				selectinload(JobDescriptionModel.hiring_manager_mappings).joinedload(JDHiringManagerMappingModel.hiring_manager),
-			)
-		)
+		query = db.query(JobDescriptionModel).options(*_JD_LIST_OPTIONS)
 		
 		# Apply access filter using SQL JOIN/subquery (more efficient than fetching all IDs)
 		access_filter = get_jd_access_filter(db, user)
 		if access_filter is not None:
 			query = query.filter(access_filter)
 		
-		return query.order_by(JobDescriptionModel.created_at.desc()).offset(skip).limit(limit).all()
+		return _page(query, skip, limit, after).all()
 	
 	def count_accessible(self, db: Session, user: UserModel) -> int:
 		"""
@@ -235,27 +303,65 @@ class SQLAlchemyJobDescriptionRepository(JobDescriptionRepository):
 			user: User to filter access for
 			
 		Returns:
-			Count of accessible JDs
+			Count of accessible JDs (cached briefly per user and role,
+			see app/core/count_cache.py)
 		"""
-		query = db.query(func.count(JobDescriptionModel.id))
+		def _count() -> int:
+			query = db.query(func.count(JobDescriptionModel.id))
+			
+			# Apply access filter using SQL JOIN/subquery (more efficient than fetching all IDs)
+			access_filter = get_jd_access_filter(db, user)
+			if access_filter is not None:
+				query = query.filter(access_filter)
+			
+			return query.scalar() or 0
 		
-		# Apply access filter using SQL JOIN/subquery (more efficient than fetching all IDs)
+		role_name = user.role.name.lower().strip() if user.role and user.role.name else None
+		return count_cache.get_or_compute(
+			JobDescriptionModel.__tablename__, ("accessible", user.id, role_name), _count
+		)
+	
+	def list_and_count_accessible(
+		self,
+		db: Session,
+		user: UserModel,
+		skip: int = 0,
+		limit: int = 100,
+		after: Optional[Cursor] = None
+	) -> Tuple[List[JobDescriptionModel], int]:
+		"""
+		A page of accessible JDs plus the total, building the access filter once.
+		
+		Without `after` the total rides along as a window count, so the list
+		endpoint gets both from one query instead of list_accessible +
+		count_accessible.
+		
+		Returns:
+			Tuple of (page of JDs, total accessible count)
+		"""
+		filters = []
 		access_filter = get_jd_access_filter(db, user)
 		if access_filter is not None:
-			query = query.filter(access_filter)
+			filters.append(access_filter)
 		
-		result = query.scalar()
-		return result or 0
-	
-	def delete(self, db: Session, jd_id: str) -> bool:
-		"""Delete a job description by ID."""
-		try:
-			jd = self.get(db, jd_id)
-			if jd:
-				db.delete(jd)
-				db.commit()
-				return True
-			return False
-		except Exception as e:
-			db.rollback()
-			raise e
+		if after is not None:
+			# The window would only see rows past the cursor
+			rows = _page(
+				db.query(JobDescriptionModel).options(*_JD_LIST_OPTIONS).filter(*filters), skip, limit, after
+			).all()
+			total = db.query(func.count(JobDescriptionModel.id)).filter(*filters).scalar() or 0
+			return rows, total
+		
+		rows = _page(
+			db.query(JobDescriptionModel, func.count().over().label("total"))
+			.options(*_JD_LIST_OPTIONS)
+			.filter(*filters),
+			skip, limit, None
+		).all()
+		if rows:
+			return [row[0] for row in rows], rows[0].total
+		# An empty page carries no window value; only a page past the end
+		# needs the separate count to report the real total
+		if skip <= 0:
+			return [], 0
+		return [], db.query(func.count(JobDescriptionModel.id)).filter(*filters).scalar() or 0
@@ -1,8 +1,35 @@
 # app/repositories/job_role_repo.py
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_, func
+from sqlalchemy import func, select, bindparam, delete
 from app.db.models.job_role import JobRoleModel
+from app.db.models.job_description import JobDescriptionModel
+
+
+# Built once at import; the name is bound per call rather than inlined, so
+# every lookup shares one cached compiled statement
+_JOB_ROLE_BY_NAME = (
+    select(JobRoleModel)
+    .where(func.lower(JobRoleModel.name) == bindparam("name"))
+    .limit(1)
+)
+
+
+def _search_filters(search_criteria: Dict[str, Any]) -> list:
+    """Filters for search/count_search; text terms are normalized once here."""
+    filters = []
+    if 'name_contains' in search_criteria:
+        filters.append(
+            func.lower(JobRoleModel.name).contains(str(search_criteria['name_contains']).lower().strip())
+        )
+    if 'category_contains' in search_criteria:
+        filters.append(
+            func.lower(JobRoleModel.category).contains(str(search_criteria['category_contains']).lower().strip())
+        )
+    if 'is_active' in search_criteria:
+        filters.append(JobRoleModel.is_active == bool(search_criteria['is_active']))
+    return filters
+
 
 class JobRoleRepository:
     """Repository for Job Role data access operations."""
@@ -21,13 +48,11 @@ class JobRoleRepository:
     
     def get_by_id(self, db: Session, job_role_id: str) -> Optional[JobRoleModel]:
         """Get job role by ID."""
-        return db.query(JobRoleModel).filter(JobRoleModel.id == job_role_id).first()
+        return db.get(JobRoleModel, job_role_id)
     
     def get_by_name(self, db: Session, name: str) -> Optional[JobRoleModel]:
         """Get job role by name (case-insensitive)."""
-        return db.query(JobRoleModel).filter(
-            func.lower(JobRoleModel.name) == name.lower().strip()
-        ).first()
+        return db.execute(_JOB_ROLE_BY_NAME, {"name": name.lower().strip()}).scalars().first()
     
     def get_all(self, db: Session, skip: int = 0, limit: int = 100) -> List[JobRoleModel]:
         """Get all job roles with pagination."""
@@ -36,7 +61,7 @@ class JobRoleRepository:
     def get_active(self, db: Session, skip: int = 0, limit: int = 100) -> List[JobRoleModel]:
         """Get all active job roles with pagination."""
         return db.query(JobRoleModel).filter(
-            JobRoleModel.is_active == "true"
+            JobRoleModel.is_active == True
         ).offset(skip).limit(limit).all()
     
     def get_by_category(self, db: Session, category: str, skip: int = 0, limit: int = 100) -> List[JobRoleModel]:
@@ -47,54 +72,43 @@ class JobRoleRepository:
     
     def search(self, db: Session, search_criteria: Dict[str, Any], skip: int = 0, limit: int = 100) -> List[JobRoleModel]:
         """Search job roles based on criteria."""
-        query = db.query(JobRoleModel)
-        
-        # Apply search filters
-        if 'name_contains' in search_criteria:
-            query = query.filter(
-                func.lower(JobRoleModel.name).contains(search_criteria['name_contains'])
-            )
-        
-        if 'category_contains' in search_criteria:
-            query = query.filter(
-                func.lower(JobRoleModel.category).contains(search_criteria['category_contains'])
-            )
-        
-        if 'is_active' in search_criteria:
-            is_active_str = "true" if search_criteria['is_active'] else "false"
-            query = query.filter(JobRoleModel.is_active == is_active_str)
+        return db.query(JobRoleModel).filter(*_search_filters(search_criteria)).offset(skip).limit(limit).all()
+    
+    def search_with_total(self, db: Session, search_criteria: Dict[str, Any], skip: int = 0, limit: int = 100) -> Tuple[List[JobRoleModel], int]:
+        """Search job roles and count all matches in the same query.
         
-        # Apply pagination
-        return query.offset(skip).limit(limit).all()
+        Returns:
+            Tuple of (page of job roles, total matching count)
+        """
+        filters = _search_filters(search_criteria)
+        # The total rides along as a window count, so the filtered set is
+        # scanned once for both the page and the total
+        rows = (
+            db.query(JobRoleModel, func.count().over().label("total"))
+            .filter(*filters)
+            .offset(skip)
+            .limit(limit)
+            .all()
+        )
+        if rows:
+            return [row[0] for row in rows], rows[0].total
+        # An empty page carries no window value; only a page past the end
+        # needs the separate count to report the real total
+        if skip <= 0:
+            return [], 0
+        return [], db.query(func.count(JobRoleModel.id)).filter(*filters).scalar() or 0
     
     def count(self, db: Session) -> int:
         """Count total number of job roles."""
-        return db.query(JobRoleModel).count()
+        return db.query(func.count(JobRoleModel.id)).scalar() or 0
     
     def count_active(self, db: Session) -> int:
         """Count active job roles."""
-        return db.query(JobRoleModel).filter(JobRoleModel.is_active == "true").count()
+        return db.query(func.count(JobRoleModel.id)).filter(JobRoleModel.is_active == True).scalar() or 0
     
     def count_search(self, db: Session, search_criteria: Dict[str, Any]) -> int:
         """Count job roles matching search criteria."""
-        query = db.query(JobRoleModel)
-        
-        # Apply search filters
-        if 'name_contains' in search_criteria:
-            query = query.filter(
-                func.lower(JobRoleModel.name).contains(search_criteria['name_contains'])
-            )
-        
-        if 'category_contains' in search_criteria:
-            query = query.filter(
-                func.lower(JobRoleModel.category).contains(search_criteria['category_contains'])
-            )
-        
-        if 'is_active' in search_criteria:
-            is_active_str = "true" if search_criteria['is_active'] else "false"
-            query = query.filter(JobRoleModel.is_active == is_active_str)
-        
-        return query.count()
+        return db.query(func.count(JobRoleModel.id)).filter(*_search_filters(search_criteria)).scalar() or 0
     
     def update(self, db: Session, job_role: JobRoleModel) -> JobRoleModel:
         """Update an existing job role."""
@@ -107,41 +121,42 @@ class JobRoleRepository:
             raise e
     
     def delete(self, db: Session, job_role_id: str) -> bool:
-        """Delete a job role by ID."""
+        """Delete a job role by ID with a single DELETE statement.
+
+        Roles still referenced by job descriptions are rejected by the service
+        (and by the role_id foreign key), so there is nothing to cascade.
+        """
         try:
-            job_role = self.get_by_id(db, job_role_id)
-            if job_role:
-                db.delete(job_role)
-                db.commit()
-                return True
-            return False
+            result = db.execute(delete(JobRoleModel).where(JobRoleModel.id == job_role_id))
+            db.commit()
+            return result.rowcount > 0
         except Exception as e:
             db.rollback()
             raise e
     
     def check_name_exists(self, db: Session, name: str, exclude_id: Optional[str] = None) -> bool:
         """Check if job role name exists (excluding specific ID)."""
-        query = db.query(JobRoleModel).filter(
+        query = db.query(JobRoleModel.id).filter(
             func.lower(JobRoleModel.name) == name.lower().strip()
         )
         
         if exclude_id:
             query = query.filter(JobRoleModel.id != exclude_id)
         
-        return query.first() is not None
+        return db.query(query.exists()).scalar()
     
     def get_job_roles_with_job_descriptions(self, db: Session) -> List[JobRoleModel]:
         """Get job roles that have associated job descriptions."""
-        return db.query(JobRoleModel).join(
-            JobRoleModel.job_descriptions
-        ).distinct().all()
+        # DISTINCT over the narrow FK column rather than joined job role rows
+        role_ids = db.query(JobDescriptionModel.role_id).distinct()
+        return db.query(JobRoleModel).filter(JobRoleModel.id.in_(role_ids)).all()
     
     def has_job_descriptions(self, db: Session, job_role_id: str) -> bool:
         """Check if job role has associated job descriptions."""
-        job_role = self.get_by_id(db, job_role_id)
-        if job_role:
-            return len(job_role.job_descriptions) > 0
-        return False
+        # One probe on idx_jd_role_id instead of loading the role and all its JDs
+        return db.query(
+            db.query(JobDescriptionModel.id).filter(JobDescriptionModel.role_id == job_role_id).exists()
+        ).scalar()
     
     def get_categories(self, db: Session) -> List[str]:
         """Get all unique categories."""
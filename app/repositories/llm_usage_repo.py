@@ -103,7 +103,7 @@ class SQLAlchemyLLMUsageRepository(LLMUsageRepository):
 
     def get_by_id(self, db: Session, usage_id: str) -> Optional[LLMUsageModel]:
         """Get usage record by ID."""
-        return db.query(LLMUsageModel).filter(LLMUsageModel.id == usage_id).first()
+        return db.get(LLMUsageModel, usage_id)
 
     def list_by_user(
         self, 
@@ -192,6 +192,46 @@ class SQLAlchemyLLMUsageRepository(LLMUsageRepository):
             .all()
         )
 
+    def _date_filters(self, start_date: Optional[datetime], end_date: Optional[datetime]) -> list:
+        """created_at range filters shared by the summary queries."""
+        filters = []
+        if start_date:
+            filters.append(LLMUsageModel.created_at >= start_date)
+        if end_date:
+            filters.append(LLMUsageModel.created_at <= end_date)
+        return filters
+
+    def _totals(self, db: Session, filters: list):
+        """(calls, tokens, cost, avg latency) over the matching rows, computed in SQL."""
+        return (
+            db.query(
+                func.count(LLMUsageModel.id),
+                func.coalesce(func.sum(LLMUsageModel.total_tokens), 0),
+                func.coalesce(func.sum(LLMUsageModel.total_cost_usd), 0.0),
+                func.coalesce(func.avg(LLMUsageModel.latency_ms), 0.0),
+            )
+            .filter(*filters)
+            .one()
+        )
+
+    def _bucketed(self, db: Session, filters: list, column) -> dict:
+        """Per-value count/tokens/cost for `column`, one row per group."""
+        rows = (
+            db.query(
+                column,
+                func.count(LLMUsageModel.id),
+                func.coalesce(func.sum(LLMUsageModel.total_tokens), 0),
+                func.coalesce(func.sum(LLMUsageModel.total_cost_usd), 0.0),
+            )
+            .filter(*filters)
+            .group_by(column)
+            .all()
+        )
+        return {
+            key: {"count": count, "tokens": int(tokens), "cost_usd": float(cost_usd)}
+            for key, count, tokens, cost_usd in rows
+        }
+
     def get_user_summary(
         self,
         db: Session,
@@ -199,17 +239,12 @@ class SQLAlchemyLLMUsageRepository(LLMUsageRepository):
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None
     ) -> dict:
-        """Get summary statistics for a user."""
-        query = db.query(LLMUsageModel).filter(LLMUsageModel.user_id == user_id)
+        """Get summary statistics for a user (aggregated in the database)."""
+        filters = [LLMUsageModel.user_id == user_id, *self._date_filters(start_date, end_date)]
         
-        if start_date:
-            query = query.filter(LLMUsageModel.created_at >= start_date)
-        if end_date:
-            query = query.filter(LLMUsageModel.created_at <= end_date)
-        
-        results = query.all()
+        total_calls, total_tokens, total_cost_usd, avg_latency_ms = self._totals(db, filters)
         
-        if not results:
+        if not total_calls:
             return {
                 "total_calls": 0,
                 "total_tokens": 0,
@@ -218,31 +253,12 @@ class SQLAlchemyLLMUsageRepository(LLMUsageRepository):
                 "by_action_type": {}
             }
         
-        total_calls = len(results)
-        total_tokens = sum(r.total_tokens for r in results)
-        total_cost_usd = sum(r.total_cost_usd for r in results)
-        avg_latency_ms = sum(r.latency_ms for r in results) / total_calls if total_calls > 0 else 0.0
-        
-        # Group by action type
-        by_action_type = {}
-        for record in results:
-            action_type = record.action_type
-            if action_type not in by_action_type:
-                by_action_type[action_type] = {
-                    "count": 0,
-                    "tokens": 0,
-                    "cost_usd": 0.0
-                }
-            by_action_type[action_type]["count"] += 1
-            by_action_type[action_type]["tokens"] += record.total_tokens
-            by_action_type[action_type]["cost_usd"] += record.total_cost_usd
-        
         return {
             "total_calls": total_calls,
-            "total_tokens": total_tokens,
-            "total_cost_usd": round(total_cost_usd, 6),
-            "avg_latency_ms": round(avg_latency_ms, 2),
-            "by_action_type": by_action_type
+            "total_tokens": int(total_tokens),
+            "total_cost_usd": round(float(total_cost_usd), 6),
+            "avg_latency_ms": round(float(avg_latency_ms), 2),
+            "by_action_type": self._bucketed(db, filters, LLMUsageModel.action_type)
         }
 
     def get_total_usage(
@@ -251,17 +267,12 @@ class SQLAlchemyLLMUsageRepository(LLMUsageRepository):
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None
     ) -> dict:
-        """Get total usage statistics across all users."""
-        query = db.query(LLMUsageModel)
-        
-        if start_date:
-            query = query.filter(LLMUsageModel.created_at >= start_date)
-        if end_date:
-            query = query.filter(LLMUsageModel.created_at <= end_date)
+        """Get total usage statistics across all users (aggregated in the database)."""
+        filters = self._date_filters(start_date, end_date)
         
-        results = query.all()
+        total_calls, total_tokens, total_cost_usd, avg_latency_ms = self._totals(db, filters)
         
-        if not results:
+        if not total_calls:
             return {
                 "total_calls": 0,
                 "total_tokens": 0,
@@ -271,45 +282,14 @@ class SQLAlchemyLLMUsageRepository(LLMUsageRepository):
                 "by_user": {}
             }
         
-        total_calls = len(results)
-        total_tokens = sum(r.total_tokens for r in results)
-        total_cost_usd = sum(r.total_cost_usd for r in results)
-        avg_latency_ms = sum(r.latency_ms for r in results) / total_calls if total_calls > 0 else 0.0
-        
-        # Group by action type
-        by_action_type = {}
-        for record in results:
-            action_type = record.action_type
-            if action_type not in by_action_type:
-                by_action_type[action_type] = {
-                    "count": 0,
-                    "tokens": 0,
-                    "cost_usd": 0.0
-                }
-            by_action_type[action_type]["count"] += 1
-            by_action_type[action_type]["tokens"] += record.total_tokens
-            by_action_type[action_type]["cost_usd"] += record.total_cost_usd
-        
-        # Group by user
-        by_user = {}
-        for record in results:
-            user_id = record.user_id or "anonymous"
-            if user_id not in by_user:
-                by_user[user_id] = {
-                    "count": 0,
-                    "tokens": 0,
-                    "cost_usd": 0.0
-                }
-            by_user[user_id]["count"] += 1
-            by_user[user_id]["tokens"] += record.total_tokens
-            by_user[user_id]["cost_usd"] += record.total_cost_usd
+        # Records without a user are reported under "anonymous"
+        by_user = self._bucketed(db, filters, func.coalesce(LLMUsageModel.user_id, "anonymous"))
         
         return {
             "total_calls": total_calls,
-            "total_tokens": total_tokens,
-            "total_cost_usd": round(total_cost_usd, 6),
-            "avg_latency_ms": round(avg_latency_ms, 2),
-            "by_action_type": by_action_type,
+            "total_tokens": int(total_tokens),
+            "total_cost_usd": round(float(total_cost_usd), 6),
+            "avg_latency_ms": round(float(avg_latency_ms), 2),
+            "by_action_type": self._bucketed(db, filters, LLMUsageModel.action_type),
             "by_user": by_user
         }
-
@@ -2,9 +2,25 @@ from __future__ import annotations
 
 from typing import Optional, Sequence
 from sqlalchemy.orm import Session
-from sqlalchemy import asc
+from sqlalchemy import asc, select, bindparam
 
 from app.db.models.persona import PersonaLevelModel
+from app.core.config import settings
+from app.core.snapshot_cache import SnapshotCache
+
+
+_PERSONA_LEVEL_BY_NAME = (
+    select(PersonaLevelModel)
+    .where(PersonaLevelModel.name == bindparam("name"))
+    .limit(1)
+)
+
+# Snapshot of the (small, rarely written) persona level table in position order
+_level_cache = SnapshotCache(
+    PersonaLevelModel,
+    (asc(PersonaLevelModel.position), asc(PersonaLevelModel.name)),
+    settings.persona_level_cache_ttl_seconds,
+)
 
 
 class PersonaLevelRepository:
@@ -36,10 +52,10 @@ class SQLAlchemyPersonaLevelRepository(PersonaLevelRepository):
     """SQLAlchemy-backed implementation of PersonaLevelRepository."""
 
     def get(self, db: Session, level_id: str) -> Optional[PersonaLevelModel]:
-        return db.query(PersonaLevelModel).filter(PersonaLevelModel.id == level_id).first()
+        return db.get(PersonaLevelModel, level_id)
 
     def get_by_name(self, db: Session, name: str) -> Optional[PersonaLevelModel]:
-        return db.query(PersonaLevelModel).filter(PersonaLevelModel.name == name).first()
+        return db.execute(_PERSONA_LEVEL_BY_NAME, {"name": name}).scalars().first()
 
     def get_by_position(self, db: Session, position: int) -> Optional[PersonaLevelModel]:
         return db.query(PersonaLevelModel).filter(PersonaLevelModel.position == position).first()
@@ -47,12 +63,14 @@ class SQLAlchemyPersonaLevelRepository(PersonaLevelRepository):
     def create(self, db: Session, level: PersonaLevelModel) -> PersonaLevelModel:
         db.add(level)
         db.commit()
+        _level_cache.invalidate()
         db.refresh(level)
         return level
 
     def update(self, db: Session, level: PersonaLevelModel) -> PersonaLevelModel:
         db.add(level)
         db.commit()
+        _level_cache.invalidate()
         db.refresh(level)
         return level
 
@@ -61,15 +79,14 @@ class SQLAlchemyPersonaLevelRepository(PersonaLevelRepository):
         if level:
             db.delete(level)
             db.commit()
+            _level_cache.invalidate()
             return True
         return False
 
     def list_all(self, db: Session) -> Sequence[PersonaLevelModel]:
-        return db.query(PersonaLevelModel).all()
+        """Read-only levels from the level cache (transient instances)."""
+        return self.list_by_position(db)
 
     def list_by_position(self, db: Session) -> Sequence[PersonaLevelModel]:
-        return (
-            db.query(PersonaLevelModel)
-            .order_by(asc(PersonaLevelModel.position), asc(PersonaLevelModel.name))
-            .all()
-        )
+        """Read-only levels in position order from the level cache (transient instances)."""
+        return [PersonaLevelModel(**row) for row in _level_cache.rows(db)]
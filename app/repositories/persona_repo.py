@@ -1,8 +1,8 @@
 from __future__ import annotations
 
 from typing import Optional, Sequence, List, Set
-from sqlalchemy.orm import Session, selectinload, joinedload
-from sqlalchemy import func, or_, and_, exists
+from sqlalchemy.orm import Session, selectinload, joinedload, raiseload
+from sqlalchemy import func, exists, select, union_all, tuple_, bindparam
 
 from app.db.models.persona import (
 	PersonaModel, PersonaCategoryModel, PersonaSubcategoryModel,
@@ -12,6 +12,94 @@ from app.db.models.job_description import JobDescriptionModel
 from app.db.models.score import CandidateScoreModel
 from app.db.models.user import UserModel
 from app.db.models.jd_hiring_manager import JDHiringManagerMappingModel
+from app.core.count_cache import count_cache
+from app.db.commit import commit_keep_loaded
+from app.utils.pagination import Cursor
+
+
+# Loader options for queries rendered as PersonaRead: exactly the graph the
+# schema walks, one batched query per level. Many-to-one hops (JD, users, a
+# category's notes, a subcategory's level and skillset) are joined; the
+# persona-level skillsets/notes/change_logs collections are not rendered and
+# are left to lazy loading on the update/delete paths that touch them.
+_PERSONA_READ_OPTIONS = (
+	# jd_name and the *_by_name fields are all the schema takes from these;
+	# the JD's text columns in particular are never pulled into a persona read
+	joinedload(PersonaModel.job_description).load_only(JobDescriptionModel.title),
+	joinedload(PersonaModel.creator).load_only(UserModel.first_name, UserModel.last_name, UserModel.email),
+	joinedload(PersonaModel.updater).load_only(UserModel.first_name, UserModel.last_name, UserModel.email),
+	selectinload(PersonaModel.categories).options(
+		joinedload(PersonaCategoryModel.notes),
+		selectinload(PersonaCategoryModel.subcategories).options(
+			joinedload(PersonaSubcategoryModel.level),
+			joinedload(PersonaSubcategoryModel.skillset),
+		),
+	),
+)
+
+# Read-only list queries: anything outside the PersonaRead graph raises
+# instead of lazy-loading per row. get() keeps plain _PERSONA_READ_OPTIONS
+# because the update/delete paths walk further from the persona it returns.
+_PERSONA_LIST_OPTIONS = _PERSONA_READ_OPTIONS + (raiseload("*"),)
+
+# Detail and by-JD reads, built once at import so the loader tree is not
+# rebuilt per call and the compiled SQL is reused from the statement cache
+_PERSONA_BY_ID = (
+	select(PersonaModel)
+	.options(*_PERSONA_READ_OPTIONS)
+	.where(PersonaModel.id == bindparam("persona_id"))
+	.limit(1)
+)
+_PERSONAS_BY_JD = (
+	select(PersonaModel)
+	.options(*_PERSONA_LIST_OPTIONS)
+	.where(PersonaModel.job_description_id == bindparam("jd_id"))
+	.order_by(PersonaModel.name.asc())
+)
+
+
+def _role_name(user: UserModel) -> Optional[str]:
+	role_name = user.role.name if user.role else None
+	return role_name.lower().strip() if role_name else None
+
+
+def _apply_access_filter(query, user: UserModel):
+	"""
+	Restrict a persona query to JDs the user can access.
+	
+	Admins and recruiters see everything; hiring managers see personas for JDs
+	they created or are assigned to. Returns None for an unknown role, which
+	has no access at all.
+	"""
+	role_name = _role_name(user)
+	if role_name in ("admin", "recruiter"):
+		return query
+	if role_name in ("hiring manager", "hiring_manager"):
+		# The user's JD ids as one uncorrelated set (created UNION ALL assigned),
+		# each half an index lookup; personas semi-join against it instead of
+		# evaluating a correlated EXISTS per JD row
+		accessible_jd_ids = union_all(
+			select(JobDescriptionModel.id).where(JobDescriptionModel.created_by == user.id),
+			select(JDHiringManagerMappingModel.job_description_id).where(
+				JDHiringManagerMappingModel.hiring_manager_id == user.id
+			),
+		)
+		return query.filter(PersonaModel.job_description_id.in_(accessible_jd_ids))
+	return None
+
+
+def _page(query, skip: int, limit: int, after: Optional[Cursor]):
+	"""Newest-first page of `query` (not yet executed).
+
+	With `after` (the previous page's last (created_at, id)) the page seeks
+	past it on idx_personas_created_at_id instead of scanning `skip` rows;
+	`skip` is ignored then.
+	"""
+	if after is not None:
+		query = query.filter(tuple_(PersonaModel.created_at, PersonaModel.id) < tuple_(*after))
+	else:
+		query = query.offset(skip)
+	return query.order_by(PersonaModel.created_at.desc(), PersonaModel.id.desc()).limit(limit)
 
 
 class PersonaRepository:
@@ -36,6 +124,10 @@ class PersonaRepository:
 		"""Find a persona by name within a specific job description."""
 		raise NotImplementedError
 
+	def exists_by_name_and_jd(self, db: Session, name: str, jd_id: str) -> bool:
+		"""Whether a persona with this name (case-insensitive) exists for the JD."""
+		raise NotImplementedError
+
 	# Category-level CRUD
 	def add_category(self, db: Session, category: PersonaCategoryModel) -> PersonaCategoryModel:
 		raise NotImplementedError
@@ -66,53 +158,25 @@ class SQLAlchemyPersonaRepository(PersonaRepository):
 	"""SQLAlchemy-backed implementation of PersonaRepository."""
 
 	def get(self, db: Session, persona_id: str) -> Optional[PersonaModel]:
-		return (
-			db.query(PersonaModel)
-			.options(
-				# Load relationships for list view fields
-				joinedload(PersonaModel.job_description),
-				joinedload(PersonaModel.creator),
-				joinedload(PersonaModel.updater),
-				# Load nested relationships
-				selectinload(PersonaModel.categories).selectinload(PersonaCategoryModel.subcategories),
-				selectinload(PersonaModel.skillsets),
-				selectinload(PersonaModel.notes),
-				selectinload(PersonaModel.change_logs)
-			)
-			.filter(PersonaModel.id == persona_id)
-			.first()
-		)
+		return db.execute(_PERSONA_BY_ID, {"persona_id": persona_id}).scalars().first()
 
-	def create(self, db: Session, persona: PersonaModel) -> PersonaModel:
+	def create(self, db: Session, persona: PersonaModel, commit: bool = True) -> PersonaModel:
+		"""Persist a persona; pass commit=False to defer to the caller's unit of work."""
 		db.add(persona)
-		db.commit()
-		db.refresh(persona)
+		if not commit:
+			db.flush()
+			return persona
+		commit_keep_loaded(db, persona)
+		count_cache.invalidate(PersonaModel.__tablename__)
 		return persona
 
 	def update(self, db: Session, persona: PersonaModel) -> PersonaModel:
 		db.add(persona)
-		db.commit()
-		db.refresh(persona)
+		commit_keep_loaded(db, persona)
 		return persona
 
 	def list_by_jd(self, db: Session, jd_id: str) -> Sequence[PersonaModel]:
-		return (
-			db.query(PersonaModel)
-			.options(
-				# Load relationships for list view fields
-				joinedload(PersonaModel.job_description),
-				joinedload(PersonaModel.creator),
-				joinedload(PersonaModel.updater),
-				# Load nested relationships
-				selectinload(PersonaModel.categories).selectinload(PersonaCategoryModel.subcategories),
-				selectinload(PersonaModel.skillsets),
-				selectinload(PersonaModel.notes),
-				selectinload(PersonaModel.change_logs)
-			)
-			.filter(PersonaModel.job_description_id == jd_id)
-			.order_by(PersonaModel.name.asc())
-			.all()
-		)
+		return db.execute(_PERSONAS_BY_JD, {"jd_id": jd_id}).scalars().all()
 
 	def get_by_job_description(self, db: Session, jd_id: str) -> Sequence[PersonaModel]:
 		return self.list_by_jd(db, jd_id)
@@ -128,27 +192,28 @@ class SQLAlchemyPersonaRepository(PersonaRepository):
 			.first()
 		)
 
-	def list_all(self, db: Session, skip: int = 0, limit: int = 100) -> Sequence[PersonaModel]:
-		"""List all personas with eagerly loaded relationships for list view."""
-		return (
-			db.query(PersonaModel)
-			.options(
-				# Load job_description for JD name
-				joinedload(PersonaModel.job_description),
-				# Load creator for created_by_name
-				joinedload(PersonaModel.creator),
-				# Load updater for updated_by_name
-				joinedload(PersonaModel.updater),
-				# Load categories to avoid N+1 in list views
-				selectinload(PersonaModel.categories),
+	def exists_by_name_and_jd(self, db: Session, name: str, jd_id: str) -> bool:
+		return db.query(
+			exists().where(
+				func.lower(PersonaModel.name) == func.lower(name),
+				PersonaModel.job_description_id == jd_id,
 			)
-			.order_by(PersonaModel.created_at.desc())
-			.offset(skip)
-			.limit(limit)
-			.all()
-		)
+		).scalar()
+
+	def list_all(
+		self, db: Session, skip: int = 0, limit: int = 100, after: Optional[Cursor] = None
+	) -> Sequence[PersonaModel]:
+		"""List all personas with the PersonaRead graph loaded for the list view."""
+		return _page(db.query(PersonaModel).options(*_PERSONA_LIST_OPTIONS), skip, limit, after).all()
 	
-	def list_accessible(self, db: Session, user: UserModel, skip: int = 0, limit: int = 100) -> Sequence[PersonaModel]:
+	def list_accessible(
+		self,
+		db: Session,
+		user: UserModel,
+		skip: int = 0,
+		limit: int = 100,
+		after: Optional[Cursor] = None
+	) -> Sequence[PersonaModel]:
 		"""
 		List personas for JDs accessible to a user based on their role.
 		
@@ -159,47 +224,16 @@ class SQLAlchemyPersonaRepository(PersonaRepository):
 			user: User to filter access for
 			skip: Pagination offset
 			limit: Pagination limit
+			after: Keyset cursor from the previous page; replaces skip
 			
 		Returns:
 			Sequence of accessible PersonaModel instances
 		"""
-		query = (
-			db.query(PersonaModel)
-			.options(
-				joinedload(PersonaModel.job_description),
-				joinedload(PersonaModel.creator),
-				joinedload(PersonaModel.updater),
-				selectinload(PersonaModel.categories),
-			)
-		)
-		
-		# Apply access filter using SQL JOIN/subquery (more efficient than fetching all IDs)
-		role_name = user.role.name if user.role else None
-		if role_name:
-			role_name = role_name.lower().strip()
-		
-		
-		if role_name in ("admin", "recruiter"):
-			# No filter needed - can access all personas
-			pass
-		elif role_name in ("hiring manager", "hiring_manager"):
-			# Filter: Personas for JDs created by user OR assigned to user
-			query = query.join(JobDescriptionModel, PersonaModel.job_description_id == JobDescriptionModel.id).filter(
-				or_(
-					JobDescriptionModel.created_by == user.id,
-					exists().where(
-						and_(
-							JDHiringManagerMappingModel.job_description_id == JobDescriptionModel.id,
-							JDHiringManagerMappingModel.hiring_manager_id == user.id
-						)
-					)
-				)
-			)
-		else:
-			# Unknown role - no access
+		query = _apply_access_filter(db.query(PersonaModel).options(*_PERSONA_LIST_OPTIONS), user)
+		if query is None:
 			return []
 		
-		return query.order_by(PersonaModel.created_at.desc()).offset(skip).limit(limit).all()
+		return _page(query, skip, limit, after).all()
 	
 	def count_accessible(self, db: Session, user: UserModel) -> int:
 		"""
@@ -212,52 +246,41 @@ class SQLAlchemyPersonaRepository(PersonaRepository):
 			user: User to filter access for
 			
 		Returns:
-			Count of accessible personas
+			Count of accessible personas (cached briefly per user and role,
+			see app/core/count_cache.py)
 		"""
-		query = db.query(func.count(PersonaModel.id))
-		
-		# Apply access filter using SQL JOIN/subquery (more efficient than fetching all IDs)
-		role_name = user.role.name if user.role else None
-		if role_name:
-			role_name = role_name.lower().strip()
+		role_name = _role_name(user)
 		
-		if role_name in ("admin", "recruiter"):
-			# No filter needed - can access all personas
-			pass
-		elif role_name in ("hiring manager", "hiring_manager"):
-			# Filter: Personas for JDs created by user OR assigned to user
-			query = query.join(JobDescriptionModel, PersonaModel.job_description_id == JobDescriptionModel.id).filter(
-				or_(
-					JobDescriptionModel.created_by == user.id,
-					exists().where(
-						and_(
-							JDHiringManagerMappingModel.job_description_id == JobDescriptionModel.id,
-							JDHiringManagerMappingModel.hiring_manager_id == user.id
-						)
-					)
-				)
-			)
-		else:
-			# Unknown role - no access
-			return 0
+		def _count() -> int:
+			query = _apply_access_filter(db.query(func.count(PersonaModel.id)), user)
+			if query is None:
+				return 0
+			return query.scalar() or 0
 		
-		result = query.scalar()
-		return result or 0
+		return count_cache.get_or_compute(
+			PersonaModel.__tablename__, ("accessible", user.id, role_name), _count
+		)
 	
 	def count(self, db: Session) -> int:
 		return db.query(PersonaModel).count()
 	
 	def count_candidates_for_persona(self, db: Session, persona_id: str) -> int:
-		"""Count distinct candidates evaluated against a persona."""
-		result = (
-			db.query(func.count(func.distinct(CandidateScoreModel.candidate_id)))
-			.filter(CandidateScoreModel.persona_id == persona_id)
-			.scalar()
-		)
-		return result or 0
+		"""
+		Count distinct candidates evaluated against a single persona.
+		
+		For a list of personas use count_candidates_for_personas once instead
+		of calling this per row.
+		"""
+		return self.count_candidates_for_personas(db, [persona_id])[persona_id]
 
 	def count_candidates_for_personas(self, db: Session, persona_ids: Sequence[str]) -> dict[str, int]:
-		"""Count distinct candidates for multiple personas in one query."""
+		"""
+		Count distinct candidates for multiple personas in one query.
+		
+		Every requested id gets an entry: personas with no scores map to 0
+		rather than being absent, so callers never fall back to a per-persona
+		count for them.
+		"""
 		if not persona_ids:
 			return {}
 		rows = (
@@ -269,43 +292,61 @@ class SQLAlchemyPersonaRepository(PersonaRepository):
 			.group_by(CandidateScoreModel.persona_id)
 			.all()
 		)
-		return {pid: cnt for pid, cnt in rows}
+		counts = dict.fromkeys(persona_ids, 0)
+		counts.update(rows)
+		return counts
 
-	def add_category(self, db: Session, category: PersonaCategoryModel) -> PersonaCategoryModel:
+	def add_category(self, db: Session, category: PersonaCategoryModel, commit: bool = True) -> PersonaCategoryModel:
+		"""Persist a persona category; pass commit=False to defer to the caller's unit of work."""
 		db.add(category)
-		db.commit()
-		db.refresh(category)
+		if not commit:
+			db.flush()
+			return category
+		commit_keep_loaded(db, category)
 		return category
 
-	def add_subcategory(self, db: Session, subcat: PersonaSubcategoryModel) -> PersonaSubcategoryModel:
+	def add_subcategory(self, db: Session, subcat: PersonaSubcategoryModel, commit: bool = True) -> PersonaSubcategoryModel:
+		"""Persist a persona subcategory; pass commit=False to defer to the caller's unit of work."""
 		db.add(subcat)
-		db.commit()
-		db.refresh(subcat)
+		if not commit:
+			db.flush()
+			return subcat
+		commit_keep_loaded(db, subcat)
 		return subcat
 
-	def add_skillset(self, db: Session, skillset: PersonaSkillsetModel) -> PersonaSkillsetModel:
+	def add_skillset(self, db: Session, skillset: PersonaSkillsetModel, commit: bool = True) -> PersonaSkillsetModel:
+		"""Persist a persona skillset; pass commit=False to defer to the caller's unit of work."""
 		db.add(skillset)
-		db.commit()
-		db.refresh(skillset)
+		if not commit:
+			db.flush()
+			return skillset
+		commit_keep_loaded(db, skillset)
 		return skillset
 
-	def add_note(self, db: Session, note: PersonaNotesModel) -> PersonaNotesModel:
+	def add_note(self, db: Session, note: PersonaNotesModel, commit: bool = True) -> PersonaNotesModel:
+		"""Persist a persona note; pass commit=False to defer to the caller's unit of work."""
 		db.add(note)
-		db.commit()
-		db.refresh(note)
+		if not commit:
+			db.flush()
+			return note
+		commit_keep_loaded(db, note)
 		return note
 
-	def add_change_log(self, db: Session, change_log: PersonaChangeLogModel) -> PersonaChangeLogModel:
+	def add_change_log(self, db: Session, change_log: PersonaChangeLogModel, commit: bool = True) -> PersonaChangeLogModel:
+		"""Persist a persona change log entry; pass commit=False to defer to the caller's unit of work."""
 		db.add(change_log)
-		db.commit()
-		db.refresh(change_log)
+		if not commit:
+			db.flush()
+			return change_log
+		commit_keep_loaded(db, change_log)
 		return change_log
 
 	def get_change_logs(self, db: Session, persona_id: str) -> List[PersonaChangeLogModel]:
 		"""Get all change logs for a persona, ordered by most recent first."""
 		return (
 			db.query(PersonaChangeLogModel)
-			.options(selectinload(PersonaChangeLogModel.user))
+			# One user per entry: a JOIN adds no rows and saves the IN round trip
+			.options(joinedload(PersonaChangeLogModel.user))
 			.filter(PersonaChangeLogModel.persona_id == persona_id)
 			.order_by(PersonaChangeLogModel.changed_at.desc())
 			.all()
@@ -316,23 +357,18 @@ class SQLAlchemyPersonaRepository(PersonaRepository):
 		return (
 			db.query(PersonaModel)
 			.join(JobDescriptionModel, PersonaModel.job_description_id == JobDescriptionModel.id)
-			.options(
-				# Load relationships for list view fields
-				joinedload(PersonaModel.job_description),
-				joinedload(PersonaModel.creator),
-				joinedload(PersonaModel.updater),
-				# Load nested relationships
-				selectinload(PersonaModel.categories).selectinload(PersonaCategoryModel.subcategories),
-				selectinload(PersonaModel.skillsets),
-				selectinload(PersonaModel.notes)
-			)
+			.options(*_PERSONA_LIST_OPTIONS)
 			.filter(JobDescriptionModel.role_id == role_id)
 			.order_by(PersonaModel.name.asc())
 			.all()
 		)
 
 	def delete_persona(self, db: Session, persona_id: str) -> None:
-		obj = db.query(PersonaModel).filter(PersonaModel.id == persona_id).first()
+		# Stays an ORM delete: categories, notes and the rest go through the
+		# relationship cascades, which SQLite would not apply to a bare DELETE.
+		# get() skips the SELECT when the persona is already in the session.
+		obj = db.get(PersonaModel, persona_id)
 		if obj:
 			db.delete(obj)
 			db.commit()
+			count_cache.invalidate(PersonaModel.__tablename__)
@@ -67,9 +67,12 @@ class SQLAlchemyPersonaWarningRepository(PersonaWarningRepository):
     def bulk_create(self, db: Session, warnings: List[PersonaWeightWarningModel]) -> List[PersonaWeightWarningModel]:
         """Create multiple warnings in one transaction"""
         db.add_all(warnings)
+        db.flush()
+        ids = [warning.id for warning in warnings]
         db.commit()
-        for warning in warnings:
-            db.refresh(warning)
+        if ids:
+            # One IN query repopulates every expired instance (no refresh per row)
+            db.query(PersonaWeightWarningModel).filter(PersonaWeightWarningModel.id.in_(ids)).all()
         return warnings
     
     def update_persona_id(self, db: Session, old_persona_id: str, new_persona_id: str) -> int:
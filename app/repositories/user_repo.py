@@ -1,11 +1,28 @@
 from __future__ import annotations
 
 from typing import Optional, List
+from sqlalchemy import bindparam, select
 from sqlalchemy.orm import Session, joinedload
 
 from app.db.models.user import UserModel
 
 
+# Built once at import: these run on every authenticated request, and a
+# prebuilt statement skips rebuilding the query and its cache key per call
+_USER_BY_ID = (
+	select(UserModel)
+	.options(joinedload(UserModel.role))
+	.where(UserModel.id == bindparam("user_id"))
+	.limit(1)
+)
+_USER_BY_EMAIL = (
+	select(UserModel)
+	.options(joinedload(UserModel.role))
+	.where(UserModel.email == bindparam("email"))
+	.limit(1)
+)
+
+
 class UserRepository:
 	"""Repository interface for users."""
 
@@ -32,20 +49,10 @@ class SQLAlchemyUserRepository(UserRepository):
 	"""SQLAlchemy-backed user repository."""
 
 	def get_by_id(self, db: Session, user_id: str) -> Optional[UserModel]:
-		return (
-			db.query(UserModel)
-			.options(joinedload(UserModel.role))
-			.filter(UserModel.id == user_id)
-			.first()
-		)
+		return db.execute(_USER_BY_ID, {"user_id": user_id}).scalars().first()
 
 	def get_by_email(self, db: Session, email: str) -> Optional[UserModel]:
-		return (
-			db.query(UserModel)
-			.options(joinedload(UserModel.role))
-			.filter(UserModel.email == email)
-			.first()
-		)
+		return db.execute(_USER_BY_EMAIL, {"email": email}).scalars().first()
 
 	def create(self, db: Session, user: UserModel) -> UserModel:
 		db.add(user)
@@ -107,6 +107,7 @@ class CandidateListResponse(BaseModel):
 	size: int
 	has_next: bool
 	has_prev: bool
+	next_page_token: Optional[str] = None  # Pass back as page_token to seek to the next page
 
 
 class CandidateSearchRequest(BaseModel):
@@ -224,6 +225,7 @@ class SelectedCandidatesListResponse(BaseModel):
 	"""Response schema for listing selected candidates"""
 	selections: List[CandidateSelectionItem]
 	total: int
+	next_page_token: Optional[str] = None  # Pass back as page_token to seek to the next page
 	
 	model_config = ConfigDict(from_attributes=True)
 
@@ -262,6 +264,7 @@ class CandidateSelectionAuditLogListResponse(BaseModel):
 	size: int
 	has_next: bool
 	has_prev: bool
+	next_page_token: Optional[str] = None  # Pass back as page_token to seek to the next page
 	
 	model_config = ConfigDict(from_attributes=True)
 
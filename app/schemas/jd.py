@@ -194,6 +194,7 @@ class JDListResponse(BaseModel):
 	size: int
 	has_next: bool
 	has_prev: bool
+	next_page_token: Optional[str] = None  # Pass back as page_token to seek to the next page
 
 	model_config = ConfigDict(from_attributes=True)
 
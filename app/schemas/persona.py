@@ -173,5 +173,6 @@ class PersonaListResponse(BaseModel):
 	size: int
 	has_next: bool
 	has_prev: bool
+	next_page_token: Optional[str] = None  # Pass back as page_token to seek to the next page
 
 	model_config = ConfigDict(from_attributes=True)
\ No newline at end of file
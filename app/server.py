@@ -0,0 +1,36 @@
+"""Production entry point: ``python -m app.server``.
+
+Most routes and every repository method are synchronous, so FastAPI runs
+them on anyio's worker threadpool; ``threadpool_max_threads`` sizes it
+per worker (applied in the app lifespan). The database pools are sized
+from ``db_max_connections``, a budget for all workers together (see
+``Settings.db_pool_options``); threads beyond a worker's share wait up to
+``db_pool_timeout`` for a connection.
+
+``limit_concurrency`` makes uvicorn answer 503 once that many requests
+are in flight instead of queueing unbounded work behind slow sync
+handlers. ``loop``/``http`` stay on "auto", which picks uvloop and
+httptools when installed (both ship with ``uvicorn[standard]``).
+"""
+
+import uvicorn
+
+from app.core.config import settings
+
+
+def main() -> None:
+	uvicorn.run(
+		"app.main:app",
+		host=settings.server_host,
+		port=settings.server_port,
+		workers=settings.server_worker_count(),
+		limit_concurrency=settings.server_limit_concurrency,
+		backlog=settings.server_backlog,
+		timeout_keep_alive=settings.server_timeout_keep_alive,
+		loop="auto",
+		http="auto",
+	)
+
+
+if __name__ == "__main__":
+	main()
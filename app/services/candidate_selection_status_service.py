@@ -28,7 +28,7 @@ class CandidateSelectionStatusService:
 				"name": data.get("name"),
 				"description": data.get("description"),
 				"display_order": data.get("display_order", 0),
-				"is_active": data.get("is_active", True),
+				"is_active": bool(data.get("is_active", True)),
 				"created_by": data.get("created_by"),
 				"updated_by": data.get("created_by"),  # Set updated_by same as created_by on creation
 			}
@@ -40,20 +40,20 @@ class CandidateSelectionStatusService:
 			raise e
 	
 	def get_by_id(self, db: Session, status_id: str) -> Optional[CandidateSelectionStatusModel]:
-		"""Get status by ID."""
-		return self.repo.get_by_id(db, status_id)
+		"""Get status by ID (served from the status cache; do not modify)."""
+		return self.repo.get_cached_by_id(db, status_id)
 	
 	def get_by_code(self, db: Session, code: str) -> Optional[CandidateSelectionStatusModel]:
-		"""Get status by code."""
-		return self.repo.get_by_code(db, code)
+		"""Get status by code (served from the status cache; do not modify)."""
+		return self.repo.get_cached_by_code(db, code)
 	
 	def list_all(self, db: Session, skip: int = 0, limit: int = 100, active_only: bool = False) -> List[CandidateSelectionStatusModel]:
 		"""List all statuses with pagination."""
 		return self.repo.get_all(db, skip, limit, active_only)
 	
 	def list_active(self, db: Session) -> List[CandidateSelectionStatusModel]:
-		"""List all active statuses."""
-		return self.repo.get_active(db)
+		"""List all active statuses (served from the status cache)."""
+		return self.repo.get_cached_active(db)
 	
 	def update(self, db: Session, status_id: str, data: dict) -> Optional[CandidateSelectionStatusModel]:
 		"""Update an existing status."""
@@ -78,7 +78,7 @@ class CandidateSelectionStatusService:
 			if "display_order" in data:
 				status.display_order = data["display_order"]
 			if "is_active" in data:
-				status.is_active = "true" if data["is_active"] else "false"
+				status.is_active = bool(data["is_active"])
 			if "updated_by" in data:
 				status.updated_by = data["updated_by"]
 			
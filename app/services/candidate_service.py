@@ -1,8 +1,9 @@
 from __future__ import annotations
 
-from typing import Optional, Dict, List, Tuple, Iterable, Any
+from typing import Optional, Dict, List, Tuple, Iterable, Any, Mapping, Sequence
 from uuid import uuid4
 from datetime import datetime
+from sqlalchemy import RowMapping
 from sqlalchemy.orm import Session
 
 from app.db.models.candidate import CandidateModel, CandidateCVModel, CandidateSelectionModel, CandidateSelectionAuditLogModel
@@ -10,6 +11,7 @@ from app.db.models.score import CandidateScoreModel, ScoreStageModel, ScoreCateg
 from app.repositories.candidate_repo import SQLAlchemyCandidateRepository, SQLAlchemyCandidateSelectionRepository, SQLAlchemyCandidateSelectionAuditLogRepository
 from app.repositories.candidate_cv_repo import SQLAlchemyCandidateCVRepository
 from app.repositories.score_repo import SQLAlchemyScoreRepository
+from app.db.commit import commit_keep_loaded
 from app.domain.candidate import services as cand_domain_services
 from app.events.event_bus import event_bus
 from app.events.candidate_events import CVUploadedEvent, ScoreRequestedEvent, ScoreCompletedEvent, CandidateDeletedEvent, CandidateCVDeletedEvent
@@ -21,6 +23,7 @@ from app.utils.cv_utils import (
 )
 from app.utils.cv_extraction import extract_baseline_info_with_timing
 from app.utils.document_parser import DocumentParser
+from app.utils.pagination import decode_page_token
 from app.services.storage import StorageFactory
 from app.core.config import settings
 from app.services.cv_scoring import CVScoringService
@@ -162,11 +165,7 @@ class CandidateService:
 			result["candidate_name"] = candidate.full_name
 			result["email"] = candidate.email
 			
-			# Step 6: Get next version for this candidate
-			version = self.candidate_cvs.get_next_version(db, candidate.id)
-			result["version"] = version
-			
-			# Step 7: Generate S3 key and upload
+			# Step 6: Generate S3 key and upload
 			extension = extract_file_extension(filename)
 			s3_key = generate_s3_key(file_hash, extension)
 			
@@ -184,13 +183,12 @@ class CandidateService:
 			
 			result["s3_url"] = upload_result["url"]
 			
-			# Step 8: Create CV record
+			# Step 7: Create CV record; its version is assigned inside the INSERT
 			cv = CandidateCVModel(
 				id=str(uuid4()),
 				candidate_id=candidate.id,
 				file_name=filename,
 				file_hash=file_hash,
-				version=version,
 				s3_url=upload_result["url"],
 				file_size=len(file_bytes),
 				mime_type=validation["mime_type"],
@@ -200,24 +198,29 @@ class CandidateService:
 				uploaded_by=user_id
 			)
 			
-			created_cv = self.candidate_cvs.create(db, cv)
+			# Flushed only; committed together with the latest_cv_id update below
+			created_cv = self.candidate_cvs.create_next_version(db, cv, commit=False)
 			result["cv_id"] = created_cv.id
+			result["version"] = created_cv.version
 			result["is_new_cv"] = True
 			result["cv_text"] = extracted_text  # Include the extracted text in the response
 			
-			# Step 9: Update candidate's latest_cv_id
+			# Step 8: Update candidate's latest_cv_id
 			candidate.latest_cv_id = created_cv.id
 			candidate.updated_at = datetime.now()
 			candidate.updated_by = user_id
 			self.candidates.update(db, candidate)
 			
-			# Step 10: Publish event
+			# Step 9: Publish event
 			event_bus.publish_event(CVUploadedEvent(candidate_ids=[candidate.id]))
 			
 			result["status"] = "success"
 			return result
 			
 		except Exception as e:
+			# Drop any flushed-but-uncommitted rows so they cannot ride along
+			# with a later commit on this session
+			db.rollback()
 			result["error"] = f"Unexpected error: {str(e)}"
 			return result
 
@@ -248,7 +251,7 @@ class CandidateService:
 
 	def upload(self, db: Session, payloads: Iterable[dict]) -> List[CandidateModel]:
 		"""Legacy method - kept for backward compatibility."""
-		created: List[CandidateModel] = []
+		models: List[CandidateModel] = []
 		for data in (payloads or []):
 			cand_agg = cand_domain_services.create_candidate(
 				id=str(uuid4()),
@@ -273,7 +276,8 @@ class CandidateService:
 				summary=cand_agg.summary,
 				scores=cand_agg.scores,
 			)
-			created.append(self.candidates.create(db, model))
+			models.append(model)
+		created = self.candidates.create_many(db, models)
 		# Publish a batch event with created candidate IDs
 		event_bus.publish_event(CVUploadedEvent(candidate_ids=[c.id for c in created]))
 		return created
@@ -438,9 +442,13 @@ class CandidateService:
 		"""Get a candidate by ID."""
 		return self.candidates.get(db, candidate_id)
 
-	def get_all(self, db: Session, skip: int = 0, limit: int = 100) -> List[CandidateModel]:
-		"""List all candidates with pagination."""
-		return list(self.candidates.list_all(db, skip, limit))
+	def get_all(self, db: Session, skip: int = 0, limit: int = 100, page_token: Optional[str] = None) -> List[CandidateModel]:
+		"""List all candidates with pagination (keyset when `page_token` is given)."""
+		return list(self.candidates.list_all(db, skip, limit, after=decode_page_token(page_token)))
+	
+	def get_all_projection(self, db: Session, skip: int = 0, limit: int = 100, page_token: Optional[str] = None) -> List[RowMapping]:
+		"""List candidates as lightweight rows for the list view (see `get_all`)."""
+		return list(self.candidates.list_projection(db, skip, limit, after=decode_page_token(page_token)))
 	
 	def count(self, db: Session) -> int:
 		"""Count total candidates."""
@@ -454,10 +462,14 @@ class CandidateService:
 		"""Count candidates matching search criteria."""
 		return self.candidates.count_search(db, search_criteria)
 	
-	def get_personas_for_candidate(self, db: Session, candidate_id: str) -> List[dict]:
-		"""Get distinct personas evaluated against a candidate."""
+	def get_personas_for_candidate(self, db: Session, candidate_id: str) -> Sequence[Mapping[str, Any]]:
+		"""Get distinct personas evaluated against a candidate; for lists use get_personas_for_candidates."""
 		return self.candidates.get_personas_for_candidate(db, candidate_id)
 
+	def get_personas_for_candidates(self, db: Session, candidate_ids: List[str]) -> Dict[str, List[Mapping[str, Any]]]:
+		"""Distinct personas for several candidates in one query, keyed by candidate id."""
+		return self.candidates.get_personas_for_candidates(db, candidate_ids)
+
 	def update_candidate(self, db: Session, candidate_id: str, update_data: Dict[str, any], user_id: Optional[str] = None) -> Optional[CandidateModel]:
 		"""Update candidate information."""
 		try:
@@ -506,9 +518,9 @@ class CandidateService:
 		"""Get a candidate CV by ID."""
 		return self.candidate_cvs.get(db, candidate_cv_id)
 
-	def get_candidate_cvs(self, db: Session, candidate_id: str) -> List[CandidateCVModel]:
-		"""Get all CVs for a specific candidate."""
-		return self.candidate_cvs.get_candidate_cvs(db, candidate_id)
+	def get_candidate_cvs(self, db: Session, candidate_id: str, skip: int = 0, limit: Optional[int] = None) -> List[CandidateCVModel]:
+		"""Get CVs for a specific candidate, newest first (all of them unless limited)."""
+		return self.candidate_cvs.get_candidate_cvs(db, candidate_id, skip, limit)
 
 	def get_candidate_score(self, db: Session, score_id: str) -> Optional[CandidateScoreModel]:
 		"""Get a specific candidate score by ID."""
@@ -624,7 +636,7 @@ class CandidateService:
 				candidate = self.candidates.get(db, candidate_id)
 				if candidate and candidate.latest_cv_id == candidate_cv_id:
 					# Find the next latest CV
-					remaining_cvs = self.candidate_cvs.get_candidate_cvs(db, candidate_id)
+					remaining_cvs = self.candidate_cvs.get_candidate_cvs(db, candidate_id, limit=1)
 					if remaining_cvs:
 						candidate.latest_cv_id = remaining_cvs[0].id  # First one is latest due to desc ordering
 					else:
@@ -712,6 +724,32 @@ class CandidateService:
 		
 		return selections
 	
+	def _build_selection_audit_log(
+		self,
+		selection_id: str,
+		action: str,
+		changed_by: str,
+		field_name: Optional[str] = None,
+		old_value: Optional[str] = None,
+		new_value: Optional[str] = None,
+		change_notes: Optional[str] = None
+	) -> CandidateSelectionAuditLogModel:
+		"""Build (but do not persist) an audit log entry for a selection change."""
+		# Convert values to strings for storage
+		old_val_str = str(old_value) if old_value is not None else None
+		new_val_str = str(new_value) if new_value is not None else None
+		
+		return CandidateSelectionAuditLogModel(
+			id=str(uuid4()),
+			selection_id=selection_id,
+			action=action,
+			changed_by=changed_by,
+			field_name=field_name,
+			old_value=old_val_str,
+			new_value=new_val_str,
+			change_notes=change_notes
+		)
+	
 	def _log_selection_change(
 		self,
 		db: Session,
@@ -739,18 +777,13 @@ class CandidateService:
 		Returns:
 			Created audit log entry
 		"""
-		# Convert values to strings for storage
-		old_val_str = str(old_value) if old_value is not None else None
-		new_val_str = str(new_value) if new_value is not None else None
-		
-		audit_log = CandidateSelectionAuditLogModel(
-			id=str(uuid4()),
-			selection_id=selection_id,
-			action=action,
-			changed_by=changed_by,
+		audit_log = self._build_selection_audit_log(
+			selection_id,
+			action,
+			changed_by,
 			field_name=field_name,
-			old_value=old_val_str,
-			new_value=new_val_str,
+			old_value=old_value,
+			new_value=new_value,
 			change_notes=change_notes
 		)
 		
@@ -793,90 +826,96 @@ class CandidateService:
 			raise ValueError(f"Invalid status code: '{status_code}'. Status must exist in the database.")
 		
 		selections = []
+		# Audit entries are buffered and written in one batch at the end; the
+		# selections and their history are committed together in one transaction
+		audit_logs: List[CandidateSelectionAuditLogModel] = []
 		
-		for candidate_id in candidate_ids:
-			# Check if selection already exists
-			existing = self.selections.get_by_candidate_persona(db, candidate_id, persona_id)
+		try:
+			for candidate_id in candidate_ids:
+				# Check if selection already exists
+				existing = self.selections.get_by_candidate_persona(db, candidate_id, persona_id)
 			
-			if existing:
-				# Track changes for update
-				changes = []
+				if existing:
+					# Track changes for update
+					changes = []
 				
-				# Update existing selection
-				if selection_notes is not None and selection_notes != existing.selection_notes:
-					changes.append(('selection_notes', existing.selection_notes, selection_notes))
-					existing.selection_notes = selection_notes
+					# Update existing selection
+					if selection_notes is not None and selection_notes != existing.selection_notes:
+						changes.append(('selection_notes', existing.selection_notes, selection_notes))
+						existing.selection_notes = selection_notes
 				
-				if priority is not None and priority != existing.priority:
-					changes.append(('priority', existing.priority, priority))
-					existing.priority = priority
+					if priority is not None and priority != existing.priority:
+						changes.append(('priority', existing.priority, priority))
+						existing.priority = priority
 				
-				old_status = existing.status
-				if existing.status != status_code:
-					changes.append(('status', old_status, status_code))
-					existing.status = status_code
+					old_status = existing.status
+					if existing.status != status_code:
+						changes.append(('status', old_status, status_code))
+						existing.status = status_code
 				
-				updated_selection = self.selections.update(db, existing)
+					updated_selection = self.selections.update(db, existing, commit=False)
 				
-				# Log all changes
-				if changes:
-					for field_name, old_val, new_val in changes:
-						action = f"{field_name}_updated" if field_name != 'status' else 'status_changed'
-						self._log_selection_change(
-							db,
+					# Log all changes
+					if changes:
+						for field_name, old_val, new_val in changes:
+							action = f"{field_name}_updated" if field_name != 'status' else 'status_changed'
+							audit_logs.append(self._build_selection_audit_log(
+								updated_selection.id,
+								action,
+								selected_by,
+								field_name=field_name,
+								old_value=old_val,
+								new_value=new_val
+							))
+					else:
+						# Log general update if no specific fields changed
+						audit_logs.append(self._build_selection_audit_log(
 							updated_selection.id,
-							action,
-							selected_by,
-							field_name=field_name,
-							old_value=old_val,
-							new_value=new_val
-						)
+							'updated',
+							selected_by
+						))
+				
+					selections.append(updated_selection)
 				else:
-					# Log general update if no specific fields changed
-					self._log_selection_change(
-						db,
-						updated_selection.id,
-						'updated',
-						selected_by
+					# Create new selection
+					selection = CandidateSelectionModel(
+						id=str(uuid4()),
+						candidate_id=candidate_id,
+						persona_id=persona_id,
+						job_description_id=job_description_id,
+						selected_by=selected_by,
+						selection_notes=selection_notes,
+						priority=priority,
+						status=status_code
 					)
+					created_selection = self.selections.create(db, selection, commit=False)
 				
-				selections.append(updated_selection)
-			else:
-				# Create new selection
-				selection = CandidateSelectionModel(
-					id=str(uuid4()),
-					candidate_id=candidate_id,
-					persona_id=persona_id,
-					job_description_id=job_description_id,
-					selected_by=selected_by,
-					selection_notes=selection_notes,
-					priority=priority,
-					status=status_code
-				)
-				created_selection = self.selections.create(db, selection)
-				
-				# Log creation
-				self._log_selection_change(
-					db,
-					created_selection.id,
-					'created',
-					selected_by,
-					change_notes=f"Candidate selected for persona {persona_id}"
-				)
+					# Log creation
+					audit_logs.append(self._build_selection_audit_log(
+						created_selection.id,
+						'created',
+						selected_by,
+						change_notes=f"Candidate selected for persona {persona_id}"
+					))
 				
-				# Log status change (from null to status_code)
-				self._log_selection_change(
-					db,
-					created_selection.id,
-					'status_changed',
-					selected_by,
-					field_name='status',
-					old_value=None,
-					new_value=status_code,
-					change_notes=f"Status set to '{status_code}' on creation"
-				)
+					# Log status change (from null to status_code)
+					audit_logs.append(self._build_selection_audit_log(
+						created_selection.id,
+						'status_changed',
+						selected_by,
+						field_name='status',
+						old_value=None,
+						new_value=status_code,
+						change_notes=f"Status set to '{status_code}' on creation"
+					))
 				
-				selections.append(created_selection)
+					selections.append(created_selection)
+			
+			self.selection_audit_logs.bulk_create(db, audit_logs, commit=False)
+			commit_keep_loaded(db, *selections)
+		except Exception:
+			db.rollback()
+			raise
 		
 		return selections
 	
@@ -928,22 +967,28 @@ class CandidateService:
 			# No changes made, return as-is
 			return selection
 		
-		# Update the selection
-		updated_selection = self.selections.update(db, selection)
-		
-		# Log all changes
-		for field_name, old_val, new_val in changes:
-			action = f"{field_name}_updated" if field_name != 'status' else 'status_changed'
-			self._log_selection_change(
-				db,
-				updated_selection.id,
-				action,
-				updated_by,
-				field_name=field_name,
-				old_value=old_val,
-				new_value=new_val,
-				change_notes=change_notes
-			)
+		try:
+			# Update the selection
+			updated_selection = self.selections.update(db, selection, commit=False)
+			
+			# Log all changes in one batched insert, committed with the update
+			audit_logs = []
+			for field_name, old_val, new_val in changes:
+				action = f"{field_name}_updated" if field_name != 'status' else 'status_changed'
+				audit_logs.append(self._build_selection_audit_log(
+					updated_selection.id,
+					action,
+					updated_by,
+					field_name=field_name,
+					old_value=old_val,
+					new_value=new_val,
+					change_notes=change_notes
+				))
+			self.selection_audit_logs.bulk_create(db, audit_logs, commit=False)
+			commit_keep_loaded(db, updated_selection)
+		except Exception:
+			db.rollback()
+			raise
 		
 		return updated_selection
 	
@@ -952,7 +997,8 @@ class CandidateService:
 		db: Session,
 		selection_id: str,
 		skip: int = 0,
-		limit: int = 100
+		limit: int = 100,
+		page_token: Optional[str] = None
 	) -> Tuple[List[CandidateSelectionAuditLogModel], int]:
 		"""
 		Get audit logs for a candidate selection.
@@ -962,11 +1008,14 @@ class CandidateService:
 			selection_id: ID of the selection
 			skip: Number of records to skip
 			limit: Maximum number of records to return
+			page_token: Keyset token from next_page_token(); replaces skip
 			
 		Returns:
 			Tuple of (list of audit logs, total count)
 		"""
-		logs = self.selection_audit_logs.get_by_selection_id(db, selection_id, skip, limit)
+		logs = self.selection_audit_logs.get_by_selection_id(
+			db, selection_id, skip, limit, after=decode_page_token(page_token)
+		)
 		total = self.selection_audit_logs.count_by_selection_id(db, selection_id)
 		return list(logs), total
 	
@@ -1004,11 +1053,15 @@ class CandidateService:
 		job_description_id: Optional[str] = None,
 		status: Optional[str] = None,
 		skip: int = 0,
-		limit: int = 100
+		limit: int = 100,
+		page_token: Optional[str] = None
 	) -> Tuple[List[CandidateSelectionModel], int]:
 		"""
 		List selected candidates with optional filtering.
 		
+		Pass `page_token` (from next_page_token() on the previous page) for
+		keyset pagination instead of `skip`.
+		
 		Returns:
 			Tuple of (list of selections, total count)
 		"""
@@ -1018,5 +1071,35 @@ class CandidateService:
 			job_description_id=job_description_id,
 			status=status,
 			skip=skip,
-			limit=limit
-		)
\ No newline at end of file
+			limit=limit,
+			after=decode_page_token(page_token)
+		)
+
+	def list_selected_candidate_projection(
+		self,
+		db: Session,
+		persona_id: Optional[str] = None,
+		job_description_id: Optional[str] = None,
+		status: Optional[str] = None,
+		skip: int = 0,
+		limit: int = 100,
+		page_token: Optional[str] = None
+	) -> Tuple[List[RowMapping], int]:
+		"""
+		List selected candidates as lightweight rows for the list view.
+		
+		Takes the same filters as `list_selected_candidates`.
+		
+		Returns:
+			Tuple of (list of row mappings, total count)
+		"""
+		rows, total = self.selections.list_selection_projection(
+			db,
+			persona_id=persona_id,
+			job_description_id=job_description_id,
+			status=status,
+			skip=skip,
+			limit=limit,
+			after=decode_page_token(page_token)
+		)
+		return list(rows), total
@@ -1,5 +1,5 @@
 # app/services/jd_service_updated.py
-from typing import Sequence, Optional, Set
+from typing import List, Sequence, Optional, Set, Tuple
 from uuid import uuid4
 from sqlalchemy.orm import Session
 
@@ -17,6 +17,8 @@ from app.services.jd_refinement.refinement_service import JDRefinementService
 from app.repositories.company_repo import CompanyRepository
 from app.utils.jd_diff import JDDiffGenerator
 from app.utils.jd_inline_diff import JDInlineDiffGenerator
+from app.utils.pagination import decode_page_token
+from app.core.count_cache import count_cache
 from types import SimpleNamespace
 
 class JDService:
@@ -38,21 +40,51 @@ class JDService:
     def list_by_creator(self, db: Session, user_id: str) -> Sequence[JobDescriptionModel]:
         return self.repo.list_by_creator(db, user_id)
     
-    def list_by_role_id(self, db: Session, role_id: str, skip: int = 0, limit: int = 100, optimized: bool = True) -> Sequence[JobDescriptionModel]:
-        """List job descriptions filtered by role_id."""
-        return self.repo.list_by_role_id(db, role_id, skip, limit, optimized)
+    def list_by_role_id(
+        self,
+        db: Session,
+        role_id: str,
+        skip: int = 0,
+        limit: int = 100,
+        page_token: Optional[str] = None
+    ) -> Sequence[JobDescriptionModel]:
+        """List job descriptions filtered by role_id (keyset when `page_token` is given)."""
+        return self.repo.list_by_role_id(db, role_id, skip, limit, after=decode_page_token(page_token))
     
-    def list_all(self, db: Session, skip: int = 0, limit: int = 100, user: Optional[UserModel] = None) -> Sequence[JobDescriptionModel]:
-        """List all JDs, optionally filtered by user access."""
+    def list_all(
+        self,
+        db: Session,
+        skip: int = 0,
+        limit: int = 100,
+        user: Optional[UserModel] = None,
+        page_token: Optional[str] = None
+    ) -> Sequence[JobDescriptionModel]:
+        """List all JDs (large text fields deferred), optionally filtered by user access.
+
+        Pass `page_token` (from next_page_token()) to seek instead of skipping rows.
+        """
+        after = decode_page_token(page_token)
         if user is not None:
-            return self.repo.list_accessible(db, user, skip, limit)
-        return self.repo.list_all(db, skip, limit)
-    
-    def list_all_optimized(self, db: Session, skip: int = 0, limit: int = 100, user: Optional[UserModel] = None) -> Sequence[JobDescriptionModel]:
-        """Optimized list that excludes large text fields for better performance."""
+            return self.repo.list_accessible(db, user, skip, limit, after=after)
+        return self.repo.list_all(db, skip, limit, after=after)
+
+    def list_with_total(
+        self,
+        db: Session,
+        skip: int = 0,
+        limit: int = 100,
+        user: Optional[UserModel] = None,
+        page_token: Optional[str] = None
+    ) -> Tuple[List[JobDescriptionModel], int]:
+        """A page of JDs plus the total, optionally filtered by user access.
+
+        The access-filtered case comes back from one query; the unfiltered
+        total is served from the cached count.
+        """
+        after = decode_page_token(page_token)
         if user is not None:
-            return self.repo.list_accessible(db, user, skip, limit)
-        return self.repo.list_all_optimized(db, skip, limit)
+            return self.repo.list_and_count_accessible(db, user, skip, limit, after=after)
+        return list(self.repo.list_all(db, skip, limit, after=after)), self.repo.count(db)
 
     def count(self, db: Session, user: Optional[UserModel] = None) -> int:
         """Count all job descriptions, optionally filtered by user access."""
@@ -74,6 +106,8 @@ class JDService:
             )
             db.add(mapping)
         db.commit()
+        # Assignments change what hiring managers can see
+        count_cache.invalidate(JobDescriptionModel.__tablename__)
 
     def create(self, db: Session, data: dict) -> JobDescriptionModel:
         """Create a new job description with role_id."""
@@ -140,7 +174,8 @@ class JDService:
         return created
 
     def get_by_id(self, db: Session, jd_id: str) -> Optional[JobDescriptionModel]:
-        return self.repo.get(db, jd_id)
+        """JD by id with its job role (callers render role_name)."""
+        return self.repo.get_with_role(db, jd_id)
 
     def prepare_refinement_brief(self, db: Session, jd_id: str, required_sections: list[str], template_text: Optional[str] = None) -> dict:
         """Prepare AI refinement brief for job description."""
@@ -468,6 +503,9 @@ class JDService:
             # Commit all deletions together in a single transaction
             # If any error occurs before this point, rollback will undo everything
             db.commit()
+            count_cache.invalidate(JobDescriptionModel.__tablename__)
+            if persona_ids:
+                count_cache.invalidate(PersonaModel.__tablename__)
             
             # Return deletion statistics
             return {
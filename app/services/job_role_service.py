@@ -1,5 +1,5 @@
 # app/services/job_role_service.py
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from sqlalchemy.orm import Session
 from app.repositories.job_role_repo import JobRoleRepository
 from app.domain.job_role.entities import JobRole
@@ -91,6 +91,10 @@ class JobRoleService:
         """Search job roles based on criteria."""
         return self.repo.search(db, search_criteria, skip, limit)
     
+    def search_with_total(self, db: Session, search_criteria: Dict[str, Any], skip: int = 0, limit: int = 100) -> Tuple[List[JobRoleModel], int]:
+        """Search job roles and return (page, total matching count) from one query."""
+        return self.repo.search_with_total(db, search_criteria, skip, limit)
+    
     def count(self, db: Session) -> int:
         """Count total number of job roles."""
         return self.repo.count(db)
@@ -169,7 +173,8 @@ class JobRoleService:
             if not JobRoleBusinessRules.can_delete_job_role(job_role_domain, has_job_descriptions):
                 raise ValueError("Cannot delete job role with associated job descriptions")
             
-            # Delete job role
+            # Delete job role (read the name first; the row is gone afterwards)
+            job_role_name = job_role.name
             success = self.repo.delete(db, job_role_id)
             
             if success:
@@ -177,7 +182,7 @@ class JobRoleService:
                 try:
                     event_bus.publish_event(JobRoleDeletedEvent(
                         job_role_id=job_role_id,
-                        job_role_name=job_role.name
+                        job_role_name=job_role_name
                     ))
                 except Exception as e:
                     print(f"Failed to publish JobRoleDeletedEvent: {e}")
@@ -199,7 +204,7 @@ class JobRoleService:
             name=model.name,
             description=model.description,
             category=model.category,
-            is_active=model.is_active == "true",
+            is_active=model.is_active,
             created_at=model.created_at,
             created_by=model.created_by,
             updated_at=model.updated_at,
@@ -213,7 +218,7 @@ class JobRoleService:
             "name": domain.name,
             "description": domain.description,
             "category": domain.category,
-            "is_active": "true" if domain.is_active else "false",
+            "is_active": domain.is_active,
             "created_at": domain.created_at,
             "created_by": domain.created_by,
             "updated_at": domain.updated_at,
@@ -225,6 +230,6 @@ class JobRoleService:
         model.name = domain.name
         model.description = domain.description
         model.category = domain.category
-        model.is_active = "true" if domain.is_active else "false"
+        model.is_active = domain.is_active
         model.updated_at = domain.updated_at
         model.updated_by = domain.updated_by
@@ -12,6 +12,9 @@ from app.db.models.persona import (
 )
 from app.repositories.persona_repo import SQLAlchemyPersonaRepository
 from app.repositories.persona_level_repo import SQLAlchemyPersonaLevelRepository
+from app.db.commit import commit_keep_loaded
+from app.core.count_cache import count_cache
+from app.utils.pagination import decode_page_token
 from app.repositories.job_description_repo import SQLAlchemyJobDescriptionRepository
 from app.domain.persona import services as persona_domain_services
 from app.domain.persona.entities import WeightInterval
@@ -51,11 +54,23 @@ class PersonaService:
 	def list_by_jd(self, db: Session, job_description_id: str) -> List[PersonaModel]:
 		return self.repo.list_by_jd(db, job_description_id)
 	
-	def list_all(self, db: Session, skip: int = 0, limit: int = 100, user: Optional[UserModel] = None) -> List[PersonaModel]:
-		"""List all personas, optionally filtered by user access."""
+	def list_all(
+		self,
+		db: Session,
+		skip: int = 0,
+		limit: int = 100,
+		user: Optional[UserModel] = None,
+		page_token: Optional[str] = None
+	) -> List[PersonaModel]:
+		"""
+		List all personas, optionally filtered by user access.
+		
+		Pass `page_token` (from next_page_token()) to seek instead of skipping rows.
+		"""
+		after = decode_page_token(page_token)
 		if user is not None:
-			return list(self.repo.list_accessible(db, user, skip, limit))
-		return self.repo.list_all(db, skip, limit)
+			return list(self.repo.list_accessible(db, user, skip, limit, after=after))
+		return self.repo.list_all(db, skip, limit, after=after)
 	
 	def count(self, db: Session, user: Optional[UserModel] = None) -> int:
 		"""Count all personas, optionally filtered by user access."""
@@ -64,7 +79,7 @@ class PersonaService:
 		return self.repo.count(db)
 	
 	def count_candidates_for_persona(self, db: Session, persona_id: str) -> int:
-		"""Count distinct candidates evaluated against a persona."""
+		"""Count distinct candidates evaluated against a persona; for lists use count_candidates_for_personas."""
 		return self.repo.count_candidates_for_persona(db, persona_id)
 	
 	def count_candidates_for_personas(self, db: Session, persona_ids: list[str]) -> dict[str, int]:
@@ -82,8 +97,7 @@ class PersonaService:
 	def create(self, db: Session, data: dict) -> PersonaModel:
 		"""Create a persona after validating via the domain factory (legacy flat)."""
 		# Prevent duplicate persona names for the same job description
-		existing_persona = self.repo.get_by_name_and_job_description(db, data["name"], data["job_description_id"])
-		if existing_persona:
+		if self.repo.exists_by_name_and_jd(db, data["name"], data["job_description_id"]):
 			raise ValueError(f"Persona with name '{data['name']}' already exists for job description '{data['job_description_id']}'")
 
 		intervals: Dict[str, WeightInterval] = {
@@ -133,112 +147,121 @@ class PersonaService:
 		persona_id = str(uuid4())
 		
 		# Get job description to extract role_name
-		job_description = self.jd_repo.get(db, data["job_description_id"])
+		job_description = self.jd_repo.get_with_role(db, data["job_description_id"])
 		if not job_description:
 			raise ValueError(f"Job description with ID '{data['job_description_id']}' not found")
 
 		# Prevent duplicate persona names for the same job description
-		existing_persona = self.repo.get_by_name_and_job_description(db, data["name"], data["job_description_id"])
-		if existing_persona:
+		if self.repo.exists_by_name_and_jd(db, data["name"], data["job_description_id"]):
 			raise ValueError(f"Persona with name '{data['name']}' already exists for job description '{data['job_description_id']}'")
 		
 		role_name = job_description.job_role.name if job_description.job_role else None
 		role_id = job_description.job_role.id if job_description.job_role else None
 		
-		# Create main persona
-		persona = PersonaModel(
-			id=persona_id,
-			job_description_id=data["job_description_id"],
-			name=data["name"],
-			role_name=role_name,
-			role_id = role_id,
-			created_by=created_by,
-			weights=None,  # deprecated
-			intervals=None,  # deprecated
-			persona_notes=data.get("persona_notes"),
-		)
-		created = self.repo.create(db, persona)
+		# The whole graph is one transaction: each row is flushed in order (the
+		# category/note and subcategory/skillset keys reference each other) and
+		# committed once at the end
+		try:
+			# Create main persona
+			persona = PersonaModel(
+				id=persona_id,
+				job_description_id=data["job_description_id"],
+				name=data["name"],
+				role_name=role_name,
+				role_id = role_id,
+				created_by=created_by,
+				weights=None,  # deprecated
+				intervals=None,  # deprecated
+				persona_notes=data.get("persona_notes"),
+			)
+			created = self.repo.create(db, persona, commit=False)
 
-		# Create categories and their nested entities
-		for cat in data.get("categories", []):
-			cat_id = str(uuid4())
+			# Create categories and their nested entities
+			for cat in data.get("categories", []):
+				cat_id = str(uuid4())
+			
+				# Create category notes if provided
+				cat_notes_id = None
+				if cat.get("notes"):
+					cat_notes_id = str(uuid4())
+					cat_note_model = PersonaNotesModel(
+						id=cat_notes_id,
+						persona_id=created.id,
+						category_id=cat_id,
+						custom_notes=cat["notes"].get("custom_notes")
+					)
+					self.repo.add_note(db, cat_note_model, commit=False)
 			
-			# Create category notes if provided
-			cat_notes_id = None
-			if cat.get("notes"):
-				cat_notes_id = str(uuid4())
-				cat_note_model = PersonaNotesModel(
-					id=cat_notes_id,
+				cat_model = PersonaCategoryModel(
+					id=cat_id,
 					persona_id=created.id,
-					category_id=cat_id,
-					custom_notes=cat["notes"].get("custom_notes")
+					name=cat["name"],
+					weight_percentage=int(cat["weight_percentage"]),
+					range_min=cat.get("range_min"),
+					range_max=cat.get("range_max"),
+					position=cat.get("position"),
+					notes_id=cat_notes_id
 				)
-				self.repo.add_note(db, cat_note_model)
-			
-			cat_model = PersonaCategoryModel(
-				id=cat_id,
-				persona_id=created.id,
-				name=cat["name"],
-				weight_percentage=int(cat["weight_percentage"]),
-				range_min=cat.get("range_min"),
-				range_max=cat.get("range_max"),
-				position=cat.get("position"),
-				notes_id=cat_notes_id
-			)
-			created_category = self.repo.add_category(db, cat_model)
+				created_category = self.repo.add_category(db, cat_model, commit=False)
 
-			# Create subcategories
-			for sub in cat.get("subcategories", []):
-				sub_id = str(uuid4())
+				# Create subcategories
+				for sub in cat.get("subcategories", []):
+					sub_id = str(uuid4())
 				
-				# Handle level_id - if it's a string like "lvl-003", try to find the level
-				level_id = sub.get("level_id")
+					# Handle level_id - if it's a string like "lvl-003", try to find the level
+					level_id = sub.get("level_id")
 
-				level = self.level_repo.get_by_position(db, level_id)
-				if level:
-					level_id = level.id
+					level = self.level_repo.get_by_position(db, level_id)
+					if level:
+						level_id = level.id
 				
-				# Create subcategory skillset if provided
-				sub_skillset_id = None
-				skillset_data = sub.get("skillset")
-				if skillset_data:
-					sub_skillset_id = str(uuid4())
-					sub_skillset_model = PersonaSkillsetModel(
-						id=sub_skillset_id,
-						persona_id=created.id,
-						persona_category_id=cat_id,
-						persona_subcategory_id=sub_id,
-						technologies=skillset_data.get("technologies", [])
-					)
-					self.repo.add_skillset(db, sub_skillset_model)
+					# Create subcategory skillset if provided
+					sub_skillset_id = None
+					skillset_data = sub.get("skillset")
+					if skillset_data:
+						sub_skillset_id = str(uuid4())
+						sub_skillset_model = PersonaSkillsetModel(
+							id=sub_skillset_id,
+							persona_id=created.id,
+							persona_category_id=cat_id,
+							persona_subcategory_id=sub_id,
+							technologies=skillset_data.get("technologies", [])
+						)
+						self.repo.add_skillset(db, sub_skillset_model, commit=False)
 				
-				sub_model = PersonaSubcategoryModel(
-					id=sub_id,
-					category_id=cat_id,
-					name=sub["name"],
-					weight_percentage=int(sub["weight_percentage"]),
-					range_min=sub.get("range_min"),
-					range_max=sub.get("range_max"),
-					level_id=level_id,
-					skillset_id=sub_skillset_id,
-					position=sub.get("position")
+					sub_model = PersonaSubcategoryModel(
+						id=sub_id,
+						category_id=cat_id,
+						name=sub["name"],
+						weight_percentage=int(sub["weight_percentage"]),
+						range_min=sub.get("range_min"),
+						range_max=sub.get("range_max"),
+						level_id=level_id,
+						skillset_id=sub_skillset_id,
+						position=sub.get("position")
+					)
+					self.repo.add_subcategory(db, sub_model, commit=False)
+
+			# Create change logs
+			for change_log_data in data.get("change_logs", []):
+				change_log_id = str(uuid4())
+				change_log_model = PersonaChangeLogModel(
+					id=change_log_id,
+					persona_id=created.id,
+					entity_type=change_log_data["entity_type"],
+					entity_id=change_log_data["entity_id"],
+					field_name=change_log_data["field_name"],
+					old_value=change_log_data.get("old_value"),
+					new_value=change_log_data.get("new_value"),
+					changed_by=created_by  # Use the current user instead of payload
 				)
-				self.repo.add_subcategory(db, sub_model)
+				self.repo.add_change_log(db, change_log_model, commit=False)
 
-		# Create change logs
-		for change_log_data in data.get("change_logs", []):
-			change_log_id = str(uuid4())
-			change_log_model = PersonaChangeLogModel(
-				id=change_log_id,
-				persona_id=created.id,
-				entity_type=change_log_data["entity_type"],
-				entity_id=change_log_data["entity_id"],
-				field_name=change_log_data["field_name"],
-				old_value=change_log_data.get("old_value"),
-				new_value=change_log_data.get("new_value"),
-				changed_by=created_by  # Use the current user instead of payload
-			)
-			self.repo.add_change_log(db, change_log_model)
+			commit_keep_loaded(db, created)
+			count_cache.invalidate(PersonaModel.__tablename__)
+		except Exception:
+			db.rollback()
+			raise
 
 		event_bus.publish_event(PersonaCreatedEvent(id=created.id, job_description_id=created.job_description_id, name=created.name))
 		return created
@@ -628,6 +651,7 @@ class PersonaService:
 		# 7. Finally, delete the persona itself
 		db.delete(persona)
 		db.commit()
+		count_cache.invalidate(PersonaModel.__tablename__)
 		
 		# Verify deletion by checking if persona still exists
 		remaining_persona = self.repo.get(db, persona_id)
@@ -0,0 +1,12 @@
+from app.domain.persona.entities import WeightInterval
+from app.domain.persona.rules import detect_out_of_interval
+
+
+def test_detect_out_of_interval_accepts_each_bounds_form():
+	weights = {"technical": 0.6, "cognitive": 0.3, "values": 0.1}
+	intervals = {
+		"technical": WeightInterval(0.1, 0.5),
+		"cognitive": (0.1, 0.5),
+		"values": [0.2, 0.4],
+	}
+	assert detect_out_of_interval(weights, intervals) == ["technical", "values"]
@@ -0,0 +1,34 @@
+import base64
+from datetime import datetime
+from typing import Mapping, Optional, Tuple
+
+# Keyset cursor: the (created_at, id) of the last row on the previous page
+Cursor = Tuple[datetime, str]
+
+
+def encode_page_token(created_at: datetime, row_id: str) -> str:
+	"""Encode a keyset cursor as an opaque URL-safe page token."""
+	raw = f"{created_at.isoformat()}|{row_id}".encode("utf-8")
+	return base64.urlsafe_b64encode(raw).decode("ascii")
+
+
+def decode_page_token(token: Optional[str]) -> Optional[Cursor]:
+	"""Decode a page token from `encode_page_token`; None passes through."""
+	if not token:
+		return None
+	try:
+		created_at, row_id = base64.urlsafe_b64decode(token.encode("ascii")).decode("utf-8").split("|", 1)
+		return datetime.fromisoformat(created_at), row_id
+	except (ValueError, UnicodeError) as e:
+		raise ValueError("Invalid page token") from e
+
+
+def next_page_token(rows, limit: int) -> Optional[str]:
+	"""Token for the page after `rows`, or None when this was the last page."""
+	if len(rows) < limit or not rows:
+		return None
+	last = rows[-1]
+	if isinstance(last, Mapping):
+		# Column projections come back as RowMapping
+		return encode_page_token(last["created_at"], last["id"])
+	return encode_page_token(last.created_at, last.id)
@@ -0,0 +1,46 @@
+"""add job role lower indexes
+
+Revision ID: 0d4a22f29055
+Revises: f3e45cc8de99
+Create Date: 2026-10-17 15:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0d4a22f29055'
+down_revision: Union[str, None] = 'f3e45cc8de99'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Columns JobRoleRepository searches with lower(col) LIKE '%term%'
+TRGM_COLUMNS = ('name', 'category')
+
+
+def upgrade() -> None:
+    # Case-insensitive equality lookups (get_by_name, check_name_exists, get_by_category)
+    op.create_index('ix_job_roles_lower_name', 'job_roles', [sa.text('lower(name)')], unique=False)
+    op.create_index('ix_job_roles_lower_category', 'job_roles', [sa.text('lower(category)')], unique=False)
+
+    # Substring search (search/search_with_total) needs trigram GIN indexes
+    if op.get_bind().dialect.name == 'postgresql':
+        op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+        for column in TRGM_COLUMNS:
+            op.execute(
+                f'CREATE INDEX IF NOT EXISTS ix_job_roles_{column}_trgm '
+                f'ON job_roles USING gin (lower({column}) gin_trgm_ops)'
+            )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == 'postgresql':
+        for column in TRGM_COLUMNS:
+            op.execute(f'DROP INDEX IF EXISTS ix_job_roles_{column}_trgm')
+
+    op.drop_index('ix_job_roles_lower_category', table_name='job_roles')
+    op.drop_index('ix_job_roles_lower_name', table_name='job_roles')
@@ -0,0 +1,31 @@
+"""add job descriptions role created_at index
+
+Revision ID: 3b8f5c0d2e71
+Revises: 7e2d9b1c4a68
+Create Date: 2026-10-17 18:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3b8f5c0d2e71'
+down_revision: Union[str, None] = '7e2d9b1c4a68'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # list_by_role_id filters on role_id and pages by created_at DESC, id DESC;
+    # a backward scan of this index returns the page in order, feeding LIMIT
+    # without sorting every JD of the role
+    with op.batch_alter_table('job_descriptions', schema=None) as batch_op:
+        batch_op.create_index('idx_jd_role_created_at_id', ['role_id', 'created_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('job_descriptions', schema=None) as batch_op:
+        batch_op.drop_index('idx_jd_role_created_at_id')
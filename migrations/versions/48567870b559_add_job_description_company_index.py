@@ -0,0 +1,27 @@
+"""add job description company index
+
+Revision ID: 48567870b559
+Revises: 0fb7e6dea8f8
+Create Date: 2026-10-17 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '48567870b559'
+down_revision: Union[str, None] = '0fb7e6dea8f8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Backs the EXISTS probe in CompanyRepository.has_job_descriptions
+    op.create_index('idx_jd_company_id', 'job_descriptions', ['company_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('idx_jd_company_id', table_name='job_descriptions')
@@ -0,0 +1,30 @@
+"""add candidate scores persona candidate index
+
+Revision ID: 4a7c2e9d1f06
+Revises: b6e1d4f8a903
+Create Date: 2026-10-17 20:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4a7c2e9d1f06'
+down_revision: Union[str, None] = 'b6e1d4f8a903'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Candidate counts per persona are COUNT(DISTINCT candidate_id) grouped by
+    # persona_id; with both columns in the index they never touch the table
+    with op.batch_alter_table('candidate_scores', schema=None) as batch_op:
+        batch_op.create_index('idx_persona_candidate', ['persona_id', 'candidate_id'], unique=False)
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('candidate_scores', schema=None) as batch_op:
+        batch_op.drop_index('idx_persona_candidate')
@@ -0,0 +1,48 @@
+"""add company lower() indexes
+
+Revision ID: 4ea3636398f4
+Revises: 68d22a180f6b
+Create Date: 2026-10-17 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4ea3636398f4'
+down_revision: Union[str, None] = '68d22a180f6b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Columns CompanyRepository searches with lower(col) LIKE '%term%'
+TRGM_COLUMNS = ('name', 'city', 'country')
+
+
+def upgrade() -> None:
+    # Case-insensitive equality lookups (get_by_name/email/website, check_*_exists)
+    op.create_index('ix_companies_lower_name', 'companies', [sa.text('lower(name)')], unique=False)
+    op.create_index('ix_companies_lower_email_address', 'companies', [sa.text('lower(email_address)')], unique=False)
+    op.create_index('ix_companies_lower_website_url', 'companies', [sa.text('lower(website_url)')], unique=False)
+
+    # Substring search (search/count_search) needs trigram GIN indexes
+    if op.get_bind().dialect.name == 'postgresql':
+        op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+        for column in TRGM_COLUMNS:
+            op.execute(
+                f'CREATE INDEX IF NOT EXISTS ix_companies_{column}_trgm '
+                f'ON companies USING gin (lower({column}) gin_trgm_ops)'
+            )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == 'postgresql':
+        for column in TRGM_COLUMNS:
+            op.execute(f'DROP INDEX IF EXISTS ix_companies_{column}_trgm')
+
+    op.drop_index('ix_companies_lower_website_url', table_name='companies')
+    op.drop_index('ix_companies_lower_email_address', table_name='companies')
+    op.drop_index('ix_companies_lower_name', table_name='companies')
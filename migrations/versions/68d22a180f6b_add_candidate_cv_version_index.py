@@ -0,0 +1,73 @@
+"""add candidate cv version index
+
+Revision ID: 68d22a180f6b
+Revises: b62a6078c98b
+Create Date: 2026-10-17 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '68d22a180f6b'
+down_revision: Union[str, None] = 'b62a6078c98b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _renumber_duplicate_versions() -> None:
+    """Renumber CVs of candidates whose versions collide to 1..n.
+
+    Keeps each candidate's existing order (version, then upload time, then
+    id) so the newest CV stays newest; candidates without duplicates are
+    left untouched.
+    """
+    bind = op.get_bind()
+    cvs = sa.table(
+        'candidate_cvs',
+        sa.column('id', sa.String),
+        sa.column('candidate_id', sa.String),
+        sa.column('version', sa.Integer),
+        sa.column('uploaded_at', sa.DateTime),
+    )
+    duplicated = [
+        row[0]
+        for row in bind.execute(
+            sa.select(cvs.c.candidate_id)
+            .group_by(cvs.c.candidate_id, cvs.c.version)
+            .having(sa.func.count() > 1)
+            .distinct()
+        )
+    ]
+    for candidate_id in duplicated:
+        ids = bind.execute(
+            sa.select(cvs.c.id)
+            .where(cvs.c.candidate_id == candidate_id)
+            .order_by(cvs.c.version, cvs.c.uploaded_at, cvs.c.id)
+        ).scalars().all()
+        for version, cv_id in enumerate(ids, start=1):
+            bind.execute(sa.update(cvs).where(cvs.c.id == cv_id).values(version=version))
+
+
+def upgrade() -> None:
+    # Existing duplicates would make the unique constraint fail to build
+    _renumber_duplicate_versions()
+
+    # Enforce one row per (candidate, version) and serve newest-first CV
+    # listings from an index range scan instead of a sort
+    with op.batch_alter_table('candidate_cvs', schema=None) as batch_op:
+        batch_op.create_unique_constraint('uq_candidate_cv_version', ['candidate_id', 'version'])
+        batch_op.create_index(
+            'idx_candidate_cvs_candidate_version',
+            ['candidate_id', sa.text('version DESC')],
+            unique=False
+        )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('candidate_cvs', schema=None) as batch_op:
+        batch_op.drop_index('idx_candidate_cvs_candidate_version')
+        batch_op.drop_constraint('uq_candidate_cv_version', type_='unique')
@@ -0,0 +1,33 @@
+"""add job descriptions created_at id index
+
+Revision ID: 7e2d9b1c4a68
+Revises: 9c41e7a2b5d3
+Create Date: 2026-10-17 17:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7e2d9b1c4a68'
+down_revision: Union[str, None] = '9c41e7a2b5d3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # JD list queries page with (created_at, id) < (:created_at, :id) ORDER BY
+    # created_at DESC, id DESC; the composite index serves both the seek and the
+    # sort (scanned backwards), and its leading column covers idx_jd_created_at
+    with op.batch_alter_table('job_descriptions', schema=None) as batch_op:
+        batch_op.create_index('idx_jd_created_at_id', ['created_at', 'id'], unique=False)
+        batch_op.drop_index('idx_jd_created_at')
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('job_descriptions', schema=None) as batch_op:
+        batch_op.create_index('idx_jd_created_at', ['created_at'], unique=False)
+        batch_op.drop_index('idx_jd_created_at_id')
@@ -0,0 +1,34 @@
+"""add personas jd lower name index
+
+Revision ID: 8f3b6a0c5d12
+Revises: 4a7c2e9d1f06
+Create Date: 2026-10-17 21:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8f3b6a0c5d12'
+down_revision: Union[str, None] = '4a7c2e9d1f06'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # The duplicate-name check compares lower(name) within a JD; an expression
+    # index lets it seek instead of lowering every persona of the JD.
+    # Created outside batch mode so SQLite keeps the expression as written
+    op.create_index(
+        'ix_personas_jd_lower_name',
+        'personas',
+        ['job_description_id', sa.text('lower(name)')],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_personas_jd_lower_name', table_name='personas')
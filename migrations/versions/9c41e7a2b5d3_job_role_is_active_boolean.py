@@ -0,0 +1,64 @@
+"""job role is_active boolean
+
+Revision ID: 9c41e7a2b5d3
+Revises: 0d4a22f29055
+Create Date: 2026-10-17 16:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import text
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9c41e7a2b5d3'
+down_revision: Union[str, None] = '0d4a22f29055'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+
+    # Normalize the 'true'/'false' strings to values both dialects cast cleanly
+    conn.execute(text(
+        "UPDATE job_roles "
+        "SET is_active = CASE WHEN lower(is_active) IN ('true', '1') THEN '1' ELSE '0' END"
+    ))
+
+    with op.batch_alter_table('job_roles', schema=None) as batch_op:
+        batch_op.alter_column(
+            'is_active',
+            existing_type=sa.String(),
+            type_=sa.Boolean(),
+            existing_nullable=False,
+            postgresql_using='is_active::boolean'
+        )
+        # Partial index serving get_active/count_active
+        batch_op.create_index(
+            'ix_job_roles_active',
+            ['id'],
+            unique=False,
+            postgresql_where=text('is_active = true'),
+            sqlite_where=text('is_active = 1')
+        )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('job_roles', schema=None) as batch_op:
+        batch_op.drop_index('ix_job_roles_active')
+        batch_op.alter_column(
+            'is_active',
+            existing_type=sa.Boolean(),
+            type_=sa.String(),
+            existing_nullable=False,
+            postgresql_using="CASE WHEN is_active THEN 'true' ELSE 'false' END"
+        )
+
+    conn = op.get_bind()
+    conn.execute(text(
+        "UPDATE job_roles "
+        "SET is_active = CASE WHEN is_active IN ('1', 'true') THEN 'true' ELSE 'false' END"
+    ))
@@ -0,0 +1,38 @@
+"""add persona list order indexes
+
+Revision ID: a9d3f7c1e245
+Revises: e5a1c8b4d920
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a9d3f7c1e245'
+down_revision: Union[str, None] = 'e5a1c8b4d920'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # list_by_jd filters on job_description_id and orders by name; the index
+    # returns the JD's personas already sorted
+    with op.batch_alter_table('personas', schema=None) as batch_op:
+        batch_op.create_index('ix_personas_jd_name', ['job_description_id', 'name'], unique=False)
+
+    # get_change_logs filters on persona_id and orders by changed_at DESC;
+    # a backward scan of this index yields the entries in order
+    with op.batch_alter_table('persona_change_logs', schema=None) as batch_op:
+        batch_op.create_index('idx_persona_change_logs_persona_changed_at', ['persona_id', 'changed_at'], unique=False)
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('persona_change_logs', schema=None) as batch_op:
+        batch_op.drop_index('idx_persona_change_logs_persona_changed_at')
+
+    with op.batch_alter_table('personas', schema=None) as batch_op:
+        batch_op.drop_index('ix_personas_jd_name')
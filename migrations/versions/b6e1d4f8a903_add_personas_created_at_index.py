@@ -0,0 +1,29 @@
+"""add personas created_at index
+
+Revision ID: b6e1d4f8a903
+Revises: 3b8f5c0d2e71
+Create Date: 2026-10-17 19:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b6e1d4f8a903'
+down_revision: Union[str, None] = '3b8f5c0d2e71'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # The persona list endpoints page by created_at DESC
+    with op.batch_alter_table('personas', schema=None) as batch_op:
+        batch_op.create_index('idx_personas_created_at', ['created_at'], unique=False)
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('personas', schema=None) as batch_op:
+        batch_op.drop_index('idx_personas_created_at')
@@ -0,0 +1,32 @@
+"""personas created_at id index
+
+Revision ID: c2d9e5a7b314
+Revises: 8f3b6a0c5d12
+Create Date: 2026-10-17 22:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c2d9e5a7b314'
+down_revision: Union[str, None] = '8f3b6a0c5d12'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Persona list pages now seek on (created_at, id) < cursor ordered by
+    # created_at DESC, id DESC; the id tiebreaker joins the created_at index
+    with op.batch_alter_table('personas', schema=None) as batch_op:
+        batch_op.drop_index('idx_personas_created_at')
+        batch_op.create_index('idx_personas_created_at_id', ['created_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('personas', schema=None) as batch_op:
+        batch_op.drop_index('idx_personas_created_at_id')
+        batch_op.create_index('idx_personas_created_at', ['created_at'], unique=False)
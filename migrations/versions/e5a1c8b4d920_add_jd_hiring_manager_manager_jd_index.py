@@ -0,0 +1,30 @@
+"""add jd hiring manager manager jd index
+
+Revision ID: e5a1c8b4d920
+Revises: c2d9e5a7b314
+Create Date: 2026-10-17 23:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5a1c8b4d920'
+down_revision: Union[str, None] = 'c2d9e5a7b314'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # The persona access filter selects job_description_id by hiring_manager_id;
+    # with both columns in the index that half never reads the table
+    with op.batch_alter_table('jd_hiring_manager_mappings', schema=None) as batch_op:
+        batch_op.create_index('idx_jd_hm_manager_jd', ['hiring_manager_id', 'job_description_id'], unique=False)
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('jd_hiring_manager_mappings', schema=None) as batch_op:
+        batch_op.drop_index('idx_jd_hm_manager_jd')
@@ -0,0 +1,29 @@
+"""add llm usage summary indexes
+
+Revision ID: f3e45cc8de99
+Revises: 48567870b559
+Create Date: 2026-10-17 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3e45cc8de99'
+down_revision: Union[str, None] = '48567870b559'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Date-range filters in the per-user and total usage summaries
+    op.create_index('idx_llm_usage_user_created', 'llm_usage', ['user_id', 'created_at'], unique=False)
+    op.create_index('idx_llm_usage_action_created', 'llm_usage', ['action_type', 'created_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('idx_llm_usage_action_created', table_name='llm_usage')
+    op.drop_index('idx_llm_usage_user_created', table_name='llm_usage')